@@ -0,0 +1,46 @@
+"""Measures the cost of dispatching a call into the Libindy C-library.
+
+Compares the former per-call symbol lookup with untyped arguments against a
+function that was bound once with `Libindy.bind_command()`. The command is
+called with NULL arguments, which makes Libindy reject it synchronously, so
+only the dispatch itself is measured and no callback is ever run.
+
+Usage (from the repository root):
+    python -m benchmarks.dispatch [iterations]
+"""
+import sys
+import timeit
+from ctypes import CFUNCTYPE, c_char_p, c_int32
+
+from sbca_wrapper import LIBINDY
+
+COMMAND_NAME = 'indy_abbreviate_verkey'
+CALLBACK_TYPE = CFUNCTYPE(None, c_int32, c_int32, c_char_p)
+CALLBACK = CALLBACK_TYPE(lambda handle, code, value: None)
+
+
+def lookup_dispatch():
+    library = LIBINDY._LIBRARY
+    if not hasattr(library, COMMAND_NAME):
+        raise NotImplementedError(COMMAND_NAME)
+    getattr(library, COMMAND_NAME)(c_int32(1), c_char_p(None),
+                                   c_char_p(None), CALLBACK)
+
+
+BOUND_FUNCTION = LIBINDY.bind_command(COMMAND_NAME, (c_char_p, c_char_p),
+                                      CALLBACK_TYPE)
+
+
+def bound_dispatch():
+    BOUND_FUNCTION(1, None, None, CALLBACK)
+
+
+def main(iterations: int):
+    for name, function in (('lookup', lookup_dispatch),
+                           ('bound', bound_dispatch)):
+        best = min(timeit.repeat(function, number=iterations, repeat=5))
+        print(f'{name:>8}: {best / iterations * 1e9:8.1f} ns/call')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,129 @@
+"""Compares the JSON codecs on representative anoncreds payloads.
+
+The payloads mimic the shape and size of CL credential definitions, proof
+requests and proofs: nested dicts of long decimal number strings. Every codec
+is measured on the full round trip the wrapper does per command, encoding an
+argument to UTF-8 JSON and decoding a UTF-8 JSON response.
+
+Usage (from the repository root):
+    python -m benchmarks.json_codec [iterations]
+"""
+import random
+import sys
+import timeit
+
+from sbca_wrapper import JsonCodec, OrjsonCodec, StdlibJsonCodec
+
+_RANDOM = random.Random(42)
+
+
+def _number(digits: int) -> str:
+    return ''.join(_RANDOM.choice('0123456789') for _ in range(digits))
+
+
+def credential_definition(attribute_count: int) -> dict:
+    return {
+        'ver': '1.0',
+        'id': 'NcYxiDXkpYi6ov5FcYDi1e:3:CL:1:tag',
+        'schemaId': '1',
+        'type': 'CL',
+        'tag': 'tag',
+        'value': {
+            'primary': {
+                'n': _number(617),
+                's': _number(617),
+                'r': {f'attr_{index}': _number(617)
+                      for index in range(attribute_count)},
+                'rctxt': _number(617),
+                'z': _number(617)
+            }
+        }
+    }
+
+
+def proof_request(referent_count: int) -> dict:
+    return {
+        'nonce': _number(24),
+        'name': 'proof_req',
+        'version': '0.1',
+        'requested_attributes': {
+            f'attr{index}_referent': {'name': f'attr_{index}'}
+            for index in range(referent_count)
+        },
+        'requested_predicates': {}
+    }
+
+
+def proof(attribute_count: int) -> dict:
+    return {
+        'proof': {
+            'proofs': [{
+                'primary_proof': {
+                    'eq_proof': {
+                        'revealed_attrs': {},
+                        'a_prime': _number(617),
+                        'e': _number(150),
+                        'v': _number(1000),
+                        'm': {f'attr_{index}': _number(200)
+                              for index in range(attribute_count)},
+                        'm2': _number(200)
+                    },
+                    'ge_proofs': []
+                }
+            }],
+            'aggregated_proof': {
+                'c_hash': _number(77),
+                'c_list': [[_RANDOM.randrange(256) for _ in range(256)]
+                           for _ in range(4)]
+            }
+        },
+        'requested_proof': {
+            'revealed_attrs': {
+                f'attr{index}_referent': {
+                    'sub_proof_index': 0,
+                    'raw': f'value {index}',
+                    'encoded': _number(40)
+                } for index in range(attribute_count)
+            }
+        },
+        'identifiers': [{
+            'schema_id': 'NcYxiDXkpYi6ov5FcYDi1e:2:gvt:1.0',
+            'cred_def_id': 'NcYxiDXkpYi6ov5FcYDi1e:3:CL:1:tag',
+            'rev_reg_id': None,
+            'timestamp': None
+        }]
+    }
+
+
+PAYLOADS = {
+    'cred_def (50 attrs)': credential_definition(50),
+    'proof_req (20 refs)': proof_request(20),
+    'proof (50 attrs)': proof(50)
+}
+
+
+def round_trip(codec: JsonCodec, payload: dict, encoded: bytes):
+    codec.encode(payload)
+    codec.decode(encoded)
+
+
+def main(iterations: int):
+    codecs = [StdlibJsonCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print('orjson is not installed; only measuring the stdlib codec.')
+
+    for name, payload in PAYLOADS.items():
+        encoded = StdlibJsonCodec().encode(payload)
+        print(f'{name} - {len(encoded) / 1024:.1f} KiB')
+        for codec in codecs:
+            best = min(timeit.repeat(
+                lambda: round_trip(codec, payload, encoded),
+                number=iterations, repeat=5
+            ))
+            print(f'  {codec.name:>8}: {best / iterations * 1e6:8.1f} us')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -1,22 +1,84 @@
+import importlib
+
+# Admission Control
+from ._admission import Priority, priority
+# Bulk Issuance
+from ._issuance import CredentialIssuance, IssuedCredential
+# Deadlines
+from ._deadlines import deadline
+# Encoded Arguments
+from ._encoded import EncodedJson, LedgerObjectCache
+# JSON Codecs
+from ._codec import JsonCodec, OrjsonCodec, StdlibJsonCodec
 # Libindy
-# Anoncreds
-from ._commands.anoncreds import Anoncreds
-# Blob Storage
-from ._commands.blob_storage import BlobStorage
-# Crypto
-from ._commands.crypto import Crypto
-# DID
-from ._commands.did import DID
-# Ledger
-from ._commands.ledger import Ledger
-# Non-Secrets
-from ._commands.non_secrets import NonSecrets
-# Pairwise
-from ._commands.pairwise import Pairwise
-# Payment
-from ._commands.payment import Payment
-# Pool
-from ._commands.pool import Pool
-# Wallet
-from ._commands.wallet import Wallet
 from ._libindy import LIBINDY
+# Metrics
+from ._metrics import METRICS, MetricsRegistry
+# Revocation States
+from ._revocation import RevocationStateCache
+# Searches
+from ._search import CredentialSearch, ProofRequestSearch
+# Tracing
+from ._tracing import CommandHook
+
+# Command classes by name with the module they are defined in. The modules
+# are only imported when a command class is accessed for the first time.
+_COMMAND_CLASSES = {
+    # Anoncreds
+    'Anoncreds': 'anoncreds',
+    # Blob Storage
+    'BlobStorage': 'blob_storage',
+    # Crypto
+    'Crypto': 'crypto',
+    # DID
+    'DID': 'did',
+    # Ledger
+    'Ledger': 'ledger',
+    # Non-Secrets
+    'NonSecrets': 'non_secrets',
+    # Pairwise
+    'Pairwise': 'pairwise',
+    # Payment
+    'Payment': 'payment',
+    # Pool
+    'Pool': 'pool',
+    # Wallet
+    'Wallet': 'wallet'
+}
+
+__all__ = sorted(_COMMAND_CLASSES) + [
+    # Admission Control
+    'Priority', 'priority',
+    # Bulk Issuance
+    'CredentialIssuance', 'IssuedCredential',
+    # Deadlines
+    'deadline',
+    # Encoded Arguments
+    'EncodedJson', 'LedgerObjectCache',
+    # JSON Codecs
+    'JsonCodec', 'OrjsonCodec', 'StdlibJsonCodec',
+    # Libindy
+    'LIBINDY',
+    # Metrics
+    'METRICS', 'MetricsRegistry',
+    # Revocation States
+    'RevocationStateCache',
+    # Searches
+    'CredentialSearch', 'ProofRequestSearch',
+    # Tracing
+    'CommandHook'
+]
+
+
+def __getattr__(name: str):
+    module_name = _COMMAND_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    module = importlib.import_module(f'._commands.{module_name}', __name__)
+    command_class = globals()[name] = getattr(module, name)
+    return command_class
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_COMMAND_CLASSES))
@@ -0,0 +1,163 @@
+import contextlib
+import contextvars
+import heapq
+import itertools
+from asyncio import CancelledError, Future, TimeoutError, get_running_loop
+from enum import IntEnum
+from typing import Iterator, Optional
+
+# Command groups that concurrency limits can be set for; every command belongs
+# to the group named after the module that defines it
+COMMAND_GROUPS = ('anoncreds', 'blob_storage', 'crypto', 'did', 'ledger',
+                  'non_secrets', 'pairwise', 'payment', 'pool', 'wallet')
+
+
+class Priority(IntEnum):
+    """Priority classes of command calls; lower values are admitted first."""
+
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BULK = 2
+
+
+_PRIORITY: contextvars.ContextVar = contextvars.ContextVar(
+    'libindy_priority', default=Priority.DEFAULT
+)
+
+
+def current_priority() -> Priority:
+    """Returns the priority of the commands called in the current context."""
+    return _PRIORITY.get()
+
+
+@contextlib.contextmanager
+def priority(command_priority: Priority) -> Iterator[None]:
+    """Sets the priority of the commands called within the block.
+
+    The priority is kept in a context variable, so it also applies to tasks
+    created within the block:
+
+        with priority(Priority.INTERACTIVE):
+            valid = await Anoncreds.verify_proof(...)
+
+    :param command_priority : The priority of the commands.
+    """
+
+    token = _PRIORITY.set(Priority(command_priority))
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+class AdmissionQueue:
+    """Limits how many commands of a group run in Libindy at once.
+
+    Commands that would exceed the limit wait until a running command of the
+    group finished. Waiting commands are admitted by priority and, within the
+    same priority, in the order they arrived. A queue belongs to a single
+    event loop and must only be used from that loop.
+    """
+
+    def __init__(self, limit: Optional[int]):
+        """
+        :param limit : The maximal amount of commands that run at once;
+            `None` for no limit.
+        """
+
+        self._limit: Optional[int] = limit
+        self._active: int = 0
+        self._waiters: list = []
+        self._sequence: Iterator[int] = itertools.count()
+
+    # -------------------------------------------------------------------------
+    #  Properties
+    # -------------------------------------------------------------------------
+    @property
+    def limit(self) -> Optional[int]:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        """The amount of commands that were admitted and still run."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """The amount of commands that wait for admission."""
+        return sum(not waiter.done() for _, _, waiter in self._waiters)
+
+    # -------------------------------------------------------------------------
+    #  Methods
+    # -------------------------------------------------------------------------
+    def set_limit(self, limit: Optional[int]):
+        """Changes the limit and admits waiting commands if it was raised.
+
+        :param limit : The maximal amount of commands that run at once;
+            `None` for no limit.
+        """
+
+        self._limit = limit
+        self._admit_waiters()
+
+    async def acquire(self, command_priority: int = Priority.DEFAULT,
+                      timeout: Optional[float] = None):
+        """Waits until the command may run.
+
+        :param command_priority : The priority of the command.
+            Optional; Defaults to: `Priority.DEFAULT`
+        :param timeout          : The seconds the command may wait.
+            Optional
+
+        :raises asyncio.TimeoutError: Raised if the command was not admitted
+            in time; it does not take up a slot then.
+        """
+
+        if not self._waiters and self._has_capacity():
+            self._active += 1
+            return
+
+        if timeout is not None and timeout <= 0:
+            raise self._get_timeout_error()
+
+        loop = get_running_loop()
+        waiter = loop.create_future()
+        heapq.heappush(self._waiters,
+                       (command_priority, next(self._sequence), waiter))
+        timer = None
+        if timeout is not None:
+            timer = loop.call_later(timeout, self._expire_waiter, waiter)
+        try:
+            await waiter
+        except CancelledError:
+            # The command may have been admitted right before it was cancelled
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+    def release(self):
+        """Marks an admitted command as finished."""
+        self._active -= 1
+        self._admit_waiters()
+
+    def _expire_waiter(self, waiter: Future):
+        # Expired waiters stay in the heap and are skipped on admission
+        if not waiter.done():
+            waiter.set_exception(self._get_timeout_error())
+
+    @staticmethod
+    def _get_timeout_error() -> TimeoutError:
+        return TimeoutError('Command was not admitted before its deadline!')
+
+    def _has_capacity(self) -> bool:
+        return self._limit is None or self._active < self._limit
+
+    def _admit_waiters(self):
+        while self._waiters and self._has_capacity():
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
@@ -0,0 +1,76 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class JsonCodec(ABC):
+    """Encodes command arguments to and decodes responses from JSON.
+
+    Libindy takes and returns JSON as UTF-8 encoded C-strings, so a codec
+    works on `bytes` directly. Custom codecs can be set with
+    `Libindy.set_json_codec()`.
+    """
+
+    name: str = None
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Encodes a dict or list to UTF-8 encoded JSON."""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decodes UTF-8 encoded JSON to a dict or list."""
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec using the `json` module of the standard library."""
+
+    name = 'json'
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value).encode('utf-8')
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using `orjson`, which works on `bytes` natively.
+
+    `orjson` only handles integers of up to 64 bits. Values with larger
+    integers are encoded with the `json` module instead, but larger integers
+    in responses are decoded as floats.
+
+    :raises ImportError: Raised if `orjson` is not installed.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._options = orjson.OPT_NON_STR_KEYS
+        self._encode_error = orjson.JSONEncodeError
+
+    def encode(self, value: Any) -> bytes:
+        try:
+            return self._dumps(value, option=self._options)
+        except self._encode_error:
+            # Raises the error itself if the value is not serializable at all
+            return json.dumps(value).encode('utf-8')
+
+    def decode(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+def _default_codec() -> JsonCodec:
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibJsonCodec()
+
+
+# The codec used by the Libindy commands
+CODEC: JsonCodec = _default_codec()
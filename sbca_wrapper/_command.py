@@ -1,16 +1,33 @@
-import inspect
-import json
+import logging
+import reprlib
+import sys
+import threading
 import time
-from ctypes import (CFUNCTYPE, POINTER, c_bool, c_char_p, c_int32, c_uint8,
-                    c_uint32)
-from functools import wraps
+import ctypes
+from ctypes import (CFUNCTYPE, POINTER, Structure, _SimpleCData, byref,
+                    c_bool, c_char, c_char_p, c_int, c_int32, c_ssize_t,
+                    c_uint32, c_void_p, py_object, string_at)
+from functools import update_wrapper, wraps
 from typing import Any, Callable, Dict, Optional, Tuple, Union
 
+from . import _codec, _manifest
+from ._admission import current_priority
+from ._deadlines import _DEADLINE, remaining_time
+from ._encoded import EncodedJson
 from ._libindy import LIBINDY
+from ._metrics import (METRICS, PHASE_COMPLETED, PHASE_DECODED,
+                       PHASE_ENCODED, PHASE_STARTED)
+from ._tracing import CommandSpan
 
 _LIBINDY_LOGGER = LIBINDY.logger
 _LOGGER = _LIBINDY_LOGGER.getChild('command')
 
+# Guards the building of command functions on first use
+_BIND_LOCK = threading.RLock()
+
+# Every decorated command with its function by qualified name
+REGISTERED_COMMANDS: Dict[str, Tuple['LibindyCommand', Callable]] = {}
+
 
 class LibindyCommand:
     """Designates a function as a Libindy command.
@@ -18,6 +35,10 @@ class LibindyCommand:
     This class is meant to be used as a decorator on a function. It will
     generate a function body that is capable of calling the Libindy C-library.
     Any existing function body will be overwritten.
+
+    The function body is only generated when the command is called for the
+    first time (or when bind() is called), so importing the commands neither
+    loads the C-library nor inspects any command signatures.
     """
 
     def __init__(
@@ -32,26 +53,101 @@ class LibindyCommand:
             ->  Can also be multiple types as tuple
         :param arg_encoders: callable - Custom argument encoding functions
             ->  The key must match the name of the argument it is encoding
+            ->  If the encoder is a ctypes type (e.g. c_uint), it is also used
+                as the C-type of the argument. Any other callable leaves the
+                argument conversion of the whole command to ctypes.
         -----------------------------------------------------------------------
-        :raises NotImplementedError: Libindy implements no command with the
-            specified name
         """
 
-        # Check if command is implemented in Libindy
-        if not LIBINDY.implements_command(command_name):
-            _msg = f'Command {command_name} is not implemented in Libindy!\n'
-            _LOGGER.error(_msg)
-            raise NotImplementedError(_msg)
-
         self._command_name: str = command_name
         self._encoders: Dict[str, Callable] = arg_encoders
         self._return_type: Union[type, Tuple, None] = return_type
         self._callback: CFUNCTYPE
-        self._decoders: Union[Tuple, Callable]
+        self._callback_type: type
+        self._decoders: Tuple = ()
+        self._arg_types: Optional[Dict[str, Tuple]] = {}
+        self._expanded_args: set = set()
+        self._function: Any = None
+        self._command: Optional[Callable] = None
+        self._command_stub: Optional[Callable] = None
+        self._command_function: Optional[Callable] = None
+        self._sync_command_function: Optional[Callable] = None
+        self._arg_names: Optional[list] = None
+        self._return_type_tuple: Tuple = ()
 
     def __call__(
             self,
             command: callable
+    ) -> Callable:
+        """Registers the command function.
+        -----------------------------------------------------------------------
+        This returns a stub with the signature of the passed command. The
+        stub builds the command function body on its first call and then
+        replaces itself in the class that defines the command.
+        -----------------------------------------------------------------------
+        :param command: callable - Function signature to build body for
+        -----------------------------------------------------------------------
+        :returns command_stub: callable - Command stub function
+        """
+        self._command = command
+        REGISTERED_COMMANDS[command.__qualname__] = (self, command)
+
+        @wraps(command)
+        async def command_stub(*args, **kwargs) -> Any:
+            return await self.bind()(*args, **kwargs)
+
+        self._command_stub = command_stub
+        return command_stub
+
+    @property
+    def command_name(self) -> str:
+        return self._command_name
+
+    def bind(self) -> Callable:
+        """Builds the command function body if it was not built yet.
+        -----------------------------------------------------------------------
+        :returns command_function: callable - Final command function
+        -----------------------------------------------------------------------
+        :raises NotImplementedError: Libindy implements no command with the
+            specified name
+        """
+        command_function = self._command_function
+        if command_function is None:
+            with _BIND_LOCK:
+                if self._command_function is None:
+                    self._command_function = self._build(self._command)
+                    self._replace_command_stub()
+                command_function = self._command_function
+
+        return command_function
+
+    def bind_sync(self) -> Callable:
+        """Builds the blocking command function if it was not built yet.
+        -----------------------------------------------------------------------
+        The blocking function takes the same arguments as the command, but
+        waits for the command in the calling thread instead of returning an
+        awaitable. It needs no event loop.
+        -----------------------------------------------------------------------
+        :returns sync_command_function: callable - Blocking command function
+        -----------------------------------------------------------------------
+        :raises NotImplementedError: Libindy implements no command with the
+            specified name
+        """
+        sync_command_function = self._sync_command_function
+        if sync_command_function is None:
+            with _BIND_LOCK:
+                if self._sync_command_function is None:
+                    self._sync_command_function = self._build(
+                        self._command, sync=True
+                    )
+                sync_command_function = self._sync_command_function
+
+        return sync_command_function
+
+    def _build(
+            self,
+            command: callable,
+            sync: bool = False
     ) -> Callable:
         """Builds the command function body.
         -----------------------------------------------------------------------
@@ -61,30 +157,76 @@ class LibindyCommand:
         body, it will be overwritten.
         -----------------------------------------------------------------------
         :param command: callable - Function signature to build body for
+        :param sync: bool - Whether to build the blocking command function
         -----------------------------------------------------------------------
         :returns final_command: callable - Final command function
+        -----------------------------------------------------------------------
+        :raises NotImplementedError: Libindy implements no command with the
+            specified name
         """
         _LOGGER.debug(f'Building {command.__qualname__}...')
 
-        # Get argument and return type annotations
-        full_arg_spec = inspect.getfullargspec(command)
-        arg_names: list = full_arg_spec.args
-        annotations: dict = inspect.getfullargspec(command).annotations
+        # Encoders, decoders and the C-function are shared by the command
+        # function and the blocking command function
+        if self._arg_names is None:
+            self._prepare(command)
+
+        # Generate the specialized command function
+        wrapped_command = self._build_command_function(
+            command, self._arg_names, self._return_type_tuple, sync
+        )
+
+        # Apply name, annotations and docstring from old command to new one;
+        # the signature is resolved through __wrapped__ when requested
+        update_wrapper(wrapped_command, command)
+        _LOGGER.debug(f'Finished building {command.__qualname__}.')
+
+        return wrapped_command
+
+    def _prepare(
+            self,
+            command: callable
+    ):
+        """Sets up everything the command function bodies need.
+        -----------------------------------------------------------------------
+        :param command: callable - Function signature to build body for
+        -----------------------------------------------------------------------
+        :raises NotImplementedError: Libindy implements no command with the
+            specified name
+        """
+
+        # Check if command is implemented in Libindy
+        if not LIBINDY.implements_command(self._command_name):
+            _msg = f'Command {self._command_name} is not implemented in ' \
+                f'Libindy!\n'
+            _LOGGER.error(_msg)
+            raise NotImplementedError(_msg)
+
+        # Read the command signature from the manifest; commands that are
+        # missing there (or whose arguments changed) are inspected instead
+        signature = _manifest.load(self._command_name, command)
+        if signature is None:
+            _LOGGER.debug('  Command not found in manifest; inspecting.')
+            signature = _manifest.describe(self._command_name, command)
+        _, args, returns = signature
+
+        arg_names = [name for name, _, _ in args]
+        arg_types = {name: (optional, _manifest.TYPES[type_name])
+                     for name, type_name, optional in args}
+        return_types = tuple((optional, _manifest.TYPES[type_name])
+                             for type_name, optional in returns)
+        return_type_tuple = tuple(
+            return_type for _, return_type in return_types
+        )
 
         # Set argument encoder functions
         if len(arg_names) > 0:
-            self._set_argument_encoders(arg_names, annotations)
+            self._set_argument_encoders(arg_names, arg_types)
         else:
             _LOGGER.debug('  Command has no arguments; skipping.')
 
         # Set return type and response decoder functions
-        return_type_tuple = ()
-        if annotations.get('return'):
-
-            # Map to tuple for streamlined processing
-            return_type_tuple = annotations.get('return')
-            if not isinstance(return_type_tuple, tuple):
-                return_type_tuple = (return_type_tuple,)
+        if return_type_tuple:
 
             # Set default return types if no custom return types are specified
             if not self._return_type:
@@ -93,89 +235,39 @@ class LibindyCommand:
                 _LOGGER.debug('  Command has custom return type(s); skipping.')
 
             # Set response decoder functions
-            self._set_response_decoders(return_type_tuple)
+            self._set_response_decoders(return_types)
         else:
             _LOGGER.debug('  Command returns nothing; skipping.')
 
         # Build callback function
         self._set_callback(return_type_tuple)
 
-        @wraps(command)
-        async def wrapped_command(*args, **kwargs) -> Any:
-            starting_time = time.clock()
-
-            # Check if argument requirements are satisfied
-            _args, _kwargs, kwargs_strings = list(args), {}, []
-            for arg_name in arg_names:
-                if arg_name in kwargs.keys():
-                    _kwargs[arg_name] = kwargs.get(arg_name)
-                elif len(_args) > 0:
-                    _kwargs[arg_name] = _args.pop(0)
-                else:
-                    msg = f"{command.__qualname__} missing 1 required " \
-                        f"positional argument: '{arg_name}'\n"
-                    _LOGGER.error(msg)
-                    raise TypeError(msg)
-
-                # Build key / value pair string
-                kwargs_strings.append(
-                    f'{arg_name}={str(_kwargs.get(arg_name))}'
-                )
-
-            # Build and log command entry string
-            _LIBINDY_LOGGER.info(
-                f'{command.__qualname__} >>> {", ".join(kwargs_strings)}'
-            )
-
-            # Encode arguments
-            encoded_args = []
-            for arg_name in arg_names:
-                encoded_arg = self._encoders[arg_name](_kwargs.get(arg_name))
-
-                if isinstance(encoded_arg, tuple):
-                    encoded_args.extend(encoded_arg)
-                else:
-                    encoded_args.append(encoded_arg)
+        # Resolve and type the C-function once for all calls
+        self._bind_function(arg_names)
 
-            # Run Libindy command
-            response = await LIBINDY(self._command_name,
-                                     *encoded_args,
-                                     self._callback)
+        self._return_type_tuple = return_type_tuple
+        self._arg_names = arg_names
 
-            # Decode response if necessary
-            decoded_response = []
-            if self._return_type:
-                for element, decoder in zip(response, self._decoders):
-                    decoded_response.append(decoder(element))
+    def _replace_command_stub(self):
+        """Replaces the command stub in its class by the built function."""
 
-            # Map list to tuple, single element or None
-            if not self._return_type:
-                decoded_response = None
-            elif len(self._return_type) > 1:
-                decoded_response = tuple(decoded_response)
-            else:
-                decoded_response = decoded_response[0]
-
-            _LIBINDY_LOGGER.info(
-                f'{command.__qualname__} '
-                f'[{(time.clock() - starting_time):.2f}s] <<< '
-                f'{str(decoded_response)}'
-            )
+        # Resolve the class that defines the command from its qualified name
+        *owner_names, name = self._command.__qualname__.split('.')
+        owner = sys.modules.get(self._command.__module__)
+        for owner_name in owner_names:
+            owner = getattr(owner, owner_name, None)
 
-            return decoded_response
-
-        # Apply command annotations and signature from old command to new one
-        wrapped_command.__annotations__ = command.__annotations__
-        wrapped_command.__signature__ = inspect.signature(command)
-        _LOGGER.debug(f'Finished building {command.__qualname__}.')
-
-        return wrapped_command
+        if isinstance(owner, type):
+            attribute = owner.__dict__.get(name)
+            if isinstance(attribute, staticmethod) and \
+                    attribute.__func__ is self._command_stub:
+                setattr(owner, name, staticmethod(self._command_function))
 
     # Builder Functions -------------------------------------------------------
     def _set_argument_encoders(
             self,
             arg_names: list,
-            arg_signatures: dict
+            arg_types: dict
     ):
         """Sets the command's argument encoder functions.
         -----------------------------------------------------------------------
@@ -184,29 +276,45 @@ class LibindyCommand:
         function specified in LibindyCommand.__init__.
         -----------------------------------------------------------------------
         :param arg_names: list - The names of the command arguments
-        :param arg_signatures: dict - The type specs of the command arguments
+        :param arg_types: dict - Whether each argument is optional and its
+            type, by argument name
         -----------------------------------------------------------------------
         :raises TypeError: An argument type has no default encoder function
         """
         _LOGGER.debug('  Setting argument encoders...')
 
+        # Take C-types from custom encoders that are ctypes types
+        for name in arg_names:
+            encoder = self._encoders.get(name)
+            if encoder is None or self._arg_types is None:
+                continue
+            if isinstance(encoder, type) and issubclass(encoder, _SimpleCData):
+                self._arg_types[name] = (encoder,)
+            else:
+                self._arg_types = None
+
         # Ignore arguments with custom encoders
         arg_names = list(filter(
             lambda arg: arg not in self._encoders.keys(), arg_names
         ))
 
         for name in arg_names:
-            optional, arg_type = self._is_optional(arg_signatures[name])
+            optional, arg_type = arg_types[name]
 
             # Assign argument type encoding function
             if arg_type in {Union[dict, str], Union[list, str], str}:
                 self._encoders[name] = _encode_str_or_collection
+                c_types = (c_char_p,)
             elif arg_type is int:
                 self._encoders[name] = _encode_int
+                c_types = (c_int32,)
             elif arg_type is bool:
                 self._encoders[name] = _encode_bool
+                c_types = (c_bool,)
             elif arg_type is bytes:
                 self._encoders[name] = _encode_bytes
+                c_types = (c_char_p, c_uint32)
+                self._expanded_args.add(name)
             else:
                 msg = f'Unsupported argument type {arg_type}!'
                 _LOGGER.error(f'\n  {msg}')
@@ -214,7 +322,12 @@ class LibindyCommand:
 
             # Add "None" check before encoding if argument is optional
             if optional:
-                self._encoders[name] = _run_optional(self._encoders[name])
+                self._encoders[name] = _run_optional(
+                    self._encoders[name], _OPTIONAL_DEFAULTS.get(arg_type)
+                )
+
+            if self._arg_types is not None:
+                self._arg_types[name] = c_types
         _LOGGER.debug('  Argument encoders set.')
 
     def _set_return_types(
@@ -229,8 +342,6 @@ class LibindyCommand:
 
         c_return_types = []
         for return_type in return_type_tuple:
-            _, return_type = LibindyCommand._is_optional(return_type)
-
             c_return_type = _RETURN_TYPE_MAP.get(return_type)
             if not return_type:
                 msg = f'Unsupported return type {return_type}!'
@@ -247,17 +358,17 @@ class LibindyCommand:
 
     def _set_response_decoders(
             self,
-            return_type_tuple: Tuple
+            return_types: Tuple
     ):
         """Maps matching decode function to Python return type.
         -----------------------------------------------------------------------
-        :param return_type_tuple: tuple - Python return type(s) as tuple
+        :param return_types: tuple - Whether each return value is optional
+            and its Python type
         """
         _LOGGER.debug('  Setting response decoders...')
 
         decoders = []
-        for return_type in return_type_tuple:
-            optional, return_type = self._is_optional(return_type)
+        for optional, return_type in return_types:
 
             if return_type in {dict, list}:
                 decoders.append(_decode_collection)
@@ -282,75 +393,332 @@ class LibindyCommand:
         """
         _LOGGER.debug('  Setting callback function...')
 
-        callback_transform = None
         if bytes in return_type_tuple:
 
-            # Libindy returns bytes in two parts that have to be combined
-            # before giving back to the library caller. This is taken care of
-            # with this function
+            # Libindy returns bytes in two parts (buffer pointer and length)
+            # that have to be combined before giving back to the library
+            # caller. The buffer is only valid during the callback, so it is
+            # copied out in one piece.
+            bytes_positions = []
+            for return_type in return_type_tuple:
+                bytes_positions.append(return_type is bytes)
+
             def callback_transform(*cb_args) -> Any:
-                cb_args, tf_args = list(cb_args), []
-
-                for index, return_type in enumerate(return_type_tuple):
-                    if return_type is bytes:
-                        # Create bytes object using the bytes value and the
-                        # content length stored in the next list entry
-                        tf_arg = bytes(cb_args[index][:cb_args.pop(index + 1)])
-                        tf_args.append(tf_arg)
+                read_buffer = _read_memoryview \
+                    if LIBINDY.bytes_result_type is memoryview \
+                    else _read_bytes
+
+                tf_args, index = [], 0
+                for is_bytes in bytes_positions:
+                    if is_bytes:
+                        tf_args.append(
+                            read_buffer(cb_args[index], cb_args[index + 1])
+                        )
+                        index += 2
                     else:
                         tf_args.append(cb_args[index])
+                        index += 1
 
                 return tuple(tf_args)
+        else:
+            callback_transform = None
 
         return_types = self._return_type or ()
         signature = CFUNCTYPE(None, c_int32, c_int32, *return_types)
+        self._callback_type = signature
         self._callback = LIBINDY.create_callback(signature, callback_transform)
         _LOGGER.debug('  Callback function set.')
 
-    # Helper Methods ----------------------------------------------------------
-    @staticmethod
-    def _is_optional(spec: Any) -> (bool, Union):
-        """Determines whether a type is an Optional.
-        -----------------------------------------------------------------------
-        This will check if the provided type ( -> spec) is wrapped with a
-        typing.Optional object. If so, the "None" will be returned from the
-        Union. Afterwards (or if spec is not optional), it will return a bool
-        saying whether spec is optional or not and a new Union with the
-        remaining types.
+    def _bind_function(
+            self,
+            arg_names: list
+    ):
+        """Resolves the C-function and sets its argument and return types.
         -----------------------------------------------------------------------
-        :param spec: Union, type - Type specification to check
+        The bound function is kept by the command, so calling the command does
+        not have to look up the C-function or guess the argument conversions.
         -----------------------------------------------------------------------
-        :returns: (
-            is_optional: bool - Whether spec is optional or not
-            types: Union, type - The remaining types after removing "None"
-        )
+        :param arg_names: list - The names of the command arguments
         """
+        _LOGGER.debug('  Binding C-function...')
 
-        # Check if spec is an Optional
-        if str(spec).startswith(str(Union)) and type(None) in spec.__args__:
-            types = spec.__args__
-            types = tuple(filter(lambda t: not isinstance(None, t), types))
-            return True, Union[types]
-        return False, spec
-
-
-# Argument Encoding Functions -------------------------------------------------
-def _encode_str_or_collection(arg: Union[dict, list, str]) -> c_char_p:
-    if isinstance(arg, (dict, list)):
-        arg = json.dumps(arg)
-    return c_char_p(arg.encode('utf-8'))
+        arg_types = None
+        if self._arg_types is not None:
+            arg_types = []
+            for name in arg_names:
+                arg_types.extend(self._arg_types[name])
+        else:
+            _LOGGER.debug('  Command has untyped custom encoders; '
+                          'skipping argument types.')
 
+        self._function = LIBINDY.bind_command(self._command_name, arg_types,
+                                              self._callback_type)
+        _LOGGER.debug('  C-function bound.')
 
-def _encode_int(arg: int) -> c_int32:
-    return c_int32(arg)
+    def _build_command_function(
+            self,
+            command: Callable,
+            arg_names: list,
+            return_type_tuple: Tuple,
+            sync: bool = False
+    ) -> Callable:
+        """Generates the function that runs the command.
+        -----------------------------------------------------------------------
+        The function is compiled from source with the same positional
+        signature as the command. The encoders and decoders are called
+        directly on each argument and response value, so running the command
+        needs no loops over the arguments or checks of the return types.
+        -----------------------------------------------------------------------
+        :param command: callable - Function signature to build body for
+        :param arg_names: list - The names of the command arguments
+        :param return_type_tuple: tuple - Python return type(s) as tuple
+        :param sync: bool - Whether to generate a blocking function instead
+            of a coroutine function
+        -----------------------------------------------------------------------
+        :returns command_function: callable - The generated function
+        """
+        _LOGGER.debug('  Generating command function...')
+
+        # Names inside the generated function are prefixed with an underscore
+        # so they can not collide with argument names
+        namespace = {
+            '_LIBINDY': LIBINDY,
+            '_LOGGER': _LIBINDY_LOGGER,
+            '_perf_counter': time.perf_counter,
+            '_INFO': logging.INFO,
+            '_sampled': lambda: LIBINDY.sample_command_log(self._command_name),
+            '_payload': _format_payload,
+            '_metrics': METRICS.command(self._command_name),
+            '_command_name': self._command_name,
+            '_group': command.__module__.rpartition('.')[2],
+            '_LIMITS': LIBINDY._CONCURRENCY_LIMITS,
+            '_priority': current_priority,
+            '_TIMEOUTS': LIBINDY._COMMAND_TIMEOUTS,
+            '_DEADLINE': _DEADLINE,
+            '_remaining_time': remaining_time,
+            '_CommandSpan': CommandSpan,
+            '_PHASE_STARTED': PHASE_STARTED,
+            '_PHASE_ENCODED': PHASE_ENCODED,
+            '_PHASE_COMPLETED': PHASE_COMPLETED,
+            '_PHASE_DECODED': PHASE_DECODED,
+            '_function': self._function,
+            '_callback': self._callback,
+            '_entry_format': f'{command.__qualname__} >>> ' + ', '.join(
+                f'{name}={{}}' for name in arg_names
+            ),
+            '_exit_format': f'{command.__qualname__} [{{:.2f}}s] <<< {{}}'
+        }
+
+        # Encode arguments; bytes arguments expand into value and length
+        encoded_args = []
+        for index, name in enumerate(arg_names):
+            namespace[f'_encode_{index}'] = self._encoders[name]
+            star = '*' if name in self._expanded_args else ''
+            encoded_args.append(f'{star}_encode_{index}({name})')
+        encoded_args.append('_callback')
+
+        # Decode response values
+        decoded_values = []
+        for index, decoder in enumerate(self._decoders):
+            namespace[f'_decode_{index}'] = decoder
+            decoded_values.append(f'_decode_{index}(_response[{index}])')
+
+        if not return_type_tuple:
+            result = 'None'
+        elif len(return_type_tuple) > 1:
+            result = f'({", ".join(decoded_values)},)'
+        else:
+            result = decoded_values[0]
+
+        # Logging is skipped entirely unless INFO is enabled and sampled
+        logged_args = ', '.join(f'_payload({name})' for name in arg_names)
+        traced_args = ', '.join(f"'{name}': {name}" for name in arg_names)
+        # Commands of groups with a concurrency limit wait for admission
+        # before their arguments are encoded; blocking commands are not
+        # limited. Once the command is passed to `LIBINDY`, it frees the slot
+        # when the command responded, so commands that the caller gave up on
+        # keep taking up their slot while they still run.
+        if sync:
+            definition = 'def'
+            call = ('        _response = _LIBINDY.call_sync(_function, '
+                    '*_encoded_args,',
+                    '            timings=_timings, span=_span, '
+                    'timeout=_timeout)')
+            admission = admit = release = ()
+        else:
+            definition = 'async def'
+            call = (
+                '        _release = None',
+                '        if _admission is not None:',
+                '            _release = _admission.release',
+                '            _admission = None',
+                '        _future = _LIBINDY(_function, *_encoded_args,',
+                '            timings=_timings, span=_span, timeout=_timeout,',
+                '            release=_release)',
+                '        _response = await _future'
+            )
+            admission = ('    _admission = None',)
+            admit = (
+                '        if _group in _LIMITS:',
+                '            _queue = _LIBINDY.get_admission_queue(_group)',
+                '            if _queue is not None:',
+                '                _queued_time = _perf_counter()',
+                '                await _queue.acquire(_priority(), '
+                '_remaining_time())',
+                '                _admission = _queue',
+                '                _admitted_time = _perf_counter()',
+                '                _metrics.record_queue_wait(',
+                '                    _admitted_time - _queued_time)',
+                '                if _timings is not None:',
+                '                    _timings[_PHASE_STARTED] = _admitted_time'
+            )
+            release = (
+                '        if _admission is not None:',
+                '            _admission.release()'
+            )
+        source = '\n'.join((
+            f'{definition} {command.__name__}({", ".join(arg_names)}):',
+            '    _starting_time = _perf_counter()',
+            '    _timings = None',
+            '    if _LIBINDY.phase_timing:',
+            '        _timings = [_starting_time, 0.0, 0.0, 0.0, 0.0, 0.0]',
+            '    _span = None',
+            '    if _LIBINDY.hooks:',
+            f'        _span = _CommandSpan(_LIBINDY.hooks, _command_name, '
+            f'{{{traced_args}}})',
+            '    _logged = _LOGGER.isEnabledFor(_INFO) and _sampled()',
+            '    if _logged:',
+            f'        _LOGGER.info(_entry_format.format({logged_args}))',
+            '    _metrics.start()',
+            *admission,
+            '    try:',
+            *admit,
+            f'        _encoded_args = ({", ".join(encoded_args)},)',
+            '        if _timings is not None:',
+            '            _timings[_PHASE_ENCODED] = _perf_counter()',
+            '        _timeout = None',
+            '        if _TIMEOUTS or _DEADLINE.get() is not None:',
+            '            _timeout = _LIBINDY.command_timeout(_command_name)',
+            *call,
+            f'        _result = {result}',
+            '    except BaseException as _error:',
+            *release,
+            '        _duration = _perf_counter() - _starting_time',
+            '        _metrics.finish(_duration, _error)',
+            '        if _span is not None:',
+            '            _span.complete(None, _error, _timings)',
+            '        raise',
+            '    _finishing_time = _perf_counter()',
+            '    _duration = _finishing_time - _starting_time',
+            '    _metrics.finish(_duration)',
+            '    if _timings is not None and _timings[_PHASE_COMPLETED]:',
+            '        _timings[_PHASE_DECODED] = _finishing_time',
+            '        _metrics.record_phases(_timings)',
+            '    if _span is not None:',
+            '        _span.complete(_result, None, _timings)',
+            '    if _logged:',
+            '        _LOGGER.info(_exit_format.format(',
+            '            _duration, _payload(_result)))',
+            '    return _result'
+        ))
 
+        exec(compile(source, f'<{command.__qualname__}>', 'exec'), namespace)
+        _LOGGER.debug('  Command function generated.')
 
-def _encode_bool(arg: bool) -> c_bool:
-    return c_bool(arg)
+        return namespace[command.__name__]
 
 
-def _encode_bytes(arg: bytes) -> (bytes, c_uint32):
-    return arg, c_uint32(len(arg))
+# Argument Encoding Functions -------------------------------------------------
+# The C-conversion itself is done by the argument types of the bound function
+def _encode_str_or_collection(
+        arg: Union[dict, list, str, EncodedJson]
+) -> bytes:
+    if isinstance(arg, (dict, list)):
+        return _codec.CODEC.encode(arg)
+    if isinstance(arg, EncodedJson):
+        return arg.encoded
+    return arg.encode('utf-8')
+
+
+def _encode_int(arg: int) -> int:
+    return arg
+
+
+def _encode_bool(arg: bool) -> bool:
+    return arg
+
+
+def _encode_bytes(arg: Any) -> (Any, int):
+    # Any buffer object is accepted; contiguous buffers (bytes, bytearray,
+    # mmap, memoryview slices, ...) are passed to Libindy without copying
+    # their contents. Only non-contiguous buffers are copied.
+    if isinstance(arg, bytes):
+        return arg, len(arg)
+
+    view = memoryview(arg)
+    length = view.nbytes
+    if not length:
+        return b'', 0
+
+    if not view.c_contiguous:
+        return view.tobytes(), length
+    view = view.cast('B')
+    if not view.readonly:
+        return (c_char * length).from_buffer(view), length
+
+    # Read-only buffers wrapping whole bytes are passed as they are
+    if isinstance(view.obj, bytes) and len(view.obj) == length:
+        return view.obj, length
+    if _PyObject_GetBuffer is None:
+        return view.tobytes(), length
+
+    # Other read-only buffers (read-only mmap, slices of bytes, ...) are
+    # passed by their address; the array holds on to the view, which keeps
+    # the buffer exported (e.g. an mmap cannot be closed) while it is used
+    array = (c_char * length).from_address(_get_buffer_address(view))
+    array._view = view
+    return array, length
+
+
+class _PyBuffer(Structure):
+    """The `Py_buffer` struct of the CPython buffer protocol."""
+
+    _fields_ = [
+        ('buf', c_void_p),
+        ('obj', c_void_p),
+        ('len', c_ssize_t),
+        ('itemsize', c_ssize_t),
+        ('readonly', c_int),
+        ('ndim', c_int),
+        ('format', c_char_p),
+        ('shape', c_void_p),
+        ('strides', c_void_p),
+        ('suboffsets', c_void_p),
+        ('internal', c_void_p)
+    ]
+
+
+# The buffer protocol is only reachable on CPython; read-only buffers are
+# copied on other interpreters
+_PyObject_GetBuffer = _PyBuffer_Release = None
+if hasattr(ctypes, 'pythonapi'):
+    _PyObject_GetBuffer = ctypes.pythonapi.PyObject_GetBuffer
+    _PyObject_GetBuffer.argtypes = (py_object, POINTER(_PyBuffer), c_int)
+    _PyObject_GetBuffer.restype = c_int
+    _PyBuffer_Release = ctypes.pythonapi.PyBuffer_Release
+    _PyBuffer_Release.argtypes = (POINTER(_PyBuffer),)
+    _PyBuffer_Release.restype = None
+
+
+def _get_buffer_address(view: memoryview) -> int:
+    # The address stays valid as long as the view is alive, since the view
+    # holds its own export of the underlying buffer
+    buffer = _PyBuffer()
+    _PyObject_GetBuffer(view, byref(buffer), 0)
+    try:
+        return buffer.buf
+    finally:
+        _PyBuffer_Release(byref(buffer))
 
 
 # Response Decoding Functions -------------------------------------------------
@@ -359,23 +727,78 @@ def _decode_str(res: Any) -> str:
 
 
 def _decode_collection(res: Any) -> Union[dict, list]:
-    return json.loads(_decode_str(res))
+    return _codec.CODEC.decode(res)
 
 
 def _decode_default(res: Any) -> Union[int, bool, bytes]:
     return res
 
 
+# Logging Functions -----------------------------------------------------------
+class _PayloadRepr(reprlib.Repr):
+    """Builds size-capped representations of command payloads."""
+
+    def __init__(self):
+        super().__init__()
+        self.maxlevel = 3
+        self.maxdict = 8
+        self.maxlist = 8
+        self.maxtuple = 8
+        self.maxstring = 64
+        self.maxother = 64
+
+    def repr_bytes(self, obj: bytes, level: int) -> str:
+        if len(obj) <= self.maxstring:
+            return repr(obj)
+        return f'{obj[:self.maxstring]!r}...({len(obj)} bytes)'
+
+    repr_bytearray = repr_bytes
+
+    def repr_memoryview(self, obj: memoryview, level: int) -> str:
+        return f'<memoryview ({obj.nbytes} bytes)>'
+
+
+_PAYLOAD_REPR = _PayloadRepr()
+
+
+def _format_payload(payload: Any) -> str:
+    # Only the parts that fit into the limit are formatted
+    payload_string = _PAYLOAD_REPR.repr(payload)
+    limit = LIBINDY.log_payload_limit
+    if len(payload_string) > limit:
+        payload_string = f'{payload_string[:limit]}...'
+    return payload_string
+
+
+# Response Buffer Functions ---------------------------------------------------
+def _read_bytes(address: Optional[int], length: int) -> bytes:
+    if not length:
+        return b''
+    return string_at(address, length)
+
+
+def _read_memoryview(address: Optional[int], length: int) -> memoryview:
+    # The view is over the one copy that is made of the Libindy buffer
+    return memoryview(_read_bytes(address, length))
+
+
 # Helper Functions ------------------------------------------------------------
-def _run_optional(func: Callable) -> Callable:
-    return lambda arg: None if not arg else func(arg)
+def _run_optional(func: Callable, default: Any = None) -> Callable:
+    return lambda arg: default if not arg else func(arg)
+
+
+# Values passed for missing optional arguments whose C-type is no pointer
+_OPTIONAL_DEFAULTS = {
+    int: 0,
+    bool: False
+}
 
 
 _RETURN_TYPE_MAP = {
     str: c_char_p,
     int: c_int32,
     bool: c_bool,
-    bytes: (POINTER(c_uint8), c_uint32),
+    bytes: (c_void_p, c_uint32),
     dict: c_char_p,
     list: c_char_p
 }
@@ -242,7 +242,7 @@ class Anoncreds:
 
     @staticmethod
     @LibindyCommand('indy_prover_fetch_credentials',
-                    cred_count=lambda arg: c_uint(arg))
+                    cred_count=c_uint)
     async def get_credentials_from_search(
             search_handle: int,
             cred_count: int
@@ -270,7 +270,7 @@ class Anoncreds:
 
     @staticmethod
     @LibindyCommand('indy_prover_fetch_credentials_for_proof_req',
-                    cred_count=lambda arg: c_uint(arg))
+                    cred_count=c_uint)
     async def get_credentials_from_proof_request_search(
             search_handle: int,
             item_id: str,
@@ -316,7 +316,7 @@ class Anoncreds:
 
     @staticmethod
     @LibindyCommand('indy_create_revocation_state',
-                    timestamp=lambda arg: c_uint64(arg))
+                    timestamp=c_uint64)
     async def create_revocation_state(
             tails_reader_handle: int,
             revoc_reg_defs: Union[dict, str],
@@ -329,7 +329,7 @@ class Anoncreds:
 
     @staticmethod
     @LibindyCommand('indy_update_revocation_state',
-                    timestamp=lambda arg: c_uint64(arg))
+                    timestamp=c_uint64)
     async def update_revocation_state(
             tails_reader_handle: int,
             revoc_state: Union[dict, str],
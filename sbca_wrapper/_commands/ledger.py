@@ -209,7 +209,7 @@ class Ledger:
 
     @staticmethod
     @LibindyCommand('indy_build_get_revoc_reg_request',
-                    timestamp=lambda arg: c_int64(arg))
+                    timestamp=c_int64)
     async def get_revoc_reg_request(
             sender_did: Optional[str],
             revoc_reg_def_id: str,
@@ -266,7 +266,7 @@ class Ledger:
     @staticmethod
     @LibindyCommand('indy_build_get_revoc_reg_delta_request',
                     delta_from=lambda arg: c_int64(arg) if arg else -1,
-                    delta_to=lambda arg: c_int64(arg))
+                    delta_to=c_int64)
     async def get_revoc_reg_delta_request(
             sender_did: Optional[str],
             revoc_reg_def_id: str,
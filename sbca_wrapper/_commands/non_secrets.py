@@ -96,7 +96,7 @@ class NonSecrets:
 
     @staticmethod
     @LibindyCommand('indy_fetch_wallet_search_next_records',
-                    record_count=lambda arg: c_uint(arg))
+                    record_count=c_uint)
     async def fetch_wallet_record_from_search(
             wallet_handle: int,
             search_handle: int,
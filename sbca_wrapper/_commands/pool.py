@@ -1,3 +1,4 @@
+from ctypes import c_size_t
 from typing import Optional, Union
 
 from .._command import LibindyCommand
@@ -55,7 +56,7 @@ class Pool:
 
     @staticmethod
     @LibindyCommand('indy_set_protocol_version',
-                    protocol_version=lambda arg: arg)
+                    protocol_version=c_size_t)
     async def set_protocol_version(
             protocol_version: int
     ):
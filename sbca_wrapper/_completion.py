@@ -0,0 +1,80 @@
+import threading
+import weakref
+from asyncio import AbstractEventLoop
+from collections import deque
+from typing import Callable, Optional
+
+
+class CompletionQueue:
+    """Collects Libindy command completions for a single event loop.
+
+    Libindy runs command callbacks on its own worker threads. Instead of
+    waking up the event loop once per completed command, the callbacks are
+    appended to this queue and a single drain is scheduled on the loop. The
+    drain then runs every completion that arrived in the meantime as one
+    batch.
+
+    The queue only keeps a weak reference to its loop, so it does not keep
+    a finished loop alive. Completions for a closed loop are dropped.
+    """
+
+    def __init__(self, loop: AbstractEventLoop):
+        """
+        :param loop : The event loop that owns the command futures.
+        """
+
+        self._loop_ref: weakref.ref = weakref.ref(loop)
+        self._completions: deque = deque()
+        self._lock: threading.Lock = threading.Lock()
+        self._drain_scheduled: bool = False
+
+    @property
+    def loop(self) -> Optional[AbstractEventLoop]:
+        """The owning event loop; `None` if it was garbage collected."""
+        return self._loop_ref()
+
+    def put(self, completion: Callable, *args) -> bool:
+        """Adds a completion to the queue.
+
+        This is safe to call from any thread. The loop is only woken up if no
+        drain is pending yet.
+
+        :param completion : The function to run on the event loop.
+        :param args       : The arguments of the function.
+
+        :returns: Whether the completion was queued; `False` if the loop is
+            closed.
+        """
+
+        loop = self._loop_ref()
+        if loop is None or loop.is_closed():
+            return False
+
+        with self._lock:
+            self._completions.append((completion, args))
+            if self._drain_scheduled:
+                return True
+            self._drain_scheduled = True
+
+        try:
+            loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:
+            # The loop was closed in the meantime
+            return False
+        return True
+
+    def _drain(self):
+        loop = self._loop_ref()
+        with self._lock:
+            completions, self._completions = self._completions, deque()
+            self._drain_scheduled = False
+
+        # A failing completion must not drop the rest of the batch
+        for completion, args in completions:
+            try:
+                completion(*args)
+            except Exception as error:
+                loop.call_exception_handler({
+                    'message': 'Exception in Libindy command completion',
+                    'exception': error
+                })
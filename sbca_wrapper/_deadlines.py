@@ -0,0 +1,47 @@
+import contextlib
+import contextvars
+import time
+from typing import Iterator, Optional
+
+_DEADLINE: contextvars.ContextVar = contextvars.ContextVar(
+    'libindy_deadline', default=None
+)
+
+
+def remaining_time() -> Optional[float]:
+    """Returns the seconds left until the deadline of the current context.
+
+    :returns: The remaining time; `None` if no deadline is set.
+    """
+
+    command_deadline = _DEADLINE.get()
+    if command_deadline is None:
+        return None
+    return command_deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def deadline(timeout: float) -> Iterator[None]:
+    """Sets a deadline for the commands called within the block.
+
+    Commands that did not finish by the deadline raise an
+    `asyncio.TimeoutError`, also while they still wait for admission to the
+    concurrency limit of their group. A deadline inside the block of another
+    one can only shorten it:
+
+        with deadline(2.0):
+            wallet_handle = await Wallet.open_wallet(...)
+
+    :param timeout : The seconds from now until the deadline.
+    """
+
+    command_deadline = time.monotonic() + timeout
+    outer_deadline = _DEADLINE.get()
+    if outer_deadline is not None and outer_deadline < command_deadline:
+        command_deadline = outer_deadline
+
+    token = _DEADLINE.set(command_deadline)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
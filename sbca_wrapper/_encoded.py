@@ -0,0 +1,175 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Union
+
+from . import _codec
+
+
+class EncodedJson:
+    """A JSON command argument that is encoded only once.
+
+    Commands pass the encoded bytes to Libindy as they are, so large objects
+    that are used in many calls (e.g. credential definitions) are not
+    serialized again for every call:
+
+        cred_def = EncodedJson(cred_def)
+        await Anoncreds.create_credential_request(..., cred_def, ...)
+
+    The value must not be changed after it was encoded.
+    """
+
+    __slots__ = ('value', 'encoded')
+
+    def __init__(self, value: Union[dict, list, str],
+                 encoded: Optional[bytes] = None):
+        """
+        :param value   : The JSON value or string.
+        :param encoded : The UTF-8 encoded JSON of the value, if it is known
+            already.
+            Optional
+        """
+
+        if encoded is None:
+            encoded = value.encode('utf-8') if isinstance(value, str) \
+                else _codec.CODEC.encode(value)
+
+        self.value: Union[dict, list, str] = value
+        self.encoded: bytes = encoded
+
+    def __repr__(self) -> str:
+        # Keeps command logs from formatting the whole value
+        return f'EncodedJson(<{len(self.encoded)} bytes>)'
+
+    @classmethod
+    def mapping(cls, objects: Mapping[str, Union['EncodedJson', dict]]
+                ) -> 'EncodedJson':
+        """Encodes a JSON object of ledger objects by their ID.
+
+        Libindy takes schemas, credential definitions and revocation states as
+        such objects (e.g. in `Anoncreds.verify_proof()`). Values that are
+        encoded already are joined into the object without encoding them
+        again.
+
+        :param objects : The ledger objects by ID.
+        """
+
+        value: Dict[str, Any] = {}
+        parts = []
+        for object_id, ledger_object in objects.items():
+            if not isinstance(ledger_object, EncodedJson):
+                ledger_object = EncodedJson(ledger_object)
+            value[object_id] = ledger_object.value
+            parts.append(json.dumps(object_id).encode('utf-8') + b':' +
+                         ledger_object.encoded)
+
+        return cls(value, b'{' + b','.join(parts) + b'}')
+
+
+class LedgerObjectCache:
+    """Keeps the encoded JSON of immutable ledger objects by their ID.
+
+    Schemas, credential definitions and revocation registry definitions never
+    change once they are written to the ledger, so their ID identifies their
+    content. The cache encodes every object once and keeps the most recently
+    used ones:
+
+        cache = LedgerObjectCache()
+        cred_def = cache.get(cred_def)
+        cred_defs = cache.mapping({cred_def_id: cred_def})
+
+    The cache can be used from multiple threads.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        :param max_size : The maximal amount of kept objects.
+            Optional; Defaults to: `256`
+        """
+
+        if max_size < 1:
+            raise ValueError(f'Maximal size has to be at least 1; got '
+                             f'{max_size}!')
+
+        self._max_size: int = max_size
+        self._objects: 'OrderedDict[str, EncodedJson]' = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    # -------------------------------------------------------------------------
+    #  Properties
+    # -------------------------------------------------------------------------
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """The amount of lookups that found the object encoded already."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The amount of lookups that had to encode the object."""
+        return self._misses
+
+    # -------------------------------------------------------------------------
+    #  Methods
+    # -------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def get(self, ledger_object: Union[EncodedJson, dict],
+            object_id: Optional[str] = None) -> EncodedJson:
+        """Returns the encoded JSON of a ledger object.
+
+        :param ledger_object : The ledger object.
+        :param object_id     : The ID of the ledger object.
+            Optional; Defaults to: The `id` field of the object
+
+        :raises ValueError: Raised if the object has no ID.
+        """
+
+        if isinstance(ledger_object, EncodedJson):
+            return ledger_object
+
+        if object_id is None:
+            object_id = ledger_object.get('id')
+            if object_id is None:
+                raise ValueError('Ledger object has no "id" field!')
+
+        with self._lock:
+            encoded_object = self._objects.get(object_id)
+            if encoded_object is not None:
+                self._objects.move_to_end(object_id)
+                self._hits += 1
+                return encoded_object
+            self._misses += 1
+
+        # Encode outside the lock; a concurrent miss only encodes twice
+        encoded_object = EncodedJson(ledger_object)
+        with self._lock:
+            self._objects[object_id] = encoded_object
+            self._objects.move_to_end(object_id)
+            if len(self._objects) > self._max_size:
+                self._objects.popitem(last=False)
+        return encoded_object
+
+    def mapping(self, objects: Mapping[str, Union[EncodedJson, dict]]
+                ) -> EncodedJson:
+        """Encodes a JSON object of ledger objects by their ID, taking the
+        ledger objects from the cache.
+
+        :param objects : The ledger objects by ID.
+        """
+
+        return EncodedJson.mapping({
+            object_id: self.get(ledger_object, object_id)
+            for object_id, ledger_object in objects.items()
+        })
+
+    def clear(self):
+        """Removes all objects from the cache."""
+        with self._lock:
+            self._objects.clear()
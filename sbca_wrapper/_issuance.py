@@ -0,0 +1,196 @@
+import asyncio
+from typing import (AsyncIterator, Dict, Iterable, Iterator, Optional, Set,
+                    Tuple, Union)
+
+from ._admission import Priority, priority
+
+# Items of a credential issuance: the credential offer, the credential request
+# and the credential values
+IssuanceItem = Tuple[Union[dict, str], Union[dict, str], Union[dict, str]]
+
+
+class IssuedCredential:
+    """The outcome of issuing one credential of a `CredentialIssuance`."""
+
+    __slots__ = ('index', 'cred', 'cred_revoc_id', 'revoc_reg_delta',
+                 'error')
+
+    def __init__(self, index: int, cred: Optional[dict] = None,
+                 cred_revoc_id: Optional[str] = None,
+                 revoc_reg_delta: Optional[dict] = None,
+                 error: Optional[Exception] = None):
+        """
+        :param index           : The position of the item in the issuance.
+        :param cred            : The issued credential.
+        :param cred_revoc_id   : The revocation ID of the credential, if the
+            credential is revocable.
+        :param revoc_reg_delta : The revocation registry delta of this
+            credential alone, if the credential is revocable.
+        :param error           : The error raised while issuing the
+            credential; all other values are `None` then.
+        """
+
+        self.index: int = index
+        self.cred: Optional[dict] = cred
+        self.cred_revoc_id: Optional[str] = cred_revoc_id
+        self.revoc_reg_delta: Optional[dict] = revoc_reg_delta
+        self.error: Optional[Exception] = error
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f'IssuedCredential(index={self.index}, ' \
+                   f'error={self.error!r})'
+        return f'IssuedCredential(index={self.index}, ' \
+               f'cred_revoc_id={self.cred_revoc_id!r})'
+
+
+class CredentialIssuance:
+    """Issues a batch of credentials with a bounded amount of calls at once.
+
+    The items are read lazily and issued with `Anoncreds.create_credential`,
+    at most `window` of them at a time. The outcomes are returned in the
+    order the credentials were issued, and the revocation registry deltas of
+    revocable credentials are merged into `revoc_reg_delta` on the way:
+
+        issuance = CredentialIssuance(wallet_handle, items, revoc_reg_id,
+                                      tails_reader_handle)
+        async for issued in issuance:
+            if issued.error is None:
+                send(issued.index, issued.cred)
+        revoc_reg_delta = issuance.revoc_reg_delta
+
+    A failed item does not stop the issuance; its error is returned instead.
+    If the iteration is left early, the credentials that are already being
+    issued are waited for once the iterator is closed, so their deltas are
+    still merged. The deltas are merged in the order Libindy returned the
+    credentials, which is the order it updated the revocation registry in.
+    """
+
+    def __init__(self, wallet_handle: int, items: Iterable[IssuanceItem],
+                 revoc_reg_id: Optional[str] = None,
+                 tails_reader_handle: Optional[int] = None,
+                 window: int = 16,
+                 command_priority: Priority = Priority.BULK):
+        """
+        :param wallet_handle       : The handle of the issuer wallet.
+        :param items               : The credential offers, requests and
+            values to issue credentials for.
+        :param revoc_reg_id        : The ID of the revocation registry the
+            credentials are issued in.
+            Optional
+        :param tails_reader_handle : The handle of the tails reader of the
+            revocation registry.
+            Optional
+        :param window              : The maximal amount of credentials that
+            are issued at once.
+            Optional; Defaults to: `16`
+        :param command_priority    : The priority of the issuance commands
+            (see `priority()`).
+            Optional; Defaults to: `Priority.BULK`
+        """
+
+        if window < 1:
+            raise ValueError(f'Window has to be at least 1; got {window}!')
+
+        self._wallet_handle: int = wallet_handle
+        self._items: Iterable[IssuanceItem] = items
+        self._revoc_reg_id: Optional[str] = revoc_reg_id
+        self._tails_reader_handle: Optional[int] = tails_reader_handle
+        self._window: int = window
+        self._priority: Priority = Priority(command_priority)
+        self._revoc_reg_delta: Optional[dict] = None
+        self._issued: int = 0
+        self._failed: int = 0
+        self._started: bool = False
+
+    # -------------------------------------------------------------------------
+    #  Properties
+    # -------------------------------------------------------------------------
+    @property
+    def revoc_reg_delta(self) -> Optional[dict]:
+        """The merged revocation registry delta of all issued credentials;
+        `None` if no revocable credential was issued yet."""
+        return self._revoc_reg_delta
+
+    @property
+    def issued(self) -> int:
+        """The amount of credentials that were issued."""
+        return self._issued
+
+    @property
+    def failed(self) -> int:
+        """The amount of items that could not be issued."""
+        return self._failed
+
+    # -------------------------------------------------------------------------
+    #  Methods
+    # -------------------------------------------------------------------------
+    def __aiter__(self) -> AsyncIterator[IssuedCredential]:
+        if self._started:
+            raise RuntimeError('A credential issuance can only be run once!')
+        self._started = True
+        return self._run()
+
+    async def _run(self) -> AsyncIterator[IssuedCredential]:
+        from ._commands.anoncreds import Anoncreds
+
+        items: Iterator[Tuple[int, IssuanceItem]] = enumerate(self._items)
+        pending: Set[asyncio.Future] = set()
+        indexes: Dict[asyncio.Future, int] = {}
+
+        # Tasks are queued as they finish, which keeps the order of their
+        # results independent of when the iteration picks them up
+        finished: asyncio.Queue = asyncio.Queue()
+
+        def issue_items():
+            with priority(self._priority):
+                while len(pending) < self._window:
+                    item = next(items, None)
+                    if item is None:
+                        return
+
+                    index, (cred_offer, cred_request, cred_values) = item
+                    task = asyncio.ensure_future(Anoncreds.create_credential(
+                        self._wallet_handle, cred_offer, cred_request,
+                        cred_values, self._revoc_reg_id,
+                        self._tails_reader_handle
+                    ))
+                    task.add_done_callback(finished.put_nowait)
+                    pending.add(task)
+                    indexes[task] = index
+
+        try:
+            issue_items()
+            while pending:
+                task = await finished.get()
+                pending.discard(task)
+                issue_items()
+                yield await self._complete(Anoncreds, indexes.pop(task), task)
+
+        finally:
+            # Credentials that are being issued take up revocation indexes,
+            # so their deltas have to be merged even if nobody waits for them
+            while pending:
+                task = await finished.get()
+                pending.discard(task)
+                await self._complete(Anoncreds, indexes.pop(task), task)
+
+    async def _complete(self, anoncreds: type, index: int,
+                        task: asyncio.Future) -> IssuedCredential:
+        try:
+            cred, cred_revoc_id, revoc_reg_delta = task.result()
+        except Exception as error:
+            self._failed += 1
+            return IssuedCredential(index, error=error)
+
+        self._issued += 1
+        if revoc_reg_delta is not None:
+            if self._revoc_reg_delta is None:
+                self._revoc_reg_delta = revoc_reg_delta
+            else:
+                self._revoc_reg_delta = \
+                    await anoncreds.merge_revocation_registry_deltas(
+                        self._revoc_reg_delta, revoc_reg_delta
+                    )
+
+        return IssuedCredential(index, cred, cred_revoc_id, revoc_reg_delta)
@@ -1,11 +1,30 @@
-import itertools
+import atexit
+import contextvars
 import json
 import logging
+import random
 import sys
-from asyncio import AbstractEventLoop, Future, get_event_loop
-from ctypes import CDLL, CFUNCTYPE, byref, c_char_p, c_int, c_void_p
-from typing import Any, Callable, Dict, Tuple
+import threading
+import weakref
+from asyncio import (AbstractEventLoop, Future, TimeoutError,
+                     get_running_loop, sleep, wait, wrap_future)
+from concurrent.futures import Future as ConcurrentFuture
+from concurrent.futures import wait as futures_wait
+from ctypes import CDLL, CFUNCTYPE, _CFuncPtr, byref, c_char_p, c_int32
+from time import perf_counter
+from typing import (Any, Callable, Dict, List, Optional, Sequence, Tuple,
+                    Union)
 
+from . import _codec
+from ._admission import COMMAND_GROUPS, AdmissionQueue
+from ._codec import JsonCodec
+from ._deadlines import remaining_time
+from ._completion import CompletionQueue
+from ._metrics import PHASE_CALLED_BACK, PHASE_COMPLETED, PHASE_SUBMITTED
+from ._native_log import NativeLogger
+from ._registry import FutureRegistry
+from ._resources import CLOSE_COMMANDS, CLOSING_COMMANDS, ResourceTracker
+from ._tracing import CommandHook, CommandSpan
 from .error import LibindyError, CommonInvalidParamError, error_code_map
 
 # Setup Logger
@@ -19,31 +38,134 @@ LOGGER.setLevel(logging.DEBUG)
 LOGGER.addHandler(_handler)
 LOGGER.propagate = False
 
+# Resources that are closed after all others, since closing them invalidates
+# the resources that were opened in them (e.g. the searches of a wallet)
+_LAST_CLOSED_RESOURCES = frozenset(('indy_close_wallet',
+                                    'indy_close_pool_ledger'))
+
+# Command handles hold the index of the registry the command is in in their
+# lowest bits and the slot of the command in that registry in the others.
+# Index 0 belongs to the blocking calls, every other index to an event loop.
+_LOOP_BITS = 10
+_LOOP_MASK = (1 << _LOOP_BITS) - 1
+
+
+class _LoopState:
+    """The pending commands and the completion queue of one event loop."""
+
+    __slots__ = ('index', 'registry', 'completion_queue', 'admission_queues')
+
+    def __init__(self, index: int, loop: AbstractEventLoop):
+        self.index: int = index
+        self.registry: FutureRegistry = FutureRegistry()
+        self.completion_queue: CompletionQueue = CompletionQueue(loop)
+        self.admission_queues: Dict[str, AdmissionQueue] = {}
+
+
+class _PendingCommand:
+    """A command that was handed to Libindy and waits for its callback."""
+
+    __slots__ = ('command', 'started', 'future', 'timings', 'context',
+                 'release')
+
+    def __init__(self, command: _CFuncPtr, future: Future,
+                 timings: Optional[List[float]],
+                 context: Optional[contextvars.Context],
+                 release: Optional[Callable[[], None]]):
+        self.command: _CFuncPtr = command
+        self.started: float = perf_counter()
+        self.future: Future = future
+        self.timings: Optional[List[float]] = timings
+        self.context: Optional[contextvars.Context] = context
+        self.release: Optional[Callable[[], None]] = release
+
+
+class _SyncWaiter:
+    """A blocking command call that waits for its callback.
+
+    The lock is acquired on creation and released by the command callback, so
+    the calling thread blocks on it until the response values are set.
+    """
+
+    __slots__ = ('command', 'started', 'lock', 'timings', 'response',
+                 'response_values')
+
+    def __init__(self, command: _CFuncPtr, timings: Optional[List[float]]):
+        self.command: _CFuncPtr = command
+        self.started: float = perf_counter()
+        self.lock: threading.Lock = threading.Lock()
+        self.lock.acquire()
+        self.timings: Optional[List[float]] = timings
+        self.response: Optional[LibindyError] = None
+        self.response_values: Optional[tuple] = None
+
+
+class _DetachedCommand:
+    """A command whose response nobody waits for anymore.
+
+    This is either a blocking call that timed out or a command that closes a
+    resource in the background. Its response is only logged; resources that
+    it opened are closed right away.
+    """
+
+    __slots__ = ('command', 'started', 'done')
+
+    def __init__(self, command: _CFuncPtr, started: float,
+                 done: Optional[ConcurrentFuture] = None):
+        self.command: _CFuncPtr = command
+        self.started: float = started
+        self.done: Optional[ConcurrentFuture] = done
+
 
 class Libindy:
     """Holds the functions for Libindy interactions."""
 
     _INSTANCE: 'Libindy' = None
     _LIBRARY: CDLL = None
+    _LIBRARY_LOCK: threading.Lock = threading.Lock()
 
-    _FUTURES: Dict[int, Tuple[AbstractEventLoop, Future]] = {}
-    _COMMAND_HANDLE_GENERATOR: itertools.count = itertools.count()
-    _FUTURES_COUNTER: itertools.count = itertools.count()
+    _SYNC_WAITERS: FutureRegistry = FutureRegistry()
+    _LOOP_STATES: Dict[AbstractEventLoop, _LoopState] = \
+        weakref.WeakKeyDictionary()
+    _LOOP_STATES_BY_INDEX: List[Optional[_LoopState]] = \
+        [None] * (_LOOP_MASK + 1)
+    _FREE_LOOP_INDEXES: List[int] = list(range(_LOOP_MASK, 0, -1))
+    _LOOP_STATES_LOCK: threading.Lock = threading.Lock()
 
     _CAN_SET_RUNTIME_CONFIG = True
 
+    _BYTES_RESULT_TYPE: type = bytes
+
+    _PHASE_TIMING: bool = False
+    _HOOKS: Tuple[CommandHook, ...] = ()
+
+    _LOG_PAYLOAD_LIMIT: int = 256
+    _LOG_SAMPLE_RATES: Dict[Optional[str], float] = {}
+
+    _CONCURRENCY_LIMITS: Dict[str, int] = {}
+
+    _COMMAND_TIMEOUTS: Dict[Optional[str], float] = {}
+    _CLOSE_FUNCTIONS: Dict[str, _CFuncPtr] = {}
+    _CLOSE_CALLBACK: Any = None
+    _WATCHDOG: Optional[threading.Thread] = None
+    _WATCHDOG_STOP: Optional[threading.Event] = None
+
+    _RESOURCES: ResourceTracker = ResourceTracker()
+    _SHUTTING_DOWN: bool = False
+
+    _NATIVE_LOG: NativeLogger = NativeLogger(NATIVE_LOGGER)
+
     # -------------------------------------------------------------------------
     #  Constructor
     # -------------------------------------------------------------------------
     def __new__(cls) -> 'Libindy':
-        """Creates or returns a Singleton instance of Libindy."""
+        """Creates or returns a Singleton instance of Libindy.
+
+        The C-library itself is only loaded when it is first used.
+        """
 
         if not Libindy._INSTANCE:
-            LOGGER.info('Building Libindy instance...')
             cls._INSTANCE = object.__new__(cls)
-            cls._LIBRARY = cls._load_library()
-            cls._set_native_logger()
-            LOGGER.info('Libindy setup complete.')
 
         return cls._INSTANCE
 
@@ -58,11 +180,48 @@ class Libindy:
     def native_logger(self) -> logging.Logger:
         return NATIVE_LOGGER
 
+    @property
+    def commands_in_flight(self) -> int:
+        """The amount of commands that wait for Libindy on all loops."""
+        with self._LOOP_STATES_LOCK:
+            loop_states = list(self._LOOP_STATES.values())
+
+        return self._SYNC_WAITERS.in_flight + sum(
+            loop_state.registry.in_flight for loop_state in loop_states
+        )
+
+    @property
+    def library(self) -> CDLL:
+        """The C-library; it is loaded and set up on first access."""
+        if self._LIBRARY is None:
+            self._setup_library()
+        return self._LIBRARY
+
     # -------------------------------------------------------------------------
     #  Methods
     # -------------------------------------------------------------------------
 
     # Libindy Setup -----------------------------------------------------------
+    @classmethod
+    def _setup_library(cls):
+
+        with cls._LIBRARY_LOCK:
+            if cls._LIBRARY is not None:
+                return
+
+            LOGGER.info('Building Libindy instance...')
+            library = cls._load_library()
+            cls._set_native_logger(library)
+
+            # The callback of detached close commands is shared by all of
+            # them, so it has to outlive every close command
+            cls._CLOSE_CALLBACK = cls._INSTANCE.create_callback(
+                CFUNCTYPE(None, c_int32, c_int32)
+            )
+            cls._LIBRARY = library
+            atexit.register(cls._INSTANCE._close_resources_at_exit)
+            LOGGER.info('Libindy setup complete.')
+
     @staticmethod
     def _load_library() -> CDLL:
 
@@ -86,34 +245,10 @@ class Libindy:
             raise
 
     @classmethod
-    def _set_native_logger(cls):
+    def _set_native_logger(cls, library: CDLL):
 
         LOGGER.info('   Setting native logger...')
-        logging.addLevelName(level=5, levelName='TRACE')
-        log_level_map = {
-            1: logging.ERROR,
-            2: logging.WARNING,
-            3: logging.INFO,
-            4: logging.DEBUG,
-            5: 5
-        }
-
-        def _log(context, level, target, message, module_path, file, line):
-            _logger = NATIVE_LOGGER.getChild(
-                suffix=target.decode().replace("::", ".")
-            )
-
-            _logger.log(
-                level=log_level_map[level],
-                msg=f'{file.decode()}:{line} | {message.decode()}'
-            )
-
-        cls._native_logger_callback = CFUNCTYPE(None, c_void_p, c_int,
-                                                c_char_p, c_char_p, c_char_p,
-                                                c_char_p, c_int)(_log)
-        getattr(cls._LIBRARY, 'indy_set_logger')(None, None,
-                                                 cls._native_logger_callback,
-                                                 None)
+        cls._NATIVE_LOG.install(library)
 
     def set_runtime_config(self, thread_pool_size: int = 4,
                            collect_backtrace: bool = True):
@@ -145,63 +280,797 @@ class Libindy:
             'collect_backtrace': collect_backtrace
         }
 
-        getattr(self._LIBRARY, 'indy_set_runtime_config')(
+        getattr(self.library, 'indy_set_runtime_config')(
             json.dumps(config).encode(encoding='utf-8')
         )
 
+    # JSON Encoding -----------------------------------------------------------
+    @property
+    def json_codec(self) -> JsonCodec:
+        return _codec.CODEC
+
+    def set_json_codec(self, codec: JsonCodec):
+        """Sets the codec that encodes and decodes JSON command values.
+
+        By default, `orjson` is used if it is installed and the `json` module
+        of the standard library otherwise.
+
+        :param codec : The codec to use for all commands.
+        """
+
+        if not isinstance(codec, JsonCodec):
+            raise TypeError(f'JSON codec has to be a JsonCodec; got '
+                            f'{type(codec)}!')
+
+        LOGGER.info(f'Setting JSON codec >>> {codec.name}')
+        _codec.CODEC = codec
+
+    # Bytes Results -----------------------------------------------------------
+    @property
+    def bytes_result_type(self) -> type:
+        return self._BYTES_RESULT_TYPE
+
+    def set_bytes_result_type(self, result_type: type):
+        """Sets the type in which all commands return binary data.
+
+        This is no zero-copy mode: Libindy frees its result buffers once the
+        command callback returns, so the data is copied out of the buffer
+        exactly once with either type. With `memoryview`, commands return a
+        read-only memoryview over that copy, so slicing it (e.g. a large
+        unpacked DIDComm message) does not create any further copies. The
+        type applies to every command of the process.
+
+        :param result_type : Either `bytes` or `memoryview`.
+            Optional; Defaults to: `bytes`
+        """
+
+        if result_type not in (bytes, memoryview):
+            raise ValueError(f'Bytes result type has to be bytes or '
+                             f'memoryview; got {result_type}!')
+
+        Libindy._BYTES_RESULT_TYPE = result_type
+
+    # Tracing Hooks -----------------------------------------------------------
+    @property
+    def hooks(self) -> Tuple[CommandHook, ...]:
+        return self._HOOKS
+
+    def add_hook(self, hook: CommandHook):
+        """Registers a hook that receives the events of every command call.
+
+        While no hooks are registered, command calls skip all hook handling.
+
+        :param hook : The hook to register.
+        """
+
+        if not isinstance(hook, CommandHook):
+            raise TypeError(f'Hook has to be a CommandHook; got '
+                            f'{type(hook)}!')
+
+        Libindy._HOOKS = self._HOOKS + (hook,)
+
+    def remove_hook(self, hook: CommandHook):
+        """Unregisters a hook.
+
+        :param hook : The hook to unregister.
+
+        :raises ValueError: Raised if the hook is not registered.
+        """
+
+        if hook not in self._HOOKS:
+            raise ValueError(f'Hook {hook!r} is not registered!')
+
+        Libindy._HOOKS = tuple(registered_hook
+                               for registered_hook in self._HOOKS
+                               if registered_hook is not hook)
+
+    # Phase Timing ------------------------------------------------------------
+    @property
+    def phase_timing(self) -> bool:
+        return self._PHASE_TIMING
+
+    def set_phase_timing(self, enabled: bool):
+        """Enables or disables the timing of command phases.
+
+        With phase timing, every command call is split into the phases below,
+        which are collected per command in the `METRICS` registry:
+            encode  : Encoding the arguments to C-types.
+            submit  : Handing the command over to Libindy.
+            native  : Waiting in Libindy's thread pool and running the
+                command. Libindy does not report when a queued command is
+                picked up, so both are measured together.
+            handoff : Passing the result from the Libindy thread to the
+                event loop.
+            decode  : Resuming the caller and decoding the response.
+
+        :param enabled : Whether command phases should be timed.
+        """
+
+        LOGGER.info(f'Setting phase timing >>> {enabled}')
+        Libindy._PHASE_TIMING = enabled
+
+    # Command Logging ---------------------------------------------------------
+    def set_command_logging(self, payload_limit: Optional[int] = None,
+                            sample_rate: Optional[float] = None,
+                            command_name: Optional[str] = None):
+        """Configures the INFO logs that are written for every command call.
+
+        Command logs are only built if the Libindy logger is enabled for INFO.
+
+        :param payload_limit : The maximal amount of characters an argument or
+            the response of a command may take up in the log.
+            Optional; Defaults to: `256`
+        :param sample_rate   : The fraction of command calls that are logged,
+            between `0.0` (none) and `1.0` (all).
+            Optional; Defaults to: `1.0`
+        :param command_name  : The Libindy name of the command to set the
+            sample rate for. If not set, the sample rate applies to every
+            command without its own sample rate.
+            Optional
+        """
+
+        if payload_limit is not None:
+            if payload_limit < 1:
+                raise ValueError(f'Payload limit has to be at least 1; got '
+                                 f'{payload_limit}!')
+            Libindy._LOG_PAYLOAD_LIMIT = payload_limit
+
+        if sample_rate is not None:
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError(f'Sample rate has to be between 0.0 and '
+                                 f'1.0; got {sample_rate}!')
+            self._LOG_SAMPLE_RATES[command_name] = sample_rate
+
+    @property
+    def log_payload_limit(self) -> int:
+        return self._LOG_PAYLOAD_LIMIT
+
+    def sample_command_log(self, command_name: str) -> bool:
+        """Decides whether a call of a command should be logged.
+
+        :param command_name : The Libindy name of the command.
+
+        :returns: Whether the call should be logged.
+        """
+
+        sample_rates = self._LOG_SAMPLE_RATES
+        sample_rate = sample_rates.get(command_name,
+                                       sample_rates.get(None, 1.0))
+        return sample_rate >= 1.0 or random.random() < sample_rate
+
+    # Native Logging ----------------------------------------------------------
+    def update_native_log_level(self):
+        """Passes the levels of the native loggers on to Libindy.
+
+        Libindy drops records below the lowest level of the native loggers
+        before they reach Python, if it implements `indy_set_log_max_lvl`.
+        Level changes are passed on automatically once Libindy is loaded, so
+        this is only needed to force an update.
+        """
+
+        self._NATIVE_LOG.update_level()
+
+    def set_native_log_queue(self, enabled: bool):
+        """Enables or disables writing native logs on a background thread.
+
+        With the queue, the threads of Libindy only hand the log records over;
+        the handlers of the Libindy logger format and write them on a listener
+        thread. Handlers added to the Libindy logger later on are not used for
+        native records until the queue is disabled and enabled again.
+
+        :param enabled : Whether native log records should be queued.
+        """
+
+        LOGGER.info(f'Setting native log queue >>> {enabled}')
+        self._NATIVE_LOG.set_queue(enabled)
+
+    # Admission Control -------------------------------------------------------
+    @property
+    def concurrency_limits(self) -> Dict[str, int]:
+        return dict(self._CONCURRENCY_LIMITS)
+
+    def set_concurrency_limit(self, command_group: str,
+                              limit: Optional[int]):
+        """Limits how many commands of a group run in Libindy at once.
+
+        The limit applies per event loop. Commands over the limit wait in the
+        order they were called until a running command of the group finished;
+        the time they wait is collected as `queue_wait` in `METRICS`. Blocking
+        commands (see `sbca_wrapper.sync`) are not limited.
+
+        :param command_group : The group of commands to limit, which is the
+            name of the module that defines them (`anoncreds`, `crypto`,
+            `ledger`, `wallet`, ...).
+        :param limit         : The maximal amount of commands of the group
+            that run at once; `None` removes the limit.
+        """
+
+        if command_group not in COMMAND_GROUPS:
+            raise ValueError(f'Unknown command group {command_group!r}; has '
+                             f'to be one of {", ".join(COMMAND_GROUPS)}!')
+        if limit is not None and limit < 1:
+            raise ValueError(f'Concurrency limit has to be at least 1; got '
+                             f'{limit}!')
+
+        LOGGER.info(f'Setting concurrency limit >>> '
+                    f'{command_group}={limit}')
+        if limit is None:
+            self._CONCURRENCY_LIMITS.pop(command_group, None)
+        else:
+            self._CONCURRENCY_LIMITS[command_group] = limit
+
+        # Queues are owned by their loops, so they are updated from there
+        with self._LOOP_STATES_LOCK:
+            loop_states = list(self._LOOP_STATES.values())
+        for loop_state in loop_states:
+            admission_queue = loop_state.admission_queues.get(command_group)
+            loop = loop_state.completion_queue.loop
+            if admission_queue is not None and loop is not None and \
+                    not loop.is_closed():
+                loop.call_soon_threadsafe(admission_queue.set_limit, limit)
+
+    def get_admission_queue(self, command_group: str
+                            ) -> Optional[AdmissionQueue]:
+        """Returns the admission queue of a command group on the running loop.
+
+        :param command_group : The group of commands.
+
+        :returns: The admission queue; `None` if the group has no limit.
+        """
+
+        limit = self._CONCURRENCY_LIMITS.get(command_group)
+        if limit is None:
+            return None
+
+        admission_queues = self._get_loop_state(
+            get_running_loop()
+        ).admission_queues
+        admission_queue = admission_queues.get(command_group)
+        if admission_queue is None:
+            admission_queue = admission_queues[command_group] = \
+                AdmissionQueue(limit)
+        return admission_queue
+
+    # Deadlines ---------------------------------------------------------------
+    def set_command_timeout(self, timeout: Optional[float],
+                            command_name: Optional[str] = None):
+        """Sets the default time a command may take in Libindy.
+
+        Commands that take longer raise an `asyncio.TimeoutError`. If a
+        deadline is set for the calling context (see `deadline()`), the
+        earlier of both applies. When a timed out command finishes later on,
+        the resource it opened (wallet, pool or search handle) is closed.
+
+        :param timeout      : The timeout in seconds; `None` removes it.
+        :param command_name : The Libindy name of the command to set the
+            timeout for. If not set, the timeout applies to every command
+            without its own timeout.
+            Optional
+        """
+
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f'Timeout has to be positive; got {timeout}!')
+
+        LOGGER.info(f'Setting command timeout >>> '
+                    f'{command_name or "default"}={timeout}')
+        if timeout is None:
+            self._COMMAND_TIMEOUTS.pop(command_name, None)
+        else:
+            self._COMMAND_TIMEOUTS[command_name] = timeout
+
+    def command_timeout(self, command_name: str) -> Optional[float]:
+        """Returns the time a command call may take from now on.
+
+        :param command_name : The Libindy name of the command.
+
+        :returns: The timeout in seconds; `None` if the call has none.
+        """
+
+        timeouts = self._COMMAND_TIMEOUTS
+        timeout = timeouts.get(command_name, timeouts.get(None))
+        time_left = remaining_time()
+        if time_left is not None and (timeout is None or time_left < timeout):
+            timeout = time_left
+        return timeout
+
+    # Watchdog ----------------------------------------------------------------
+    def stuck_commands(self, threshold: float) -> List[Tuple[str, float]]:
+        """Returns the commands that are in flight for too long.
+
+        :param threshold : The time in seconds after which a command counts
+            as stuck.
+
+        :returns: The Libindy name and the time in flight of every stuck
+            command, longest first.
+        """
+
+        with self._LOOP_STATES_LOCK:
+            registries = [self._SYNC_WAITERS] + [
+                loop_state.registry
+                for loop_state in self._LOOP_STATES.values()
+            ]
+
+        now = perf_counter()
+        stuck_commands = [
+            (entry.command.__name__, now - entry.started)
+            for registry in registries for entry in registry.entries()
+            if now - entry.started >= threshold
+        ]
+        return sorted(stuck_commands, key=lambda command: -command[1])
+
+    def start_watchdog(self, threshold: float = 30.0,
+                       interval: Optional[float] = None):
+        """Starts a thread that logs the commands that are stuck in Libindy.
+
+        :param threshold : The time in seconds after which a command counts
+            as stuck.
+            Optional; Defaults to: `30.0`
+        :param interval  : The seconds between two checks.
+            Optional; Defaults to: `threshold`
+        """
+
+        self.stop_watchdog()
+        LOGGER.info(f'Starting watchdog >>> threshold={threshold}')
+
+        stop_event = threading.Event()
+
+        def watch():
+            while not stop_event.wait(interval or threshold):
+                for command_name, duration in self.stuck_commands(threshold):
+                    LOGGER.warning(f'Command {command_name} is in flight '
+                                   f'for {duration:.1f}s!')
+
+        Libindy._WATCHDOG_STOP = stop_event
+        Libindy._WATCHDOG = threading.Thread(target=watch, daemon=True,
+                                             name='libindy-watchdog')
+        self._WATCHDOG.start()
+
+    def stop_watchdog(self):
+        """Stops the watchdog thread if it is running."""
+        if self._WATCHDOG is not None:
+            self._WATCHDOG_STOP.set()
+            self._WATCHDOG.join()
+            Libindy._WATCHDOG = Libindy._WATCHDOG_STOP = None
+
+    # Shutdown ----------------------------------------------------------------
+    @property
+    def open_resources(self) -> List[Tuple[str, int]]:
+        """The resources that are open in Libindy.
+
+        Every resource is given as the Libindy name of the command that
+        closes it and its handle, e.g. `('indy_close_wallet', 3)`.
+        """
+        return self._RESOURCES.resources()
+
+    async def shutdown(self, timeout: float = 30.0) -> bool:
+        """Stops running commands and closes all open resources.
+
+        New commands are rejected right away. Then the commands in flight
+        (on all loops) are given time to finish, after which all open
+        searches and then all open wallets and pools are closed
+        concurrently. Resources that commands in flight open during the
+        shutdown (also after the timeout) are closed as soon as they arrive;
+        their callers get a `RuntimeError` instead of the handle.
+
+        :param timeout : The seconds to wait for the commands in flight and
+            for closing the resources, each.
+            Optional; Defaults to: `30.0`
+
+        :returns: Whether all commands finished and all resources were
+            closed in time.
+        """
+
+        LOGGER.info(f'Shutting down Libindy >>> timeout={timeout}')
+        Libindy._SHUTTING_DOWN = True
+        loop = get_running_loop()
+
+        # Wait for the commands in flight to finish
+        drain_deadline = loop.time() + timeout
+        while self.commands_in_flight and loop.time() < drain_deadline:
+            await sleep(0.01)
+
+        drained = not self.commands_in_flight
+        if not drained:
+            LOGGER.warning(f'{self.commands_in_flight} command(s) still in '
+                           f'flight after {timeout}s!')
+
+        # Searches have to be closed before the wallets they belong to
+        resources = self._RESOURCES.resources()
+        closed = True
+        for resources_to_close in (
+                [resource for resource in resources
+                 if resource[0] not in _LAST_CLOSED_RESOURCES],
+                [resource for resource in resources
+                 if resource[0] in _LAST_CLOSED_RESOURCES]):
+            if not resources_to_close:
+                continue
+
+            done, pending = await wait(
+                [wrap_future(self._close_detached(*resource))
+                 for resource in resources_to_close],
+                timeout=timeout
+            )
+            closed = closed and not pending and \
+                all(future.result() for future in done)
+
+        if not closed:
+            LOGGER.warning('Not all open resources could be closed!')
+        LOGGER.info('Libindy shut down.')
+        return drained and closed
+
+    def _close_resources_at_exit(self):
+        resources = self._RESOURCES.resources()
+        if not resources:
+            return
+
+        LOGGER.info(f'Closing {len(resources)} open resource(s) at exit...')
+        Libindy._SHUTTING_DOWN = True
+        futures_wait([self._close_detached(*resource)
+                      for resource in resources], timeout=5.0)
+
     # Libindy Command Running -------------------------------------------------
-    def __call__(self, command_name: str, *command_args) -> Future:
+    def __call__(self, command: Union[str, _CFuncPtr], *command_args,
+                 timings: Optional[List[float]] = None,
+                 span: Optional[CommandSpan] = None,
+                 timeout: Optional[float] = None,
+                 release: Optional[Callable[[], None]] = None) -> Future:
         """Calls a function in the C-library.
 
-        :param command_name : The name of the command to call.
+        :param command      : The command to call. This is either a function
+            that was bound with `bind_command()` or the name of the command.
+            Bound functions skip the symbol lookup and use their own argument
+            types for the conversion of the arguments.
         :param command_args : The C-type encoded arguments of the command.
+        :param timings      : A list of phase timestamps (see `_metrics`) to
+            fill in while the command runs.
+            Optional
+        :param span         : The span that dispatches the command events to
+            the registered hooks. If set, the completion of the command is
+            run in a copy of the caller's context.
+            Optional
+        :param timeout      : The seconds after which the future raises an
+            `asyncio.TimeoutError`. Resources opened by the command are
+            closed once it finished.
+            Optional
+        :param release      : Frees the admission slot of the command (see
+            `_admission`). It is called exactly once: when Libindy responded,
+            even if the caller gave up on the command before, or right away if
+            the command could not be handed over to Libindy.
+            Optional
 
         :returns: The command response wrapped as an asyncio.Future object.
 
         :raises NotImplementedError: Raised if the C-Library does not implement
-            the command with the name `command_name`.
+            the command with the name `command`.
+        :raises RuntimeError: Raised if no event loop is running in the
+            calling thread or if Libindy is shutting down.
         """
 
-        if not hasattr(self._LIBRARY, command_name):
-            raise NotImplementedError(f'Libindy does not implement this '
-                                      f'command: {command_name}!')
+        loop_state = command_slot = None
+        try:
+            if isinstance(command, str):
+                if not hasattr(self.library, command):
+                    raise NotImplementedError(f'Libindy does not implement '
+                                              f'this command: {command}!')
+                command = getattr(self.library, command)
 
-        self._CAN_SET_RUNTIME_CONFIG = False
+            if self._SHUTTING_DOWN:
+                raise self._get_shutdown_error()
+            self._CAN_SET_RUNTIME_CONFIG = False
 
-        loop = get_event_loop()
-        command_future = loop.create_future()
-        command_handle = next(self._FUTURES_COUNTER)
-        self._FUTURES[command_handle] = (loop, command_future)
+            loop = get_running_loop()
+            loop_state = self._get_loop_state(loop)
+            command_future = loop.create_future()
+            if timeout is not None and timeout <= 0:
+                if release is not None:
+                    release()
+                command_future.set_exception(
+                    self._get_timeout_error(command)
+                )
+                return command_future
 
-        response_code: int = getattr(self._LIBRARY, command_name)(
-            command_handle, *command_args
-        )
+            command_slot = loop_state.registry.add(_PendingCommand(
+                command, command_future, timings,
+                None if span is None else contextvars.copy_context(), release
+            ))
+            command_handle = command_slot << _LOOP_BITS | loop_state.index
+
+            # Arguments of the wrong type only fail here (ctypes.ArgumentError)
+            response_code: int = command(command_handle, *command_args)
+        except BaseException:
+            # No callback will come for a command that was not handed over
+            if command_slot is not None:
+                loop_state.registry.pop(command_slot)
+            if release is not None:
+                release()
+            raise
+
+        if timings is not None:
+            timings[PHASE_SUBMITTED] = perf_counter()
+        if span is not None and response_code == 0:
+            span.submitted(command_handle)
 
         if response_code != 0:
             LOGGER.error(f'Libindy responded with code {response_code}!')
+            loop_state.registry.pop(command_slot)
+            if release is not None:
+                release()
             command_future.set_exception(self._get_indy_error(response_code))
+            return command_future
+
+        if command.__name__ in CLOSING_COMMANDS:
+            self._RESOURCES.closed(command.__name__, command_args[0])
+        if timeout is not None:
+            timer = loop.call_later(timeout, self._expire_command,
+                                    command_future, command)
+            command_future.add_done_callback(lambda _: timer.cancel())
 
         return command_future
 
+    def call_sync(self, command: _CFuncPtr, *command_args,
+                  timings: Optional[List[float]] = None,
+                  span: Optional[CommandSpan] = None,
+                  timeout: Optional[float] = None) -> Optional[tuple]:
+        """Calls a function in the C-library and blocks until it finished.
+
+        The command callback wakes up the calling thread directly, so no
+        event loop is needed. Commands can be called from many threads in
+        parallel, but calling them on a thread that runs an event loop blocks
+        that loop.
+
+        :param command      : The command to call. This is a function that
+            was bound with `bind_command()`.
+        :param command_args : The C-type encoded arguments of the command.
+        :param timings      : A list of phase timestamps (see `_metrics`) to
+            fill in while the command runs.
+            Optional
+        :param span         : The span that dispatches the command events to
+            the registered hooks.
+            Optional
+        :param timeout      : The seconds after which the call raises an
+            `asyncio.TimeoutError`. Resources opened by the command are
+            closed once it finished.
+            Optional
+
+        :returns: The command response values; `None` if there are none.
+
+        :raises LibindyError: Raised if Libindy responded with an error.
+        :raises asyncio.TimeoutError: Raised if the command did not finish in
+            time.
+        """
+
+        if self._SHUTTING_DOWN:
+            raise self._get_shutdown_error()
+        self._CAN_SET_RUNTIME_CONFIG = False
+
+        if timeout is not None and timeout <= 0:
+            raise self._get_timeout_error(command)
+
+        sync_waiter = _SyncWaiter(command, timings)
+        command_slot = self._SYNC_WAITERS.add(sync_waiter)
+        command_handle = command_slot << _LOOP_BITS
+
+        try:
+            response_code: int = command(command_handle, *command_args)
+        except BaseException:
+            self._SYNC_WAITERS.pop(command_slot)
+            raise
+        if timings is not None:
+            timings[PHASE_SUBMITTED] = perf_counter()
+
+        if response_code != 0:
+            LOGGER.error(f'Libindy responded with code {response_code}!')
+            self._SYNC_WAITERS.pop(command_slot)
+            raise self._get_indy_error(response_code)
+
+        if command.__name__ in CLOSING_COMMANDS:
+            self._RESOURCES.closed(command.__name__, command_args[0])
+        if span is not None:
+            span.submitted(command_handle)
+
+        if not sync_waiter.lock.acquire(
+                timeout=-1 if timeout is None else timeout):
+
+            # Unless the callback took the waiter in the meantime, it is
+            # detached, so the callback closes what the command opened
+            if self._SYNC_WAITERS.replace(
+                    command_slot, sync_waiter,
+                    _DetachedCommand(command, sync_waiter.started)):
+                raise self._get_timeout_error(command)
+            sync_waiter.lock.acquire()
+
+        if timings is not None:
+            timings[PHASE_COMPLETED] = perf_counter()
+
+        if sync_waiter.response.indy_code != 0:
+            raise sync_waiter.response
+        if command.__name__ in CLOSE_COMMANDS:
+            if self._SHUTTING_DOWN:
+                self._complete_detached(command, sync_waiter.response,
+                                        sync_waiter.response_values)
+                raise self._get_shutdown_error()
+            self._RESOURCES.opened(command.__name__,
+                                   sync_waiter.response_values[0])
+        return sync_waiter.response_values
+
+    def _get_loop_state(self, loop: AbstractEventLoop) -> _LoopState:
+        loop_state = self._LOOP_STATES.get(loop)
+        if loop_state is not None:
+            return loop_state
+
+        with self._LOOP_STATES_LOCK:
+            loop_state = self._LOOP_STATES.get(loop)
+            if loop_state is None:
+                if not self._FREE_LOOP_INDEXES:
+                    raise RuntimeError(f'Libindy can not run commands on more '
+                                       f'than {_LOOP_MASK} event loops at '
+                                       f'once!')
+
+                loop_state = _LoopState(self._FREE_LOOP_INDEXES.pop(), loop)
+                self._LOOP_STATES[loop] = loop_state
+                self._LOOP_STATES_BY_INDEX[loop_state.index] = loop_state
+                weakref.finalize(loop, Libindy._release_loop_state,
+                                 loop_state)
+
+        return loop_state
+
+    @classmethod
+    def _release_loop_state(cls, loop_state: _LoopState):
+        with cls._LOOP_STATES_LOCK:
+            cls._LOOP_STATES_BY_INDEX[loop_state.index] = None
+
+            # Callbacks of commands that are still running would be delivered
+            # to the next loop on this index, so it is only reused if there
+            # are none
+            if loop_state.registry.in_flight:
+                LOGGER.warning(f'Event loop was released with '
+                               f'{loop_state.registry.in_flight} command(s) '
+                               f'in flight!')
+            else:
+                cls._FREE_LOOP_INDEXES.append(loop_state.index)
+
     def _run_callback(self, command_handle: int, response: LibindyError,
-                      *response_values):
-        loop, _ = self._FUTURES[command_handle]
-        loop.call_soon_threadsafe(self._loop_callback, command_handle,
-                                  response, *response_values)
+                      *response_values, called_back: float = None):
+        command_slot = command_handle >> _LOOP_BITS
+        loop_index = command_handle & _LOOP_MASK
+
+        # Blocking calls are woken up directly from the Libindy thread
+        if not loop_index:
+            sync_waiter = self._SYNC_WAITERS.pop(command_slot)
+            if type(sync_waiter) is _DetachedCommand:
+                self._complete_detached(sync_waiter.command, response,
+                                        response_values)
+                if sync_waiter.done is not None:
+                    sync_waiter.done.set_result(response.indy_code == 0)
+                return
+
+            if sync_waiter.timings is not None:
+                sync_waiter.timings[PHASE_CALLED_BACK] = called_back
+            sync_waiter.response = response
+            sync_waiter.response_values = response_values or None
+            sync_waiter.lock.release()
+            return
+
+        loop_state = self._LOOP_STATES_BY_INDEX[loop_index]
+        if loop_state is None:
+            LOGGER.warning(f'Event loop of command {command_handle} is gone; '
+                           f'dropping its response!')
+            return
+
+        pending_command = loop_state.registry.get(command_slot)
+        if pending_command.timings is not None:
+            pending_command.timings[PHASE_CALLED_BACK] = called_back
+
+        if pending_command.context is None:
+            queued = loop_state.completion_queue.put(
+                self._loop_callback, loop_state, command_slot, response,
+                *response_values
+            )
+        else:
+            queued = loop_state.completion_queue.put(
+                pending_command.context.run, self._loop_callback, loop_state,
+                command_slot, response, *response_values
+            )
+
+        if not queued:
+            loop_state.registry.pop(command_slot)
+            LOGGER.warning(f'Event loop of command {command_handle} is '
+                           f'closed; dropping its response!')
+            self._complete_detached(pending_command.command, response,
+                                    response_values)
+
+    def _loop_callback(self, loop_state: _LoopState, command_slot: int,
+                       response: LibindyError, *response_values):
+
+        pending_command = loop_state.registry.pop(command_slot)
+        if pending_command.timings is not None:
+            pending_command.timings[PHASE_COMPLETED] = perf_counter()
 
-    def _loop_callback(self, command_handle: int, response: LibindyError,
-                       *response_values):
+        # The command only stops taking up its admission slot now, even if
+        # its caller timed out or was cancelled before
+        if pending_command.release is not None:
+            pending_command.release()
 
-        _, future = self._FUTURES.pop(command_handle)
+        future = pending_command.future
         response_values = None if not response_values else response_values
 
-        if not future.cancelled():
+        if not future.done():
             if response.indy_code == 0:
+                command_name = pending_command.command.__name__
+                if command_name in CLOSE_COMMANDS:
+                    if self._SHUTTING_DOWN:
+                        self._complete_detached(pending_command.command,
+                                                response, response_values)
+                        future.set_exception(self._get_shutdown_error())
+                        return
+                    self._RESOURCES.opened(command_name, response_values[0])
                 future.set_result(response_values)
             else:
                 future.set_exception(response)
         else:
-            LOGGER.warning('Future was cancelled before callback execution!\n')
+            LOGGER.warning(f'Caller of {pending_command.command.__name__} '
+                           f'gave up before the command finished!')
+            self._complete_detached(pending_command.command, response,
+                                    response_values)
+
+    def _expire_command(self, future: Future, command: _CFuncPtr):
+        if not future.done():
+            future.set_exception(self._get_timeout_error(command))
+
+    @staticmethod
+    def _get_timeout_error(command: _CFuncPtr) -> TimeoutError:
+        return TimeoutError(f'Command {command.__name__} did not finish in '
+                            f'time!')
+
+    @staticmethod
+    def _get_shutdown_error() -> RuntimeError:
+        return RuntimeError('Libindy is shutting down!')
+
+    def _complete_detached(self, command: _CFuncPtr, response: LibindyError,
+                           response_values: tuple):
+        if response.indy_code != 0:
+            LOGGER.warning(f'Detached command {command.__name__} failed: '
+                           f'{response!r}')
+            return
+
+        close_command_name = CLOSE_COMMANDS.get(command.__name__)
+        if close_command_name is not None and response_values:
+            LOGGER.info(f'Closing resource {response_values[0]} of detached '
+                        f'command {command.__name__}...')
+            self._close_detached(close_command_name, response_values[0])
+
+    def _close_detached(self, close_command_name: str, resource_handle: int
+                        ) -> ConcurrentFuture:
+        """Closes a resource without waiting for the result.
+
+        This is safe to call from any thread, including the Libindy threads.
+
+        :returns: A future that is set to whether the resource was closed.
+        """
+
+        self._RESOURCES.closed(close_command_name, resource_handle)
+
+        close_function = self._CLOSE_FUNCTIONS.get(close_command_name)
+        if close_function is None:
+            close_function = self.bind_command(
+                close_command_name, (c_int32,), type(self._CLOSE_CALLBACK)
+            )
+            self._CLOSE_FUNCTIONS[close_command_name] = close_function
+
+        done = ConcurrentFuture()
+        command_slot = self._SYNC_WAITERS.add(
+            _DetachedCommand(close_function, perf_counter(), done)
+        )
+        response_code: int = close_function(command_slot << _LOOP_BITS,
+                                            resource_handle,
+                                            self._CLOSE_CALLBACK)
+        if response_code != 0:
+            self._SYNC_WAITERS.pop(command_slot)
+            LOGGER.error(f'Could not close resource {resource_handle} with '
+                         f'{close_command_name}: code {response_code}!')
+            done.set_result(False)
+
+        return done
 
     def _get_indy_error(self, response_code: int) -> LibindyError:
 
@@ -211,7 +1080,7 @@ class Libindy:
 
         # Get and return error data
         c_error = c_char_p()
-        getattr(self._LIBRARY, 'indy_get_current_error')(byref(c_error))
+        getattr(self.library, 'indy_get_current_error')(byref(c_error))
         error_details: dict = json.loads(c_error.value.decode())
 
         # Get error type
@@ -239,13 +1108,47 @@ class Libindy:
         """
 
         def callback(handle: int, code: int, *values) -> Any:
+            called_back = perf_counter()
             if cb_transform_fn:
                 values = cb_transform_fn(*values)
             response = self._get_indy_error(code)
-            self._run_callback(handle, response, *values)
+            self._run_callback(handle, response, *values,
+                               called_back=called_back)
 
         return cb_signature(callback)
 
+    def bind_command(self, command_name: str,
+                     arg_types: Optional[Sequence[type]] = None,
+                     cb_signature: Optional[type] = None) -> _CFuncPtr:
+        """Resolves a command in the C-library and sets its C-signature.
+
+        Every call of this method returns a new function object, so the types
+        set on it do not affect other users of the same command.
+
+        :param command_name : The name of the command.
+        :param arg_types    : The C-types of the command arguments, excluding
+            the command handle and the callback. If not set, ctypes will
+            convert the arguments without type information.
+        :param cb_signature : The C-signature of the command callback. Has to
+            be set if `arg_types` is set.
+
+        :returns: The bound C-function.
+
+        :raises NotImplementedError: Raised if the C-Library does not implement
+            the command with the name `command_name`.
+        """
+
+        if not self.implements_command(command_name):
+            raise NotImplementedError(f'Libindy does not implement this '
+                                      f'command: {command_name}!')
+
+        function = self.library[command_name]
+        function.restype = c_int32
+        if arg_types is not None:
+            function.argtypes = (c_int32, *arg_types, cb_signature)
+
+        return function
+
     def implements_command(self, command_name: str) -> bool:
         """Checks if Libindy implements a specific command.
 
@@ -253,7 +1156,7 @@ class Libindy:
 
         :returns: Whether the command is implemented in Libindy.
         """
-        return hasattr(self._LIBRARY, command_name)
+        return hasattr(self.library, command_name)
 
     # Various -----------------------------------------------------------------
 
@@ -0,0 +1,175 @@
+import importlib
+import inspect
+import os
+import sys
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+# Types that can appear in command signatures by their name in the manifest
+TYPES = {
+    'str': str,
+    'dict_or_str': Union[dict, str],
+    'list_or_str': Union[list, str],
+    'int': int,
+    'bool': bool,
+    'bytes': bytes,
+    'dict': dict,
+    'list': list
+}
+_TYPE_NAMES = {value: name for name, value in TYPES.items()}
+
+_MANIFEST_MODULE = f'{__package__}._manifest_data'
+_MANIFEST_PATH = os.path.join(os.path.dirname(__file__), '_manifest_data.py')
+_MANIFEST_HEADER = '# Generated by `python -m sbca_wrapper._manifest`; ' \
+                   'do not edit.'
+
+# Command signature as stored in the manifest: the Libindy command name, the
+# arguments as (name, type name, optional) and the return values as
+# (type name, optional)
+Signature = Tuple[str, Tuple[Tuple[str, str, bool], ...],
+                  Tuple[Tuple[str, bool], ...]]
+
+_COMMANDS: Optional[Dict[str, Signature]] = None
+
+
+def load(command_name: str, command: Callable) -> Optional[Signature]:
+    """Returns the manifest signature of a command.
+
+    The command name and the argument names are compared to the command
+    function; the names are read from its code object, which is much cheaper
+    than signature introspection. The stored types are used as they are, so
+    changed annotations are only found by `python -m sbca_wrapper._manifest
+    --check`, which runs in CI.
+
+    :param command_name : The Libindy name of the command.
+    :param command      : The command function.
+
+    :returns: The signature of the command; `None` if the manifest has no
+        matching entry.
+    """
+
+    global _COMMANDS
+    if _COMMANDS is None:
+        try:
+            _COMMANDS = importlib.import_module(_MANIFEST_MODULE).COMMANDS
+        except ImportError:
+            _COMMANDS = {}
+
+    signature = _COMMANDS.get(command.__qualname__)
+    if signature is None or signature[0] != command_name:
+        return None
+
+    code = command.__code__
+    arg_names = code.co_varnames[:code.co_argcount]
+    if len(arg_names) != len(signature[1]) or \
+            any(arg[0] != name for arg, name in zip(signature[1], arg_names)):
+        return None
+
+    return signature
+
+
+def describe(command_name: str, command: Callable) -> Signature:
+    """Reads the signature of a command function by introspection.
+
+    :param command_name : The Libindy name of the command.
+    :param command      : The command function.
+
+    :raises TypeError: Raised if an argument or return type is not supported.
+    """
+
+    full_arg_spec = inspect.getfullargspec(command)
+    annotations = full_arg_spec.annotations
+
+    args = []
+    for name in full_arg_spec.args:
+        optional, type_name = _describe_type(annotations[name])
+        args.append((name, type_name, optional))
+
+    # Map to tuple for streamlined processing
+    return_types = annotations.get('return') or ()
+    if not isinstance(return_types, tuple):
+        return_types = (return_types,)
+
+    returns = []
+    for return_type in return_types:
+        optional, type_name = _describe_type(return_type)
+        returns.append((type_name, optional))
+
+    return command_name, tuple(args), tuple(returns)
+
+
+def generate() -> Dict[str, Signature]:
+    """Builds the manifest from the signatures of all command functions."""
+    from . import _COMMAND_CLASSES
+    from ._command import REGISTERED_COMMANDS
+
+    for module_name in sorted(set(_COMMAND_CLASSES.values())):
+        importlib.import_module(f'sbca_wrapper._commands.{module_name}')
+
+    return {qualname: describe(libindy_command.command_name, command)
+            for qualname, (libindy_command, command)
+            in sorted(REGISTERED_COMMANDS.items())}
+
+
+def _describe_type(spec: Any) -> Tuple[bool, str]:
+    optional = False
+
+    # Remove "None" from Optionals
+    if getattr(spec, '__origin__', None) is Union and \
+            type(None) in spec.__args__:
+        optional = True
+        spec = Union[tuple(t for t in spec.__args__ if t is not type(None))]
+
+    type_name = _TYPE_NAMES.get(spec)
+    if type_name is None:
+        raise TypeError(f'Unsupported type {spec}!')
+    return optional, type_name
+
+
+def _format(commands: Dict[str, Signature]) -> str:
+    lines = [_MANIFEST_HEADER, 'COMMANDS = {']
+    for qualname, (command_name, args, returns) in commands.items():
+        lines.extend((f'    {qualname!r}: (', f'        {command_name!r},'))
+        if args:
+            lines.append('        (')
+            lines.extend(f'            {arg!r},' for arg in args)
+            lines.append('        ),')
+        else:
+            lines.append('        (),')
+        lines.extend((f'        {returns!r}', '    ),'))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv: list) -> int:
+    """Writes the manifest, or with `--check` only compares it.
+
+    :param argv : The command line arguments.
+
+    :returns: The exit code; `1` if `--check` found the manifest outdated.
+    """
+
+    check = '--check' in argv
+    source = _format(generate())
+
+    try:
+        with open(_MANIFEST_PATH) as manifest_file:
+            current_source = manifest_file.read()
+    except FileNotFoundError:
+        current_source = None
+
+    if source == current_source:
+        print('Command manifest is up to date.')
+        return 0
+    if check:
+        print('Command manifest is outdated; run `python -m '
+              'sbca_wrapper._manifest` to regenerate it.', file=sys.stderr)
+        return 1
+
+    with open(_MANIFEST_PATH, 'w') as manifest_file:
+        manifest_file.write(source)
+    print(f'Command manifest written to {_MANIFEST_PATH}.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
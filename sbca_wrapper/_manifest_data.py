@@ -0,0 +1,1136 @@
+# Generated by `python -m sbca_wrapper._manifest`; do not edit.
+COMMANDS = {
+    'Anoncreds.close_credential_search': (
+        'indy_prover_close_credentials_search',
+        (
+            ('search_handle', 'int', False),
+        ),
+        ()
+    ),
+    'Anoncreds.close_proof_request_search': (
+        'indy_prover_close_credentials_search_for_proof_req',
+        (
+            ('search_handle', 'int', False),
+        ),
+        ()
+    ),
+    'Anoncreds.create_credential': (
+        'indy_issuer_create_credential',
+        (
+            ('wallet_handle', 'int', False),
+            ('cred_offer', 'dict_or_str', False),
+            ('cred_request', 'dict_or_str', False),
+            ('cred_values', 'dict_or_str', False),
+            ('revoc_reg_id', 'str', True),
+            ('tails_reader_handle', 'int', True),
+        ),
+        (('dict', False), ('str', True), ('dict', True))
+    ),
+    'Anoncreds.create_credential_definition': (
+        'indy_issuer_create_and_store_credential_def',
+        (
+            ('wallet_handle', 'int', False),
+            ('cred_def_did', 'str', False),
+            ('cred_def_schema', 'dict_or_str', False),
+            ('cred_def_tag', 'str', False),
+            ('cred_def_type', 'str', True),
+            ('cred_def_type_config', 'dict_or_str', True),
+        ),
+        (('str', False), ('dict', False))
+    ),
+    'Anoncreds.create_credential_offer': (
+        'indy_issuer_create_credential_offer',
+        (
+            ('wallet_handle', 'int', False),
+            ('cred_def_id', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Anoncreds.create_credential_request': (
+        'indy_prover_create_credential_req',
+        (
+            ('wallet_handle', 'int', False),
+            ('cred_req_did', 'str', False),
+            ('cred_offer', 'dict_or_str', False),
+            ('cred_def', 'dict_or_str', False),
+            ('master_secret_id', 'str', False),
+        ),
+        (('dict', False), ('dict', False))
+    ),
+    'Anoncreds.create_master_secret': (
+        'indy_prover_create_master_secret',
+        (
+            ('wallet_handle', 'int', False),
+            ('master_secret_name', 'str', True),
+        ),
+        (('str', False),)
+    ),
+    'Anoncreds.create_proof': (
+        'indy_prover_create_proof',
+        (
+            ('wallet_handle', 'int', False),
+            ('proof_req', 'dict_or_str', False),
+            ('proof_creds', 'dict_or_str', False),
+            ('master_secret_name', 'str', False),
+            ('proof_schemas', 'dict_or_str', False),
+            ('proof_cred_defs', 'dict_or_str', False),
+            ('proof_revoc_states', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Anoncreds.create_revocation_registry': (
+        'indy_issuer_create_and_store_revoc_reg',
+        (
+            ('wallet_handle', 'int', False),
+            ('revoc_reg_did', 'str', False),
+            ('revoc_reg_type', 'str', True),
+            ('revoc_reg_tag', 'str', False),
+            ('revoc_reg_cred_def_id', 'str', False),
+            ('revoc_reg_config', 'dict_or_str', False),
+            ('tails_writer_handle', 'int', False),
+        ),
+        (('str', False), ('dict', False), ('dict', False))
+    ),
+    'Anoncreds.create_revocation_state': (
+        'indy_create_revocation_state',
+        (
+            ('tails_reader_handle', 'int', False),
+            ('revoc_reg_defs', 'dict_or_str', False),
+            ('revoc_reg_delta', 'dict_or_str', False),
+            ('timestamp', 'int', False),
+            ('cred_revoc_id', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Anoncreds.create_schema': (
+        'indy_issuer_create_schema',
+        (
+            ('issuer_schema_did', 'str', False),
+            ('schema_name', 'str', False),
+            ('schema_version', 'str', False),
+            ('schema_attributes', 'list_or_str', False),
+        ),
+        (('str', False), ('dict', False))
+    ),
+    'Anoncreds.fetch_credentials_for_proof_request': (
+        'indy_prover_get_credentials_for_proof_req',
+        (
+            ('wallet_handle', 'int', False),
+            ('proof_req', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Anoncreds.get_credential_by_id': (
+        'indy_prover_get_credential',
+        (
+            ('wallet_handle', 'int', False),
+            ('cred_id', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Anoncreds.get_credentials': (
+        'indy_prover_get_credentials',
+        (
+            ('wallet_handle', 'int', False),
+            ('credential_filter', 'dict_or_str', False),
+        ),
+        (('list', False),)
+    ),
+    'Anoncreds.get_credentials_from_proof_request_search': (
+        'indy_prover_fetch_credentials_for_proof_req',
+        (
+            ('search_handle', 'int', False),
+            ('item_id', 'str', False),
+            ('cred_count', 'int', False),
+        ),
+        (('list', False),)
+    ),
+    'Anoncreds.get_credentials_from_search': (
+        'indy_prover_fetch_credentials',
+        (
+            ('search_handle', 'int', False),
+            ('cred_count', 'int', False),
+        ),
+        (('list', False),)
+    ),
+    'Anoncreds.merge_revocation_registry_deltas': (
+        'indy_issuer_merge_revocation_registry_deltas',
+        (
+            ('revoc_reg_delta_1', 'dict_or_str', False),
+            ('revoc_reg_delta_2', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Anoncreds.open_credential_search': (
+        'indy_prover_search_credentials',
+        (
+            ('wallet_handle', 'int', False),
+            ('cred_search_queries', 'dict_or_str', False),
+        ),
+        (('int', False), ('int', False))
+    ),
+    'Anoncreds.open_proof_request_search': (
+        'indy_prover_search_credentials_for_proof_req',
+        (
+            ('wallet_handle', 'int', False),
+            ('proof_req', 'dict_or_str', False),
+            ('cred_search_queries', 'dict_or_str', False),
+        ),
+        (('int', False),)
+    ),
+    'Anoncreds.revoke_credential': (
+        'indy_issuer_revoke_credential',
+        (
+            ('wallet_handle', 'int', False),
+            ('tails_reader_handle', 'int', False),
+            ('revoc_reg_id', 'str', False),
+            ('cred_revoc_id', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Anoncreds.store_credential': (
+        'indy_prover_store_credential',
+        (
+            ('wallet_handle', 'int', False),
+            ('cred_id', 'str', True),
+            ('cred_req_metadata', 'dict_or_str', False),
+            ('cred', 'dict_or_str', False),
+            ('cred_def', 'dict_or_str', False),
+            ('revoc_reg_def', 'dict_or_str', True),
+        ),
+        (('str', False),)
+    ),
+    'Anoncreds.update_revocation_state': (
+        'indy_update_revocation_state',
+        (
+            ('tails_reader_handle', 'int', False),
+            ('revoc_state', 'dict_or_str', False),
+            ('revoc_reg_def', 'dict_or_str', False),
+            ('revoc_reg_delta', 'dict_or_str', False),
+            ('timestamp', 'int', False),
+            ('cred_revoc_id', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Anoncreds.verify_proof': (
+        'indy_verifier_verify_proof',
+        (
+            ('proof_req', 'dict_or_str', False),
+            ('proof', 'dict_or_str', False),
+            ('proof_schemas', 'dict_or_str', False),
+            ('proof_cred_defs', 'dict_or_str', False),
+            ('proof_revoc_reg_defs', 'dict_or_str', False),
+            ('proof_revoc_regs', 'dict_or_str', False),
+        ),
+        (('bool', False),)
+    ),
+    'BlobStorage.open_blob_storage_reader': (
+        'indy_open_blob_storage_reader',
+        (
+            ('storage_reader_type', 'str', False),
+            ('storage_reader_config', 'dict_or_str', False),
+        ),
+        (('int', False),)
+    ),
+    'BlobStorage.open_blob_storage_writer': (
+        'indy_open_blob_storage_writer',
+        (
+            ('storage_writer_type', 'str', False),
+            ('storage_writer_config', 'dict_or_str', False),
+        ),
+        (('int', False),)
+    ),
+    'Crypto.anon_crypt': (
+        'indy_crypto_anon_crypt',
+        (
+            ('recipient_verkey', 'str', False),
+            ('message', 'bytes', False),
+        ),
+        (('bytes', False),)
+    ),
+    'Crypto.anon_decrypt': (
+        'indy_crypto_anon_decrypt',
+        (
+            ('wallet_handle', 'int', False),
+            ('recipient_verkey', 'str', False),
+            ('encrypted_message', 'bytes', False),
+        ),
+        (('bytes', False),)
+    ),
+    'Crypto.auth_crypt': (
+        'indy_crypto_auth_crypt',
+        (
+            ('wallet_handle', 'int', False),
+            ('sender_verkey', 'str', False),
+            ('recipient_verkey', 'str', False),
+            ('message', 'bytes', False),
+        ),
+        (('bytes', False),)
+    ),
+    'Crypto.auth_decrypt': (
+        'indy_crypto_auth_decrypt',
+        (
+            ('wallet_handle', 'int', False),
+            ('recipient_verkey', 'str', False),
+            ('encrypted_message', 'bytes', False),
+        ),
+        (('str', False), ('bytes', False))
+    ),
+    'Crypto.create_key': (
+        'indy_create_key',
+        (
+            ('wallet_handle', 'int', False),
+            ('key_info', 'dict_or_str', False),
+        ),
+        (('str', False),)
+    ),
+    'Crypto.crypto_sign': (
+        'indy_crypto_sign',
+        (
+            ('wallet_handle', 'int', False),
+            ('signer_verkey', 'str', False),
+            ('message', 'bytes', False),
+        ),
+        (('bytes', False),)
+    ),
+    'Crypto.crypto_verify': (
+        'indy_crypto_verify',
+        (
+            ('signer_verkey', 'str', False),
+            ('message', 'bytes', False),
+            ('signature', 'bytes', False),
+        ),
+        (('bool', False),)
+    ),
+    'Crypto.get_key_metadata': (
+        'indy_get_key_metadata',
+        (
+            ('wallet_handle', 'int', False),
+            ('verkey', 'str', False),
+        ),
+        (('str', True),)
+    ),
+    'Crypto.pack_message': (
+        'indy_pack_message',
+        (
+            ('wallet_handle', 'int', False),
+            ('message', 'str', False),
+            ('recipient_verkeys', 'list_or_str', False),
+            ('sender_verkey', 'str', True),
+        ),
+        (('bytes', False),)
+    ),
+    'Crypto.set_key_metadata': (
+        'indy_set_key_metadata',
+        (
+            ('wallet_handle', 'int', False),
+            ('verkey', 'str', False),
+            ('metadata', 'str', False),
+        ),
+        ()
+    ),
+    'Crypto.unpack_message': (
+        'indy_unpack_message',
+        (
+            ('wallet_handle', 'int', False),
+            ('jwe', 'bytes', False),
+        ),
+        (('bytes', False),)
+    ),
+    'DID.abbreviate_verkey': (
+        'indy_abbreviate_verkey',
+        (
+            ('did', 'str', False),
+            ('verkey', 'str', False),
+        ),
+        (('str', False),)
+    ),
+    'DID.create_and_store_did': (
+        'indy_create_and_store_my_did',
+        (
+            ('wallet_handle', 'int', False),
+            ('did_json', 'dict_or_str', False),
+        ),
+        (('str', False), ('str', False))
+    ),
+    'DID.create_new_keys': (
+        'indy_create_key',
+        (
+            ('wallet_handle', 'int', False),
+            ('did_json', 'dict_or_str', False),
+        ),
+        (('str', False),)
+    ),
+    'DID.get_did_endpoint': (
+        'indy_get_endpoint_for_did',
+        (
+            ('wallet_handle', 'int', False),
+            ('pool_handle', 'int', False),
+            ('did', 'str', False),
+        ),
+        (('str', False), ('str', False))
+    ),
+    'DID.get_did_metadata': (
+        'indy_get_did_metadata',
+        (
+            ('wallet_handle', 'int', False),
+            ('did', 'str', False),
+        ),
+        (('str', False),)
+    ),
+    'DID.get_did_verkey': (
+        'indy_key_for_did',
+        (
+            ('pool_handle', 'int', False),
+            ('wallet_handle', 'int', False),
+            ('did', 'str', False),
+        ),
+        (('str', False),)
+    ),
+    'DID.get_did_with_metadata': (
+        'indy_get_my_did_with_meta',
+        (
+            ('wallet_handle', 'int', False),
+            ('did', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'DID.get_dids_with_metadata': (
+        'indy_list_my_dids_with_meta',
+        (
+            ('wallet_handle', 'int', False),
+        ),
+        (('list', False),)
+    ),
+    'DID.get_local_did_verkey': (
+        'indy_key_for_local_did',
+        (
+            ('wallet_handle', 'int', False),
+            ('did', 'str', False),
+        ),
+        (('str', False),)
+    ),
+    'DID.get_verkey_metadata': (
+        'indy_get_key_metadata',
+        (
+            ('wallet_handle', 'int', False),
+            ('verkey', 'str', False),
+        ),
+        (('str', False),)
+    ),
+    'DID.replace_keys_apply': (
+        'indy_replace_keys_apply',
+        (
+            ('wallet_handle', 'int', False),
+            ('resolve_did', 'str', False),
+        ),
+        ()
+    ),
+    'DID.replace_keys_start': (
+        'indy_replace_keys_start',
+        (
+            ('wallet_handle', 'int', False),
+            ('signing_did', 'str', False),
+            ('did_json', 'dict_or_str', False),
+        ),
+        (('str', False),)
+    ),
+    'DID.set_did_endpoint': (
+        'indy_set_endpoint_for_did',
+        (
+            ('wallet_handle', 'int', False),
+            ('did', 'str', False),
+            ('did_url', 'str', False),
+            ('did_verkey', 'str', False),
+        ),
+        ()
+    ),
+    'DID.set_did_metadata': (
+        'indy_set_did_metadata',
+        (
+            ('wallet_handle', 'int', False),
+            ('did', 'str', False),
+            ('metadata', 'str', False),
+        ),
+        ()
+    ),
+    'DID.set_verkey_metadata': (
+        'indy_set_key_metadata',
+        (
+            ('wallet_handle', 'int', False),
+            ('verkey', 'str', False),
+            ('metadata', 'str', False),
+        ),
+        ()
+    ),
+    'DID.store_foreign_did': (
+        'indy_store_their_did',
+        (
+            ('wallet_handle', 'int', False),
+            ('did_json', 'dict_or_str', False),
+        ),
+        ()
+    ),
+    'Ledger.append_taa_to_request': (
+        'indy_append_txn_author_agreement_acceptance_to_request',
+        (
+            ('request', 'dict_or_str', False),
+            ('text', 'str', True),
+            ('version', 'str', True),
+            ('taa_digest', 'str', True),
+            ('mechanism', 'str', False),
+            ('time', 'int', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.attrib_request': (
+        'indy_build_attrib_request',
+        (
+            ('sender_did', 'str', False),
+            ('target_did', 'str', False),
+            ('attrib_hash', 'str', True),
+            ('attrib_raw', 'str', True),
+            ('attrib_encoded', 'str', True),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.cred_def_request': (
+        'indy_build_cred_def_request',
+        (
+            ('sender_did', 'str', False),
+            ('cred_def_data', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_attrib_request': (
+        'indy_build_get_attrib_request',
+        (
+            ('sender_did', 'str', True),
+            ('target_did', 'str', False),
+            ('attrib_raw', 'str', True),
+            ('attrib_hash', 'str', True),
+            ('attrib_encoded', 'str', True),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_cred_def_request': (
+        'indy_build_get_cred_def_request',
+        (
+            ('sender_did', 'str', True),
+            ('cred_def_id', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_ddo_request': (
+        'indy_build_get_ddo_request',
+        (
+            ('sender_did', 'str', True),
+            ('target_did', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_nym_request': (
+        'indy_build_get_nym_request',
+        (
+            ('sender_did', 'str', True),
+            ('target_did', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_response_metadata': (
+        'indy_get_response_metadata',
+        (
+            ('response', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_revoc_reg_def_request': (
+        'indy_build_get_revoc_reg_def_request',
+        (
+            ('sender_did', 'str', True),
+            ('revoc_reg_def_id', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_revoc_reg_delta_request': (
+        'indy_build_get_revoc_reg_delta_request',
+        (
+            ('sender_did', 'str', True),
+            ('revoc_reg_def_id', 'str', False),
+            ('delta_from', 'int', True),
+            ('delta_to', 'int', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_revoc_reg_request': (
+        'indy_build_get_revoc_reg_request',
+        (
+            ('sender_did', 'str', True),
+            ('revoc_reg_def_id', 'str', False),
+            ('timestamp', 'int', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_schema_request': (
+        'indy_build_get_schema_request',
+        (
+            ('sender_did', 'str', True),
+            ('schema_id', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_taa_request': (
+        'indy_build_get_txn_author_agreement_request',
+        (
+            ('sender_did', 'str', True),
+            ('data', 'str', True),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_txn_request': (
+        'indy_build_get_txn_request',
+        (
+            ('sender_did', 'str', True),
+            ('ledger_type', 'str', True),
+            ('transaction_seq_no', 'int', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.get_validator_info_request': (
+        'indy_build_get_validator_info_request',
+        (
+            ('sender_did', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.multi_sign_request': (
+        'indy_multi_sign_request',
+        (
+            ('wallet_handle', 'int', False),
+            ('signing_did', 'str', False),
+            ('request', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.node_request': (
+        'indy_build_node_request',
+        (
+            ('sender_did', 'str', False),
+            ('node_did', 'str', False),
+            ('node_data', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.nym_request': (
+        'indy_build_nym_request',
+        (
+            ('sender_did', 'str', False),
+            ('target_did', 'str', False),
+            ('target_verkey', 'str', True),
+            ('target_alias', 'str', True),
+            ('target_role', 'str', True),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.parse_get_cred_def_response': (
+        'indy_parse_get_cred_def_response',
+        (
+            ('response_raw', 'dict_or_str', False),
+        ),
+        (('str', False), ('dict', False))
+    ),
+    'Ledger.parse_get_revoc_reg_def_response': (
+        'indy_parse_get_revoc_reg_def_response',
+        (
+            ('response_raw', 'dict_or_str', False),
+        ),
+        (('str', False), ('dict', False))
+    ),
+    'Ledger.parse_get_revoc_reg_delta_response': (
+        'indy_parse_get_revoc_reg_delta_response',
+        (
+            ('response_raw', 'dict_or_str', False),
+        ),
+        (('str', False), ('dict', False), ('int', False))
+    ),
+    'Ledger.parse_get_revoc_reg_response': (
+        'indy_parse_get_revoc_reg_response',
+        (
+            ('response_raw', 'dict_or_str', False),
+        ),
+        (('str', False), ('dict', False), ('int', False))
+    ),
+    'Ledger.parse_get_schema_response': (
+        'indy_parse_get_schema_response',
+        (
+            ('response_raw', 'dict_or_str', False),
+        ),
+        (('str', False), ('dict', False))
+    ),
+    'Ledger.pool_config_request': (
+        'indy_build_pool_config_request',
+        (
+            ('sender_did', 'str', False),
+            ('pool_can_write', 'bool', False),
+            ('request_force', 'bool', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.pool_restart_request': (
+        'indy_build_pool_restart_request',
+        (
+            ('sender_did', 'str', False),
+            ('request_action', 'str', False),
+            ('restart_datetime', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.pool_upgrade_request': (
+        'indy_build_pool_upgrade_request',
+        (
+            ('sender_did', 'str', False),
+            ('upgrade_name', 'str', False),
+            ('upgrade_package_version', 'str', False),
+            ('request_action', 'str', False),
+            ('upgrade_package_hash', 'str', False),
+            ('upgrade_node_timeout', 'int', True),
+            ('upgrade_node_schedule', 'dict_or_str', True),
+            ('upgrade_justification', 'str', True),
+            ('upgrade_package_reinstall', 'bool', False),
+            ('request_force', 'bool', False),
+            ('upgrade_package_name', 'str', True),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.revoc_reg_def_request': (
+        'indy_build_revoc_reg_def_request',
+        (
+            ('sender_did', 'str', False),
+            ('revoc_reg_data', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.revoc_reg_entry_request': (
+        'indy_build_revoc_reg_entry_request',
+        (
+            ('sender_did', 'str', False),
+            ('revoc_reg_def_id', 'str', False),
+            ('revoc_reg_type', 'str', False),
+            ('entry_value', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.schema_request': (
+        'indy_build_schema_request',
+        (
+            ('sender_did', 'str', False),
+            ('schema_data', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.sign_and_submit_request': (
+        'indy_sign_and_submit_request',
+        (
+            ('pool_handle', 'int', False),
+            ('wallet_handle', 'int', False),
+            ('signing_did', 'str', False),
+            ('request', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.sign_request': (
+        'indy_sign_request',
+        (
+            ('wallet_handle', 'int', False),
+            ('signing_did', 'str', False),
+            ('request', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.submit_action': (
+        'indy_submit_action',
+        (
+            ('pool_handle', 'int', False),
+            ('request', 'dict_or_str', False),
+            ('action_nodes', 'list_or_str', False),
+            ('action_nodes_timeout', 'int', False),
+        ),
+        (('dict', False),)
+    ),
+    'Ledger.submit_request': (
+        'indy_submit_request',
+        (
+            ('pool_handle', 'int', False),
+            ('request', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'NonSecrets.add_wallet_record': (
+        'indy_add_wallet_record',
+        (
+            ('wallet_handle', 'int', False),
+            ('record_type', 'str', False),
+            ('record_id', 'str', False),
+            ('record_value', 'str', False),
+            ('record_tags', 'dict_or_str', True),
+        ),
+        ()
+    ),
+    'NonSecrets.add_wallet_record_tags': (
+        'indy_add_wallet_record_tags',
+        (
+            ('wallet_handle', 'int', False),
+            ('record_type', 'str', False),
+            ('record_id', 'str', False),
+            ('record_tags', 'dict_or_str', False),
+        ),
+        ()
+    ),
+    'NonSecrets.close_wallet_search': (
+        'indy_close_wallet_search',
+        (
+            ('search_handle', 'int', False),
+        ),
+        ()
+    ),
+    'NonSecrets.delete_wallet_record': (
+        'indy_delete_wallet_record',
+        (
+            ('wallet_handle', 'int', False),
+            ('record_type', 'str', False),
+            ('record_id', 'str', False),
+        ),
+        ()
+    ),
+    'NonSecrets.delete_wallet_record_tags': (
+        'indy_delete_wallet_record_tags',
+        (
+            ('wallet_handle', 'int', False),
+            ('record_type', 'str', False),
+            ('record_id', 'str', False),
+            ('record_tag_names', 'list_or_str', False),
+        ),
+        ()
+    ),
+    'NonSecrets.fetch_wallet_record_from_search': (
+        'indy_fetch_wallet_search_next_records',
+        (
+            ('wallet_handle', 'int', False),
+            ('search_handle', 'int', False),
+            ('record_count', 'int', False),
+        ),
+        (('dict', False),)
+    ),
+    'NonSecrets.get_wallet_record': (
+        'indy_get_wallet_record',
+        (
+            ('wallet_handle', 'int', False),
+            ('record_type', 'str', False),
+            ('record_id', 'str', False),
+            ('retrieve_options', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'NonSecrets.open_wallet_search': (
+        'indy_open_wallet_search',
+        (
+            ('wallet_handle', 'int', False),
+            ('record_type', 'str', False),
+            ('search_queries', 'dict_or_str', False),
+            ('retrieve_options', 'dict_or_str', False),
+        ),
+        (('int', False),)
+    ),
+    'NonSecrets.update_wallet_record_tags': (
+        'indy_update_wallet_record_tags',
+        (
+            ('wallet_handle', 'int', False),
+            ('record_type', 'str', False),
+            ('record_id', 'str', False),
+            ('record_tags', 'dict_or_str', False),
+        ),
+        ()
+    ),
+    'NonSecrets.update_wallet_record_value': (
+        'indy_update_wallet_record_value',
+        (
+            ('wallet_handle', 'int', False),
+            ('record_type', 'str', False),
+            ('record_id', 'str', False),
+            ('record_value', 'str', False),
+        ),
+        ()
+    ),
+    'Pairwise.create_pairwise': (
+        'indy_create_pairwise',
+        (
+            ('wallet_handle', 'int', False),
+            ('foreign_did', 'str', False),
+            ('my_did', 'str', False),
+            ('metadata', 'str', True),
+        ),
+        ()
+    ),
+    'Pairwise.get_pairwise': (
+        'indy_get_pairwise',
+        (
+            ('wallet_handle', 'int', False),
+            ('foreign_did', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Pairwise.list_pairwise': (
+        'indy_list_pairwise',
+        (
+            ('wallet_handle', 'int', False),
+        ),
+        (('list', False),)
+    ),
+    'Pairwise.pairwise_exists': (
+        'indy_is_pairwise_exists',
+        (
+            ('wallet_handle', 'int', False),
+            ('foreign_did', 'str', False),
+        ),
+        (('bool', False),)
+    ),
+    'Pairwise.set_pairwise_metadata': (
+        'indy_set_pairwise_metadata',
+        (
+            ('wallet_handle', 'int', False),
+            ('foreign_did', 'str', False),
+            ('metadata', 'str', True),
+        ),
+        ()
+    ),
+    'Payment.add_request_fees': (
+        'indy_add_request_fees',
+        (
+            ('wallet_handle', 'int', False),
+            ('sender_did', 'str', True),
+            ('request', 'dict_or_str', False),
+            ('inputs', 'list_or_str', False),
+            ('outputs', 'list_or_str', False),
+            ('additional_info', 'str', True),
+        ),
+        (('dict', False), ('str', False))
+    ),
+    'Payment.build_get_payment_sources_request': (
+        'indy_build_get_payment_sources_request',
+        (
+            ('wallet_handle', 'int', False),
+            ('sender_did', 'str', True),
+            ('payment_address', 'str', False),
+        ),
+        (('dict', False), ('str', False))
+    ),
+    'Payment.build_get_transaction_fees_request': (
+        'indy_build_get_txn_fees_req',
+        (
+            ('wallet_handle', 'int', False),
+            ('sender_did', 'str', True),
+            ('payment_method', 'str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Payment.build_mint_request': (
+        'indy_build_mint_req',
+        (
+            ('wallet_handle', 'int', False),
+            ('sender_did', 'str', True),
+            ('outputs', 'list_or_str', False),
+            ('additional_info', 'str', True),
+        ),
+        (('dict', False), ('str', False))
+    ),
+    'Payment.build_payment_request': (
+        'indy_build_payment_req',
+        (
+            ('wallet_handle', 'int', False),
+            ('sender_did', 'str', True),
+            ('inputs', 'list_or_str', False),
+            ('outputs', 'list_or_str', False),
+            ('additional_info', 'str', True),
+        ),
+        (('dict', False), ('str', False))
+    ),
+    'Payment.build_set_transaction_fees_request': (
+        'indy_build_set_txn_fees_req',
+        (
+            ('wallet_handle', 'int', False),
+            ('sender_did', 'int', True),
+            ('payment_method', 'str', False),
+            ('transaction_fees', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Payment.build_verify_payment_request': (
+        'indy_build_verify_payment_req',
+        (
+            ('wallet_handle', 'int', False),
+            ('sender_did', 'str', True),
+            ('receipt', 'str', False),
+        ),
+        (('dict', False), ('str', False))
+    ),
+    'Payment.create_payment_address': (
+        'indy_create_payment_address',
+        (
+            ('wallet_handle', 'int', False),
+            ('payment_method', 'str', False),
+            ('address_config', 'dict_or_str', False),
+        ),
+        (('str', False),)
+    ),
+    'Payment.list_payment_addresses': (
+        'indy_list_payment_addresses',
+        (
+            ('wallet_handle', 'int', False),
+        ),
+        (('list', False),)
+    ),
+    'Payment.parse_get_payment_sources_response': (
+        'indy_parse_get_payment_sources_response',
+        (
+            ('payment_method', 'str', False),
+            ('response_raw', 'dict_or_str', False),
+        ),
+        (('list', False),)
+    ),
+    'Payment.parse_get_transaction_fees_response': (
+        'indy_parse_get_txn_fees_response',
+        (
+            ('payment_method', 'str', False),
+            ('response_raw', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Payment.parse_payment_response': (
+        'indy_parse_payment_response',
+        (
+            ('payment_method', 'str', False),
+            ('response_raw', 'dict_or_str', False),
+        ),
+        (('list', False),)
+    ),
+    'Payment.parse_response_with_fees': (
+        'indy_parse_response_with_fees',
+        (
+            ('payment_method', 'str', False),
+            ('response', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Payment.parse_verify_payment_response': (
+        'indy_parse_verify_payment_response',
+        (
+            ('payment_method', 'str', False),
+            ('response_raw', 'dict_or_str', False),
+        ),
+        (('dict', False),)
+    ),
+    'Pool.close_pool_connection': (
+        'indy_close_pool_ledger',
+        (
+            ('pool_handle', 'int', False),
+        ),
+        ()
+    ),
+    'Pool.create_pool_config': (
+        'indy_create_pool_ledger_config',
+        (
+            ('config_name', 'str', False),
+            ('config', 'dict_or_str', True),
+        ),
+        ()
+    ),
+    'Pool.delete_pool_config': (
+        'indy_delete_pool_ledger_config',
+        (
+            ('config_name', 'str', False),
+        ),
+        ()
+    ),
+    'Pool.list_local_pool_ledgers': (
+        'indy_list_pools',
+        (),
+        (('list', False),)
+    ),
+    'Pool.open_pool_connection': (
+        'indy_open_pool_ledger',
+        (
+            ('config_name', 'str', False),
+            ('config', 'dict_or_str', True),
+        ),
+        (('int', False),)
+    ),
+    'Pool.refresh_local_pool_ledger': (
+        'indy_refresh_pool_ledger',
+        (
+            ('pool_handle', 'int', False),
+        ),
+        ()
+    ),
+    'Pool.set_protocol_version': (
+        'indy_set_protocol_version',
+        (
+            ('protocol_version', 'int', False),
+        ),
+        ()
+    ),
+    'Wallet.close_wallet': (
+        'indy_close_wallet',
+        (
+            ('wallet_handle', 'int', False),
+        ),
+        ()
+    ),
+    'Wallet.create_wallet': (
+        'indy_create_wallet',
+        (
+            ('wallet_config', 'dict_or_str', False),
+            ('wallet_credentials', 'dict_or_str', False),
+        ),
+        ()
+    ),
+    'Wallet.delete_wallet': (
+        'indy_delete_wallet',
+        (
+            ('wallet_config', 'dict_or_str', False),
+            ('wallet_credentials', 'dict_or_str', False),
+        ),
+        ()
+    ),
+    'Wallet.export_wallet': (
+        'indy_export_wallet',
+        (
+            ('wallet_handle', 'int', False),
+            ('export_config', 'dict_or_str', False),
+        ),
+        ()
+    ),
+    'Wallet.generate_raw_derivation_key': (
+        'indy_generate_wallet_key',
+        (
+            ('generator_config', 'dict_or_str', True),
+        ),
+        (('str', False),)
+    ),
+    'Wallet.import_wallet': (
+        'indy_import_wallet',
+        (
+            ('wallet_config', 'dict_or_str', False),
+            ('wallet_credentials', 'dict_or_str', False),
+            ('import_config', 'dict_or_str', False),
+        ),
+        ()
+    ),
+    'Wallet.open_wallet': (
+        'indy_open_wallet',
+        (
+            ('wallet_config', 'dict_or_str', False),
+            ('wallet_credentials', 'dict_or_str', False),
+        ),
+        (('int', False),)
+    ),
+}
@@ -0,0 +1,283 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, Optional, Sequence
+
+# Upper bounds of the latency histogram buckets in seconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Indexes of the timestamps taken during a timed command call
+(PHASE_STARTED, PHASE_ENCODED, PHASE_SUBMITTED, PHASE_CALLED_BACK,
+ PHASE_COMPLETED, PHASE_DECODED) = range(6)
+
+# Names of the phases between two consecutive timestamps
+PHASES = ('encode', 'submit', 'native', 'handoff', 'decode')
+
+
+class Histogram:
+    """A histogram with fixed buckets.
+
+    The histogram itself is not thread-safe; it is guarded by the lock of the
+    command metrics it belongs to.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        """
+        :param buckets : The sorted upper bounds of the buckets.
+        """
+
+        self._buckets: tuple = tuple(buckets)
+        self._counts: list = [0] * (len(self._buckets) + 1)
+        self._sum: float = 0.0
+        self._count: int = 0
+
+    def observe(self, value: float):
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._sum += value
+        self._count += 1
+
+    def snapshot(self) -> dict:
+        """Returns the histogram values.
+
+        :returns: A dict with the keys `buckets` (a dict of upper bound to the
+            cumulative count of observations up to it, ending in
+            `float('inf')`), `sum` and `count`.
+        """
+
+        buckets, cumulative_count = {}, 0
+        for bound, count in zip(self._buckets + (float('inf'),),
+                                self._counts):
+            cumulative_count += count
+            buckets[bound] = cumulative_count
+
+        return {'buckets': buckets, 'sum': self._sum, 'count': self._count}
+
+
+class CommandMetrics:
+    """Holds the metrics of a single Libindy command."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self._lock: threading.Lock = threading.Lock()
+        self._buckets: Sequence[float] = buckets
+        self._calls: int = 0
+        self._in_flight: int = 0
+        self._errors: Dict[str, int] = {}
+        self._latency: Histogram = Histogram(buckets)
+        self._queue_wait: Histogram = Histogram(buckets)
+        self._phases: Dict[str, Histogram] = {}
+
+    @property
+    def calls(self) -> int:
+        return self._calls
+
+    def start(self):
+        """Records the start of a command call."""
+        with self._lock:
+            self._calls += 1
+            self._in_flight += 1
+
+    def finish(self, duration: float, error: Optional[BaseException] = None):
+        """Records the end of a command call.
+
+        :param duration : The duration of the call in seconds.
+        :param error    : The error the call raised, if any.
+        """
+
+        with self._lock:
+            self._in_flight -= 1
+            self._latency.observe(duration)
+            if error is not None:
+                error_name = type(error).__name__
+                self._errors[error_name] = self._errors.get(error_name, 0) + 1
+
+    def record_queue_wait(self, duration: float):
+        """Records how long a call waited for admission.
+
+        :param duration : The time the call waited in seconds.
+        """
+
+        with self._lock:
+            self._queue_wait.observe(duration)
+
+    def record_phases(self, timings: Sequence[float]):
+        """Records the phase durations of a timed command call.
+
+        :param timings : The timestamps of the call, one per `PHASE_*` index.
+        """
+
+        with self._lock:
+            for index, phase in enumerate(PHASES):
+                histogram = self._phases.get(phase)
+                if histogram is None:
+                    histogram = self._phases[phase] = Histogram(self._buckets)
+                histogram.observe(timings[index + 1] - timings[index])
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'calls': self._calls,
+                'in_flight': self._in_flight,
+                'errors': dict(self._errors),
+                'latency': self._latency.snapshot(),
+                'queue_wait': self._queue_wait.snapshot(),
+                'phases': {phase: histogram.snapshot()
+                           for phase, histogram in self._phases.items()}
+            }
+
+    def reset(self):
+        """Resets the counters, keeping the calls that are in flight."""
+        with self._lock:
+            self._calls = 0
+            self._errors = {}
+            self._latency = Histogram(self._buckets)
+            self._queue_wait = Histogram(self._buckets)
+            self._phases = {}
+
+
+class MetricsRegistry:
+    """Collects the metrics of all Libindy commands by command name.
+
+    For every command the registry counts the calls, the calls in flight and
+    the raised errors by error type, and keeps a histogram of the call
+    latencies.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        """
+        :param buckets : The upper bounds of the latency histogram buckets in
+            seconds.
+            Optional; Defaults to: `LATENCY_BUCKETS`
+        """
+
+        self._buckets: tuple = tuple(sorted(buckets))
+        self._commands: Dict[str, CommandMetrics] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def command(self, command_name: str) -> CommandMetrics:
+        """Returns the metrics of a command, creating them if necessary.
+
+        :param command_name : The Libindy name of the command.
+        """
+
+        command_metrics = self._commands.get(command_name)
+        if command_metrics is None:
+            with self._lock:
+                command_metrics = self._commands.setdefault(
+                    command_name, CommandMetrics(self._buckets)
+                )
+        return command_metrics
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Returns the current metrics of every command that was called.
+
+        :returns: A dict of command name to a dict with the keys `calls`,
+            `in_flight`, `errors`, `latency`, `queue_wait` and `phases`. The
+            queue wait is only observed for calls of command groups with a
+            concurrency limit and the phases only if phase timing is enabled.
+        """
+
+        with self._lock:
+            commands = list(self._commands.items())
+
+        snapshot = {}
+        for command_name, command_metrics in sorted(commands):
+            if command_metrics.calls:
+                snapshot[command_name] = command_metrics.snapshot()
+        return snapshot
+
+    def reset(self):
+        """Resets the metrics of every command."""
+        with self._lock:
+            commands = list(self._commands.values())
+
+        for command_metrics in commands:
+            command_metrics.reset()
+
+    def to_prometheus(self, prefix: str = 'libindy') -> str:
+        """Exports the metrics in the Prometheus text format.
+
+        :param prefix : The prefix of the metric names.
+            Optional; Defaults to: `libindy`
+
+        :returns: The metrics as Prometheus text exposition.
+        """
+
+        snapshot = self.snapshot()
+        lines = []
+
+        lines.extend((
+            f'# HELP {prefix}_command_calls_total Libindy command calls.',
+            f'# TYPE {prefix}_command_calls_total counter'
+        ))
+        for command_name, metrics in snapshot.items():
+            lines.append(f'{prefix}_command_calls_total'
+                         f'{{command="{command_name}"}} {metrics["calls"]}')
+
+        lines.extend((
+            f'# HELP {prefix}_command_errors_total Libindy command errors.',
+            f'# TYPE {prefix}_command_errors_total counter'
+        ))
+        for command_name, metrics in snapshot.items():
+            for error_name, count in sorted(metrics['errors'].items()):
+                lines.append(f'{prefix}_command_errors_total'
+                             f'{{command="{command_name}",'
+                             f'error="{error_name}"}} {count}')
+
+        lines.extend((
+            f'# HELP {prefix}_commands_in_flight Libindy commands in flight.',
+            f'# TYPE {prefix}_commands_in_flight gauge'
+        ))
+        for command_name, metrics in snapshot.items():
+            lines.append(f'{prefix}_commands_in_flight'
+                         f'{{command="{command_name}"}} '
+                         f'{metrics["in_flight"]}')
+
+        metric_name = f'{prefix}_command_duration_seconds'
+        lines.extend((
+            f'# HELP {metric_name} Libindy command latency.',
+            f'# TYPE {metric_name} histogram'
+        ))
+        for command_name, metrics in snapshot.items():
+            lines.extend(_histogram_lines(
+                metric_name, f'command="{command_name}"', metrics['latency']
+            ))
+
+        metric_name = f'{prefix}_command_queue_wait_seconds'
+        lines.extend((
+            f'# HELP {metric_name} Libindy command admission wait time.',
+            f'# TYPE {metric_name} histogram'
+        ))
+        for command_name, metrics in snapshot.items():
+            if metrics['queue_wait']['count']:
+                lines.extend(_histogram_lines(
+                    metric_name, f'command="{command_name}"',
+                    metrics['queue_wait']
+                ))
+
+        metric_name = f'{prefix}_command_phase_duration_seconds'
+        lines.extend((
+            f'# HELP {metric_name} Libindy command latency by phase.',
+            f'# TYPE {metric_name} histogram'
+        ))
+        for command_name, metrics in snapshot.items():
+            for phase, histogram in metrics['phases'].items():
+                lines.extend(_histogram_lines(
+                    metric_name, f'command="{command_name}",phase="{phase}"',
+                    histogram
+                ))
+
+        return '\n'.join(lines) + '\n'
+
+
+def _histogram_lines(metric_name: str, labels: str, histogram: dict) -> list:
+    lines = []
+    for bound, count in histogram['buckets'].items():
+        bound = '+Inf' if bound == float('inf') else repr(bound)
+        lines.append(f'{metric_name}_bucket{{{labels},le="{bound}"}} {count}')
+    lines.append(f'{metric_name}_sum{{{labels}}} {histogram["sum"]}')
+    lines.append(f'{metric_name}_count{{{labels}}} {histogram["count"]}')
+    return lines
+
+
+# The registry all Libindy commands report to
+METRICS: MetricsRegistry = MetricsRegistry()
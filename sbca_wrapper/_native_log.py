@@ -0,0 +1,165 @@
+import atexit
+import logging
+import queue
+from ctypes import CDLL, CFUNCTYPE, c_bool, c_char_p, c_int, c_uint32, c_void_p
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+TRACE = 5
+logging.addLevelName(level=TRACE, levelName='TRACE')
+
+# Python log levels by the Libindy log levels (and max level filters)
+_LEVELS = {
+    1: logging.ERROR,
+    2: logging.WARNING,
+    3: logging.INFO,
+    4: logging.DEBUG,
+    5: TRACE
+}
+
+_ENABLED_CALLBACK_TYPE = CFUNCTYPE(c_bool, c_void_p, c_int, c_char_p)
+_LOG_CALLBACK_TYPE = CFUNCTYPE(None, c_void_p, c_int, c_char_p, c_char_p,
+                               c_char_p, c_char_p, c_int)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queues log records without formatting them first.
+
+    The records of the native logger only hold strings and ints, so they can
+    be formatted by the handlers on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class NativeLogger:
+    """Forwards the log records of Libindy to Python loggers.
+
+    Every record is logged to a child of the native logger that is named
+    after the Rust module it comes from. If Libindy implements
+    `indy_set_log_max_lvl`, it is kept at the lowest effective level of the
+    native loggers, which is passed on again whenever a logger level
+    changes. Records below that level never reach Python. For the others,
+    Libindy asks the `enabled` callback before it builds a record, so
+    records below the level of their own logger are dropped before their
+    message is passed to Python.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        """
+        :param logger : The logger that receives the native records.
+        """
+
+        self._logger: logging.Logger = logger
+        self._loggers: Dict[bytes, logging.Logger] = {}
+        self._enabled_callback = _ENABLED_CALLBACK_TYPE(self._enabled)
+        self._log_callback = _LOG_CALLBACK_TYPE(self._log)
+        self._library: Optional[CDLL] = None
+        self._queue_handler: Optional[QueueHandler] = None
+        self._queue_listener: Optional[QueueListener] = None
+
+    # -------------------------------------------------------------------------
+    #  Methods
+    # -------------------------------------------------------------------------
+    def install(self, library: CDLL):
+        """Registers the logger callbacks in Libindy.
+
+        :param library : The Libindy C-library.
+        """
+
+        self._library = library
+        getattr(library, 'indy_set_logger')(None, self._enabled_callback,
+                                            self._log_callback, None)
+        if hasattr(library, 'indy_set_log_max_lvl'):
+            self._watch_levels()
+        self.update_level()
+
+    def update_level(self):
+        """Passes the lowest level of the native loggers on to Libindy.
+
+        This is done automatically whenever a logger level changes, if
+        Libindy implements `indy_set_log_max_lvl`.
+        """
+
+        if self._library is None or \
+                not hasattr(self._library, 'indy_set_log_max_lvl'):
+            return
+
+        manager = logging.Logger.manager
+        prefix = f'{self._logger.name}.'
+        level = min([self._logger.getEffectiveLevel()] + [
+            logger.getEffectiveLevel()
+            for name, logger in list(manager.loggerDict.items())
+            if name.startswith(prefix) and isinstance(logger, logging.Logger)
+        ])
+
+        # Records up to the level of `logging.disable()` are dropped as well
+        level = max(level, manager.disable + 1)
+        max_level = max((indy_level for indy_level, python_level
+                         in _LEVELS.items() if python_level >= level),
+                        default=0)
+        getattr(self._library, 'indy_set_log_max_lvl')(c_uint32(max_level))
+
+    def set_queue(self, enabled: bool):
+        """Hands the native records to a background thread.
+
+        With the queue, the Libindy threads only create the log records; the
+        records are formatted and written by the handlers of the Libindy
+        logger on a listener thread.
+
+        :param enabled : Whether the records should be queued.
+        """
+
+        if enabled and self._queue_listener is None:
+            record_queue = queue.SimpleQueue()
+            self._queue_listener = QueueListener(
+                record_queue, *self._logger.parent.handlers,
+                respect_handler_level=True
+            )
+            self._queue_handler = _DeferredQueueHandler(record_queue)
+            self._logger.addHandler(self._queue_handler)
+            self._logger.propagate = False
+            self._queue_listener.start()
+            atexit.register(self._queue_listener.stop)
+
+        elif not enabled and self._queue_listener is not None:
+            self._logger.propagate = True
+            self._logger.removeHandler(self._queue_handler)
+            self._queue_listener.stop()
+            atexit.unregister(self._queue_listener.stop)
+            self._queue_handler = self._queue_listener = None
+
+    def _watch_levels(self):
+
+        # Every level change (`setLevel()`, `logging.disable()`) clears the
+        # level caches of the loggers, so the new levels are passed on from
+        # there
+        manager = logging.Logger.manager
+        clear_cache = manager._clear_cache
+
+        def _clear_cache():
+            clear_cache()
+            self.update_level()
+
+        manager._clear_cache = _clear_cache
+
+    def _get_logger(self, target: bytes) -> logging.Logger:
+        logger = self._loggers.get(target)
+        if logger is None:
+            logger = self._loggers[target] = self._logger.getChild(
+                target.decode().replace('::', '.')
+            )
+        return logger
+
+    def _enabled(self, context, level: int, target: bytes) -> bool:
+        return self._get_logger(target).isEnabledFor(_LEVELS[level])
+
+    def _log(self, context, level: int, target: bytes, message: bytes,
+             module_path: bytes, file: bytes, line: int):
+
+        # The message is only formatted if a handler writes the record
+        self._get_logger(target).log(
+            _LEVELS[level], '%s:%s | %s',
+            file.decode() if file else '?', line, message.decode()
+        )
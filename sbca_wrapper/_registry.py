@@ -0,0 +1,131 @@
+import threading
+from typing import Any, List
+
+
+class FutureRegistry:
+    """Holds the pending Libindy commands by their command handle.
+
+    `Libindy` keeps one registry per event loop, so the handles returned here
+    are the slots within the registry; they are combined with the index of
+    the registry before they are handed to Libindy.
+
+    The registry is written from the thread that calls a command and read from
+    the Libindy worker threads that run the command callbacks, so every access
+    is guarded by a lock. Entries are stored in preallocated slots that are
+    indexed by the command handle. Handles of completed commands are put back
+    into a free list and are recycled by later commands, which keeps the
+    handles small and avoids allocating a new dict entry for every command.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        :param capacity : The amount of slots to preallocate. The registry
+            doubles its capacity whenever all slots are in use.
+            Optional; Defaults to: `1024`
+        """
+
+        if capacity < 1:
+            raise ValueError(f'Registry capacity has to be at least 1; got '
+                             f'{capacity}!')
+
+        self._slots: List[Any] = [None] * capacity
+        self._free_handles: List[int] = list(range(capacity - 1, -1, -1))
+        self._lock: threading.Lock = threading.Lock()
+        self._in_flight: int = 0
+
+    # -------------------------------------------------------------------------
+    #  Properties
+    # -------------------------------------------------------------------------
+    @property
+    def in_flight(self) -> int:
+        """The amount of commands that are currently registered."""
+        return self._in_flight
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    # -------------------------------------------------------------------------
+    #  Methods
+    # -------------------------------------------------------------------------
+    def add(self, entry: Any) -> int:
+        """Registers an entry and returns the command handle assigned to it.
+
+        :param entry : The entry to register. Must not be `None`.
+
+        :returns: The command handle of the entry.
+        """
+
+        with self._lock:
+            if not self._free_handles:
+                self._grow()
+            command_handle = self._free_handles.pop()
+            self._slots[command_handle] = entry
+            self._in_flight += 1
+
+        return command_handle
+
+    def get(self, command_handle: int) -> Any:
+        """Returns the entry of a command handle without releasing it.
+
+        :raises KeyError: Raised if no entry is registered on the handle.
+        """
+
+        with self._lock:
+            entry = self._slots[command_handle]
+
+        if entry is None:
+            raise KeyError(command_handle)
+        return entry
+
+    def pop(self, command_handle: int) -> Any:
+        """Removes and returns the entry of a command handle.
+
+        The command handle is released and may be assigned to another command
+        afterwards.
+
+        :raises KeyError: Raised if no entry is registered on the handle.
+        """
+
+        with self._lock:
+            entry = self._slots[command_handle]
+            if entry is None:
+                raise KeyError(command_handle)
+
+            self._slots[command_handle] = None
+            self._free_handles.append(command_handle)
+            self._in_flight -= 1
+
+        return entry
+
+    def replace(self, command_handle: int, entry: Any,
+                new_entry: Any) -> bool:
+        """Replaces the entry of a command handle if it is still registered.
+
+        :param command_handle : The command handle of the entry.
+        :param entry          : The entry that is expected on the handle.
+        :param new_entry      : The entry to register instead.
+
+        :returns: Whether the entry was replaced; `False` if the handle holds
+            another entry or none.
+        """
+
+        with self._lock:
+            if self._slots[command_handle] is not entry:
+                return False
+            self._slots[command_handle] = new_entry
+
+        return True
+
+    def entries(self) -> List[Any]:
+        """Returns all registered entries."""
+        with self._lock:
+            return [entry for entry in self._slots if entry is not None]
+
+    def __len__(self) -> int:
+        return self._in_flight
+
+    def _grow(self):
+        capacity = len(self._slots)
+        self._slots.extend([None] * capacity)
+        self._free_handles.extend(range(2 * capacity - 1, capacity - 1, -1))
@@ -0,0 +1,66 @@
+import threading
+from typing import Dict, List, Tuple
+
+# Commands that open a resource by the command that closes it again. The
+# handle of the resource is the first response value of the opening command
+# and the only argument of the closing one.
+CLOSE_COMMANDS = {
+    'indy_open_wallet': 'indy_close_wallet',
+    'indy_open_pool_ledger': 'indy_close_pool_ledger',
+    'indy_open_wallet_search': 'indy_close_wallet_search',
+    'indy_prover_search_credentials': 'indy_prover_close_credentials_search',
+    'indy_prover_search_credentials_for_proof_req':
+        'indy_prover_close_credentials_search_for_proof_req'
+}
+
+# Commands that close a resource
+CLOSING_COMMANDS = frozenset(CLOSE_COMMANDS.values())
+
+
+class ResourceTracker:
+    """Keeps track of the resources that are open in Libindy.
+
+    Resources are added when a command that opens them succeeded and removed
+    when the command that closes them is called. This is safe to use from any
+    thread.
+    """
+
+    def __init__(self):
+        self._lock: threading.Lock = threading.Lock()
+        self._resources: Dict[Tuple[str, int], None] = {}
+
+    def opened(self, command_name: str, resource_handle: int):
+        """Adds a resource.
+
+        :param command_name    : The Libindy name of the command that opened
+            the resource.
+        :param resource_handle : The handle of the resource.
+        """
+
+        with self._lock:
+            self._resources[CLOSE_COMMANDS[command_name],
+                            resource_handle] = None
+
+    def closed(self, close_command_name: str, resource_handle: int):
+        """Removes a resource.
+
+        :param close_command_name : The Libindy name of the command that
+            closes the resource.
+        :param resource_handle    : The handle of the resource.
+        """
+
+        with self._lock:
+            self._resources.pop((close_command_name, resource_handle), None)
+
+    def resources(self) -> List[Tuple[str, int]]:
+        """Returns the open resources in the order they were opened.
+
+        :returns: The Libindy name of the command that closes the resource
+            and the handle of the resource, for every open resource.
+        """
+
+        with self._lock:
+            return list(self._resources)
+
+    def __len__(self) -> int:
+        return len(self._resources)
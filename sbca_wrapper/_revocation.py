@@ -0,0 +1,251 @@
+import asyncio
+import json
+import os
+import threading
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from . import _codec
+from ._encoded import EncodedJson
+
+# Fetches the revocation registry delta from a timestamp (`None` for the
+# start of the registry) up to a timestamp; returns the delta and the
+# timestamp it was actually created for
+FetchDelta = Callable[[Optional[int], int],
+                      Awaitable[Tuple[Union[dict, str], int]]]
+
+
+class RevocationStateCache:
+    """Keeps the latest revocation state of every revocable credential.
+
+    Creating a revocation state reads the whole tails file of the revocation
+    registry. A cached state is instead moved forward with only the delta
+    since its timestamp:
+
+        revocation_states = RevocationStateCache('revocation_states.json')
+
+        async def fetch_delta(from_timestamp, to_timestamp):
+            request = await Ledger.get_revoc_reg_delta_request(
+                submitter_did, revoc_reg_id, from_timestamp, to_timestamp
+            )
+            response = await Ledger.submit_request(pool_handle, request)
+            _, delta, timestamp = \\
+                await Ledger.parse_get_revoc_reg_delta_response(response)
+            return delta, timestamp
+
+        revoc_state = await revocation_states.get_state(
+            tails_reader_handle, revoc_reg_def, cred_revoc_id, timestamp,
+            fetch_delta
+        )
+
+    States are kept by revocation registry ID and credential revocation ID.
+    If a path is given, the states are loaded from and written to that file.
+    The cache must only be used from a single event loop.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        :param path : The JSON file the states are persisted in.
+            Optional
+        """
+
+        self._path: Optional[str] = path
+        self._states: Dict[Tuple[str, str], Tuple[int, dict]] = {}
+        self._locks: Dict[Tuple[str, str], list] = {}
+        self._file_lock: threading.Lock = threading.Lock()
+        self._save_lock: Optional[asyncio.Lock] = None
+        self._pending_save: Optional[asyncio.Future] = None
+        self._created: int = 0
+        self._updated: int = 0
+        self._hits: int = 0
+
+        if path is not None and os.path.exists(path):
+            self._load()
+
+    # -------------------------------------------------------------------------
+    #  Properties
+    # -------------------------------------------------------------------------
+    @property
+    def created(self) -> int:
+        """The amount of states that were created from the tails file."""
+        return self._created
+
+    @property
+    def updated(self) -> int:
+        """The amount of cached states that were moved forward."""
+        return self._updated
+
+    @property
+    def hits(self) -> int:
+        """The amount of requests the cached state was current for."""
+        return self._hits
+
+    # -------------------------------------------------------------------------
+    #  Methods
+    # -------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, revoc_reg_id: str,
+            cred_revoc_id: str) -> Optional[Tuple[int, dict]]:
+        """Returns the cached state of a credential.
+
+        :param revoc_reg_id  : The ID of the revocation registry.
+        :param cred_revoc_id : The revocation ID of the credential.
+
+        :returns: The timestamp and the state; `None` if no state is cached.
+        """
+        return self._states.get((revoc_reg_id, cred_revoc_id))
+
+    async def get_state(self, tails_reader_handle: int,
+                        revoc_reg_def: Union[dict, str, EncodedJson],
+                        cred_revoc_id: str, timestamp: int,
+                        fetch_delta: FetchDelta) -> dict:
+        """Returns the revocation state of a credential at a timestamp.
+
+        A cached state that is older than the timestamp is updated with the
+        delta since its own timestamp. Without a cached state, the state is
+        created with the delta since the start of the registry. States for
+        timestamps before the cached one are created, but not cached. If the
+        cache has a file, new states are written to it before they are
+        returned; states that are cached while a write is pending are written
+        together with it.
+
+        :param tails_reader_handle : The handle of the tails reader of the
+            revocation registry.
+        :param revoc_reg_def       : The revocation registry definition.
+        :param cred_revoc_id       : The revocation ID of the credential.
+        :param timestamp           : The time the state should be valid at.
+        :param fetch_delta         : Returns the revocation registry delta
+            between two timestamps and the timestamp it is valid at.
+
+        :returns: The revocation state.
+        """
+
+        key = (_get_id(revoc_reg_def), cred_revoc_id)
+
+        # Calls for the same credential run one after the other; the lock is
+        # dropped once no call uses it anymore
+        lock_entry = self._locks.get(key)
+        if lock_entry is None:
+            lock_entry = self._locks[key] = [asyncio.Lock(), 0]
+        lock_entry[1] += 1
+        try:
+            async with lock_entry[0]:
+                return await self._get_state(
+                    key, tails_reader_handle, revoc_reg_def, timestamp,
+                    fetch_delta
+                )
+        finally:
+            lock_entry[1] -= 1
+            if not lock_entry[1]:
+                del self._locks[key]
+
+    async def _get_state(self, key: Tuple[str, str],
+                         tails_reader_handle: int,
+                         revoc_reg_def: Union[dict, str, EncodedJson],
+                         timestamp: int, fetch_delta: FetchDelta) -> dict:
+        from ._commands.anoncreds import Anoncreds
+
+        cred_revoc_id = key[1]
+        cached = self._states.get(key)
+        if cached is not None and cached[0] == timestamp:
+            self._hits += 1
+            return cached[1]
+
+        if cached is not None and cached[0] < timestamp:
+            cached_timestamp, cached_state = cached
+            revoc_reg_delta, delta_timestamp = \
+                await fetch_delta(cached_timestamp, timestamp)
+            if delta_timestamp == cached_timestamp:
+                # The registry did not change since the cached state
+                self._hits += 1
+                return cached_state
+
+            revoc_state = await Anoncreds.update_revocation_state(
+                tails_reader_handle, cached_state, revoc_reg_def,
+                revoc_reg_delta, delta_timestamp, cred_revoc_id
+            )
+            self._updated += 1
+        else:
+            revoc_reg_delta, delta_timestamp = \
+                await fetch_delta(None, timestamp)
+            revoc_state = await Anoncreds.create_revocation_state(
+                tails_reader_handle, revoc_reg_def, revoc_reg_delta,
+                delta_timestamp, cred_revoc_id
+            )
+            self._created += 1
+
+        if cached is None or cached[0] < delta_timestamp:
+            self._states[key] = (delta_timestamp, revoc_state)
+            if self._path is not None:
+                await self._save_batched()
+        return revoc_state
+
+    async def _save_batched(self):
+
+        # All states cached until a pending save starts are written by it, so
+        # at most one save runs and one waits, however many states change
+        if self._pending_save is None:
+            self._pending_save = asyncio.ensure_future(self._run_save())
+        await asyncio.shield(self._pending_save)
+
+    async def _run_save(self):
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+
+        async with self._save_lock:
+            self._pending_save = None
+            await asyncio.get_running_loop().run_in_executor(None, self.save)
+
+    def invalidate(self, revoc_reg_id: str,
+                   cred_revoc_id: Optional[str] = None):
+        """Removes cached states.
+
+        :param revoc_reg_id  : The ID of the revocation registry.
+        :param cred_revoc_id : The revocation ID of the credential.
+            Optional; Defaults to: All credentials of the registry
+        """
+
+        for key in [key for key in self._states if key[0] == revoc_reg_id and
+                    cred_revoc_id in (None, key[1])]:
+            del self._states[key]
+
+    def save(self):
+        """Writes the cached states to the file of the cache.
+
+        The file is replaced at once, so it is never left half written. Saves
+        run one at a time and each writes the states as they are when it
+        starts, so an older set of states never overwrites a newer one.
+        """
+
+        if self._path is None:
+            raise ValueError('Revocation state cache has no file!')
+
+        with self._file_lock:
+            states = [
+                {'revoc_reg_id': revoc_reg_id,
+                 'cred_revoc_id': cred_revoc_id,
+                 'timestamp': timestamp, 'revoc_state': revoc_state}
+                for (revoc_reg_id, cred_revoc_id), (timestamp, revoc_state)
+                in list(self._states.items())
+            ]
+            temporary_path = f'{self._path}.tmp'
+            with open(temporary_path, 'w') as states_file:
+                json.dump(states, states_file)
+            os.replace(temporary_path, self._path)
+
+    def _load(self):
+        with open(self._path) as states_file:
+            states = json.load(states_file)
+
+        for state in states:
+            key = (state['revoc_reg_id'], state['cred_revoc_id'])
+            self._states[key] = (state['timestamp'], state['revoc_state'])
+
+
+def _get_id(revoc_reg_def: Union[dict, str, EncodedJson]) -> str:
+    if isinstance(revoc_reg_def, EncodedJson):
+        revoc_reg_def = revoc_reg_def.value
+    if isinstance(revoc_reg_def, str):
+        revoc_reg_def = _codec.CODEC.decode(revoc_reg_def.encode('utf-8'))
+    return revoc_reg_def['id']
@@ -0,0 +1,281 @@
+import asyncio
+from time import perf_counter
+from typing import (AsyncIterator, Callable, Dict, Iterable, List, Optional,
+                    Tuple, Union)
+
+from . import _codec
+from ._encoded import EncodedJson
+
+
+class CredentialSearch:
+    """Iterates over the credentials in a prover wallet that match a query.
+
+    The search is opened when the iteration starts. While the caller works
+    on a page of credentials, the next page is already fetched from Libindy.
+    The page size adapts to how long fetching a page takes, so pages grow as
+    long as Libindy returns them quickly. The search handle is closed when
+    the iteration ends, fails or is cancelled:
+
+        async with CredentialSearch(wallet_handle, query) as search:
+            async for cred_info in search:
+                ...
+
+    Without `async with`, leaving the iteration early only closes the search
+    once the iterator is closed (e.g. by `contextlib.aclosing()`).
+    """
+
+    def __init__(self, wallet_handle: int,
+                 query: Optional[Union[dict, str]] = None,
+                 page_size: int = 32, min_page_size: int = 8,
+                 max_page_size: int = 1024, target_latency: float = 0.05):
+        """
+        :param wallet_handle  : The handle of the prover wallet.
+        :param query          : The WQL query the credentials have to match.
+            Optional; Defaults to: All credentials
+        :param page_size      : The amount of credentials fetched first.
+            Optional; Defaults to: `32`
+        :param min_page_size  : The smallest amount of credentials fetched at
+            once.
+            Optional; Defaults to: `8`
+        :param max_page_size  : The largest amount of credentials fetched at
+            once.
+            Optional; Defaults to: `1024`
+        :param target_latency : The seconds fetching a page should take. Pages
+            that are fetched faster than half of it double the page size,
+            pages that take longer halve it.
+            Optional; Defaults to: `0.05`
+        """
+
+        if not 1 <= min_page_size <= page_size <= max_page_size:
+            raise ValueError(f'Page sizes have to satisfy 1 <= min_page_size '
+                             f'<= page_size <= max_page_size; got '
+                             f'{min_page_size}, {page_size}, '
+                             f'{max_page_size}!')
+
+        self._wallet_handle: int = wallet_handle
+        self._query: Union[dict, str] = {} if query is None else query
+        self._page_size: int = page_size
+        self._min_page_size: int = min_page_size
+        self._max_page_size: int = max_page_size
+        self._target_latency: float = target_latency
+        self._total_count: Optional[int] = None
+        self._iterator: Optional[AsyncIterator[dict]] = None
+
+    # -------------------------------------------------------------------------
+    #  Properties
+    # -------------------------------------------------------------------------
+    @property
+    def total_count(self) -> Optional[int]:
+        """The amount of matching credentials; `None` until the search was
+        opened."""
+        return self._total_count
+
+    @property
+    def page_size(self) -> int:
+        """The amount of credentials the next page is fetched with."""
+        return self._page_size
+
+    # -------------------------------------------------------------------------
+    #  Methods
+    # -------------------------------------------------------------------------
+    def __aiter__(self) -> AsyncIterator[dict]:
+        if self._iterator is not None:
+            raise RuntimeError('A credential search can only be run once!')
+        self._iterator = self._run()
+        return self._iterator
+
+    async def __aenter__(self) -> 'CredentialSearch':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._iterator is not None:
+            await self._iterator.aclose()
+
+    async def _run(self) -> AsyncIterator[dict]:
+        from ._commands.anoncreds import Anoncreds
+
+        search_handle, self._total_count = \
+            await Anoncreds.open_credential_search(self._wallet_handle,
+                                                   self._query)
+        fetch: Optional[asyncio.Future] = None
+        try:
+            remaining = self._total_count
+            if remaining:
+                fetch = asyncio.ensure_future(
+                    self._fetch(Anoncreds, search_handle)
+                )
+
+            while fetch is not None:
+                page_size, credentials = await fetch
+                remaining -= len(credentials)
+
+                # Fetch the next page while the caller works on this one
+                fetch = None
+                if remaining > 0 and len(credentials) == page_size:
+                    fetch = asyncio.ensure_future(
+                        self._fetch(Anoncreds, search_handle)
+                    )
+
+                for credential in credentials:
+                    yield credential
+
+        finally:
+            # The search is closed in its own task, so a cancellation of the
+            # caller cannot interrupt it
+            await asyncio.shield(asyncio.ensure_future(_close_search(
+                Anoncreds.close_credential_search, search_handle,
+                () if fetch is None else (fetch,)
+            )))
+
+    async def _fetch(self, anoncreds: type, search_handle: int) -> tuple:
+        page_size = self._page_size
+        start = perf_counter()
+        credentials = await anoncreds.get_credentials_from_search(
+            search_handle, page_size
+        )
+        self._adapt_page_size(perf_counter() - start)
+        return page_size, credentials
+
+    def _adapt_page_size(self, latency: float):
+        if latency < self._target_latency / 2:
+            self._page_size = min(self._page_size * 2, self._max_page_size)
+        elif latency > self._target_latency:
+            self._page_size = max(self._page_size // 2, self._min_page_size)
+
+
+class ProofRequestSearch:
+    """Fetches the credentials for all referents of a proof request at once.
+
+    Libindy searches the credentials of every attribute and predicate
+    referent separately. Instead of one round trip after the other, the
+    fetches for all referents are handed to Libindy together. The credentials
+    can be collected into one mapping:
+
+        credentials = await ProofRequestSearch(wallet_handle,
+                                               proof_req).fetch_all()
+
+    or streamed per referent as soon as they arrive:
+
+        async with ProofRequestSearch(wallet_handle, proof_req) as search:
+            async for referent, credentials in search:
+                ...
+
+    The search handle is closed when the fetches are done, failed or were
+    cancelled.
+    """
+
+    def __init__(self, wallet_handle: int,
+                 proof_req: Union[dict, str, EncodedJson],
+                 extra_query: Optional[Union[dict, str]] = None,
+                 limit: int = 100,
+                 limits: Optional[Dict[str, int]] = None):
+        """
+        :param wallet_handle : The handle of the prover wallet.
+        :param proof_req     : The proof request.
+        :param extra_query   : Additional WQL queries by referent.
+            Optional
+        :param limit         : The maximal amount of credentials fetched per
+            referent.
+            Optional; Defaults to: `100`
+        :param limits        : Different maximal amounts of credentials for
+            single referents.
+            Optional
+        """
+
+        if limit < 1 or any(value < 1 for value in (limits or {}).values()):
+            raise ValueError('Credential limits have to be at least 1!')
+
+        self._wallet_handle: int = wallet_handle
+        self._proof_req: Union[dict, str, EncodedJson] = proof_req
+        self._extra_query: Union[dict, str] = \
+            {} if extra_query is None else extra_query
+        self._limit: int = limit
+        self._limits: Dict[str, int] = limits or {}
+        self._iterator: Optional[AsyncIterator[Tuple[str, list]]] = None
+
+    # -------------------------------------------------------------------------
+    #  Properties
+    # -------------------------------------------------------------------------
+    @property
+    def referents(self) -> List[str]:
+        """The attribute and predicate referents of the proof request."""
+        proof_req = self._proof_req
+        if isinstance(proof_req, EncodedJson):
+            proof_req = proof_req.value
+        if isinstance(proof_req, str):
+            proof_req = _codec.CODEC.decode(proof_req.encode('utf-8'))
+
+        return [*proof_req.get('requested_attributes', {}),
+                *proof_req.get('requested_predicates', {})]
+
+    # -------------------------------------------------------------------------
+    #  Methods
+    # -------------------------------------------------------------------------
+    def __aiter__(self) -> AsyncIterator[Tuple[str, list]]:
+        if self._iterator is not None:
+            raise RuntimeError('A proof request search can only be run once!')
+        self._iterator = self._run()
+        return self._iterator
+
+    async def __aenter__(self) -> 'ProofRequestSearch':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._iterator is not None:
+            await self._iterator.aclose()
+
+    async def fetch_all(self) -> Dict[str, list]:
+        """Fetches the credentials of all referents.
+
+        :returns: The credentials by referent.
+        """
+
+        async with self:
+            return {referent: credentials
+                    async for referent, credentials in self}
+
+    async def _run(self) -> AsyncIterator[Tuple[str, list]]:
+        from ._commands.anoncreds import Anoncreds
+
+        referents = self.referents
+        search_handle = await Anoncreds.open_proof_request_search(
+            self._wallet_handle, self._proof_req, self._extra_query
+        )
+        fetches: Dict[asyncio.Future, str] = {}
+        try:
+            for referent in referents:
+                fetch = asyncio.ensure_future(
+                    Anoncreds.get_credentials_from_proof_request_search(
+                        search_handle, referent,
+                        self._limits.get(referent, self._limit)
+                    )
+                )
+                fetches[fetch] = referent
+
+            pending = set(fetches)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for fetch in done:
+                    yield fetches[fetch], fetch.result()
+
+        finally:
+            await asyncio.shield(asyncio.ensure_future(_close_search(
+                Anoncreds.close_proof_request_search, search_handle, fetches
+            )))
+
+
+async def _close_search(close_command: Callable, search_handle: int,
+                        fetches: Iterable[asyncio.Future]):
+
+    # Libindy must not close a search while credentials are fetched from it.
+    # Errors of the fetches are raised by the iteration, if at all.
+    fetches = list(fetches)
+    if fetches:
+        await asyncio.wait(fetches)
+        for fetch in fetches:
+            if not fetch.cancelled():
+                fetch.exception()
+
+    await close_command(search_handle)
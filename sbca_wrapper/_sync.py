@@ -0,0 +1,43 @@
+from typing import Callable
+
+from ._command import REGISTERED_COMMANDS
+
+
+class SyncCommands:
+    """Exposes the commands of a command class as blocking functions.
+
+    The blocking functions take the same arguments as the commands, but wait
+    for Libindy in the calling thread and return the result directly, so they
+    can be used without an event loop (e.g. in WSGI or Celery workers). Each
+    function is built on its first access.
+    """
+
+    def __init__(self, command_class: type):
+        """
+        :param command_class : The class that defines the commands, e.g.
+            `Wallet`.
+        """
+
+        self._command_class: type = command_class
+
+    def __getattr__(self, name: str) -> Callable:
+        registered_command = REGISTERED_COMMANDS.get(
+            f'{self._command_class.__qualname__}.{name}'
+        )
+        if registered_command is None:
+            raise AttributeError(f'{self._command_class.__qualname__} has no '
+                                 f'command {name!r}')
+
+        sync_command_function = registered_command[0].bind_sync()
+        setattr(self, name, sync_command_function)
+        return sync_command_function
+
+    def __dir__(self):
+        prefix = f'{self._command_class.__qualname__}.'
+        return sorted(set(super().__dir__()) | {
+            qualname[len(prefix):] for qualname in REGISTERED_COMMANDS
+            if qualname.startswith(prefix)
+        })
+
+    def __repr__(self) -> str:
+        return f'<SyncCommands {self._command_class.__qualname__}>'
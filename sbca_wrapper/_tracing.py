@@ -0,0 +1,80 @@
+import logging
+from typing import Any, List, Optional, Sequence
+
+_LOGGER = logging.getLogger('libindy').getChild('tracing')
+
+
+class CommandHook:
+    """Receives the lifecycle events of Libindy command calls.
+
+    Hooks are registered with `Libindy.add_hook()`. Subclasses override the
+    events they are interested in. Whatever `on_start()` returns is passed to
+    the other events of the same call as `state`, which allows hooks to keep
+    a span or similar per call.
+
+    `on_start()` and `on_complete()` run in the context of the calling task,
+    so context variables (e.g. the current span) can be read and set there.
+    `on_native_submit()` runs right after the command was handed to Libindy.
+    """
+
+    def on_start(self, command_name: str, args: dict) -> Any:
+        """Called before the command arguments are encoded.
+
+        :param command_name : The Libindy name of the command.
+        :param args         : The command arguments by name, as passed by the
+            caller.
+
+        :returns: A state object for the other events of this call.
+        """
+        return None
+
+    def on_native_submit(self, state: Any, command_handle: int):
+        """Called after Libindy accepted the command.
+
+        :param state          : The object returned by `on_start()`.
+        :param command_handle : The handle the command runs on.
+        """
+
+    def on_complete(self, state: Any, result: Any,
+                    error: Optional[BaseException],
+                    timings: Optional[Sequence[float]]):
+        """Called when the command call finished.
+
+        :param state   : The object returned by `on_start()`.
+        :param result  : The decoded command result; `None` on errors.
+        :param error   : The error the call raised, if any.
+        :param timings : The phase timestamps of the call if phase timing is
+            enabled (see `Libindy.set_phase_timing()`).
+        """
+
+
+class CommandSpan:
+    """Dispatches the events of one command call to the registered hooks."""
+
+    __slots__ = ('_hooks', '_states')
+
+    def __init__(self, hooks: Sequence[CommandHook], command_name: str,
+                 args: dict):
+        self._hooks: Sequence[CommandHook] = hooks
+        self._states: List[Any] = []
+        for hook in hooks:
+            try:
+                self._states.append(hook.on_start(command_name, args))
+            except Exception:
+                _LOGGER.exception(f'Hook {hook!r} failed on start!')
+                self._states.append(None)
+
+    def submitted(self, command_handle: int):
+        for hook, state in zip(self._hooks, self._states):
+            try:
+                hook.on_native_submit(state, command_handle)
+            except Exception:
+                _LOGGER.exception(f'Hook {hook!r} failed on native submit!')
+
+    def complete(self, result: Any, error: Optional[BaseException],
+                 timings: Optional[Sequence[float]]):
+        for hook, state in zip(self._hooks, self._states):
+            try:
+                hook.on_complete(state, result, error, timings)
+            except Exception:
+                _LOGGER.exception(f'Hook {hook!r} failed on complete!')
@@ -0,0 +1,28 @@
+"""Blocking versions of the Libindy commands.
+
+The command classes in here mirror the ones of the package, but their
+commands wait for Libindy in the calling thread instead of returning an
+awaitable:
+
+    from sbca_wrapper.sync import Wallet
+    wallet_handle = Wallet.open_wallet(wallet_config, wallet_credentials)
+"""
+import importlib
+
+from . import _COMMAND_CLASSES
+from ._sync import SyncCommands
+
+__all__ = sorted(_COMMAND_CLASSES)
+
+
+def __getattr__(name: str) -> SyncCommands:
+    if name not in _COMMAND_CLASSES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    package = importlib.import_module(__package__)
+    sync_commands = globals()[name] = SyncCommands(getattr(package, name))
+    return sync_commands
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_COMMAND_CLASSES))
@@ -11,7 +11,12 @@ setup(
 
     packages=find_packages(exclude=['docs', 'test']),
 
-    python_requires='~=3.6',
+    python_requires='~=3.7',
+    extras_require={
+        # orjson decodes integers wider than 64 bits as floats; Libindy
+        # writes its big numbers (e.g. credential values) as strings
+        'orjson': ['orjson']
+    },
 
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -26,7 +31,6 @@ setup(
 
         'Programming Language :: Python :: 3',
         'Programming Language :: Python :: 3 :: Only',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
 
@@ -0,0 +1,144 @@
+"""A stand-in for the Libindy C-library, so the tests run without Libindy.
+
+The commands are C-functions implemented in Python. Like Libindy, they
+return right away and answer through their callback on a worker thread.
+"""
+import itertools
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import CFUNCTYPE, c_char_p, c_int32, c_uint64
+
+from sbca_wrapper import LIBINDY
+from sbca_wrapper._libindy import Libindy
+
+_STR_CALLBACK = CFUNCTYPE(None, c_int32, c_int32, c_char_p)
+_HANDLE_CALLBACK = CFUNCTYPE(None, c_int32, c_int32, c_int32)
+_EMPTY_CALLBACK = CFUNCTYPE(None, c_int32, c_int32)
+
+_PROTOTYPES = {
+    'indy_abbreviate_verkey': CFUNCTYPE(c_int32, c_int32, c_char_p,
+                                        c_char_p, _STR_CALLBACK),
+    'indy_open_wallet': CFUNCTYPE(c_int32, c_int32, c_char_p, c_char_p,
+                                  _HANDLE_CALLBACK),
+    'indy_close_wallet': CFUNCTYPE(c_int32, c_int32, c_int32,
+                                   _EMPTY_CALLBACK),
+    'indy_create_revocation_state': CFUNCTYPE(
+        c_int32, c_int32, c_int32, c_char_p, c_char_p, c_uint64, c_char_p,
+        _STR_CALLBACK
+    ),
+    'indy_update_revocation_state': CFUNCTYPE(
+        c_int32, c_int32, c_int32, c_char_p, c_char_p, c_char_p, c_uint64,
+        c_char_p, _STR_CALLBACK
+    )
+}
+
+
+class FakeLibindy:
+    """Implements the few Libindy commands that the tests call.
+
+    Responses are held back while `gate` is cleared. `calls` counts the calls
+    of every command and `closed_wallets` holds the closed wallet handles.
+    """
+
+    def __init__(self):
+        self.gate: threading.Event = threading.Event()
+        self.gate.set()
+        self.calls: dict = {name: 0 for name in _PROTOTYPES}
+        self.closed_wallets: list = []
+        self._wallet_handles = itertools.count(1)
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
+    def __getattr__(self, name: str):
+        if name not in _PROTOTYPES:
+            raise AttributeError(name)
+        return self[name]
+
+    def __getitem__(self, name: str):
+        # Like a CDLL, every lookup returns a new function object
+        function = _PROTOTYPES[name](getattr(self, f'_{name}'))
+        function.__name__ = name
+        return function
+
+    @staticmethod
+    def indy_set_logger(context, enabled_callback, log_callback, flush):
+        return 0
+
+    def _respond(self, callback, command_handle: int, *values):
+        def respond():
+            self.gate.wait()
+            callback(command_handle, 0, *values)
+
+        self._executor.submit(respond)
+        return 0
+
+    def _indy_abbreviate_verkey(self, command_handle: int, did: bytes,
+                                verkey: bytes, callback):
+        self.calls['indy_abbreviate_verkey'] += 1
+        if verkey.startswith(did):
+            verkey = b'~' + verkey[len(did):]
+        return self._respond(callback, command_handle, verkey)
+
+    def _indy_open_wallet(self, command_handle: int, config: bytes,
+                          credentials: bytes, callback):
+        self.calls['indy_open_wallet'] += 1
+        return self._respond(callback, command_handle,
+                             next(self._wallet_handles))
+
+    def _indy_close_wallet(self, command_handle: int, wallet_handle: int,
+                           callback):
+        self.calls['indy_close_wallet'] += 1
+        self.closed_wallets.append(wallet_handle)
+        return self._respond(callback, command_handle)
+
+    # Revocation states name the delta they were built from and the state
+    # they were updated from
+    def _indy_create_revocation_state(self, command_handle: int,
+                                      tails_reader_handle: int,
+                                      revoc_reg_def: bytes,
+                                      revoc_reg_delta: bytes,
+                                      timestamp: int, cred_revoc_id: bytes,
+                                      callback):
+        self.calls['indy_create_revocation_state'] += 1
+        revoc_state = {'timestamp': timestamp,
+                       'delta': json.loads(revoc_reg_delta),
+                       'cred_revoc_id': cred_revoc_id.decode()}
+        return self._respond(callback, command_handle,
+                             json.dumps(revoc_state).encode())
+
+    def _indy_update_revocation_state(self, command_handle: int,
+                                      tails_reader_handle: int,
+                                      revoc_state: bytes,
+                                      revoc_reg_def: bytes,
+                                      revoc_reg_delta: bytes,
+                                      timestamp: int, cred_revoc_id: bytes,
+                                      callback):
+        self.calls['indy_update_revocation_state'] += 1
+        revoc_state = {'timestamp': timestamp,
+                       'delta': json.loads(revoc_reg_delta),
+                       'cred_revoc_id': cred_revoc_id.decode(),
+                       'updated_from': json.loads(revoc_state)['timestamp']}
+        return self._respond(callback, command_handle,
+                             json.dumps(revoc_state).encode())
+
+
+_FAKE_LIBINDY = None
+
+
+def install() -> FakeLibindy:
+    """Sets up `LIBINDY` with the fake library, once per test run.
+
+    :returns: The fake library.
+    """
+
+    global _FAKE_LIBINDY
+    if _FAKE_LIBINDY is None:
+        if Libindy._LIBRARY is not None:
+            raise RuntimeError('Libindy was loaded before the fake library!')
+        _FAKE_LIBINDY = FakeLibindy()
+        Libindy._load_library = staticmethod(lambda: _FAKE_LIBINDY)
+        LIBINDY.library
+
+    Libindy._SHUTTING_DOWN = False
+    _FAKE_LIBINDY.gate.set()
+    return _FAKE_LIBINDY
@@ -0,0 +1,163 @@
+import asyncio
+import time
+import unittest
+
+import fake_libindy
+from sbca_wrapper import LIBINDY, Priority, deadline, priority
+from sbca_wrapper._admission import current_priority
+from sbca_wrapper._admission import AdmissionQueue
+
+
+class AdmissionQueueTest(unittest.TestCase):
+
+    def test_waiters_are_admitted_by_priority(self):
+        async def run():
+            queue = AdmissionQueue(1)
+            await queue.acquire()
+            admitted = []
+
+            async def command(name: str, command_priority: Priority):
+                await queue.acquire(command_priority)
+                admitted.append(name)
+                queue.release()
+
+            tasks = [
+                asyncio.ensure_future(command(name, command_priority))
+                for name, command_priority in (
+                    ('bulk 1', Priority.BULK),
+                    ('default 1', Priority.DEFAULT),
+                    ('interactive', Priority.INTERACTIVE),
+                    ('bulk 2', Priority.BULK),
+                    ('default 2', Priority.DEFAULT)
+                )
+            ]
+            await asyncio.sleep(0)
+            self.assertEqual(queue.queued, 5)
+
+            queue.release()
+            await asyncio.gather(*tasks)
+            self.assertEqual(admitted, ['interactive', 'default 1',
+                                        'default 2', 'bulk 1', 'bulk 2'])
+            self.assertEqual(queue.active, 0)
+
+        asyncio.run(run())
+
+    def test_cancelled_waiter_is_skipped(self):
+        async def run():
+            queue = AdmissionQueue(1)
+            await queue.acquire()
+            first = asyncio.ensure_future(queue.acquire(Priority.INTERACTIVE))
+            second = asyncio.ensure_future(queue.acquire(Priority.BULK))
+            await asyncio.sleep(0)
+
+            first.cancel()
+            queue.release()
+            await asyncio.wait_for(second, 0.1)
+            self.assertEqual(queue.active, 1)
+            self.assertEqual(queue.queued, 0)
+
+        asyncio.run(run())
+
+    def test_raised_limit_admits_waiters(self):
+        async def run():
+            queue = AdmissionQueue(1)
+            await queue.acquire()
+            waiters = [asyncio.ensure_future(queue.acquire())
+                       for _ in range(2)]
+            await asyncio.sleep(0)
+
+            queue.set_limit(3)
+            await asyncio.wait_for(asyncio.gather(*waiters), 0.1)
+            self.assertEqual(queue.active, 3)
+
+        asyncio.run(run())
+
+    def test_priority_context(self):
+        async def read_priority():
+            return current_priority()
+
+        async def run():
+            self.assertEqual(current_priority(), Priority.DEFAULT)
+            with priority(Priority.BULK):
+                self.assertEqual(current_priority(), Priority.BULK)
+
+                # Tasks created within the block keep the priority
+                task = asyncio.ensure_future(read_priority())
+            self.assertEqual(current_priority(), Priority.DEFAULT)
+            self.assertEqual(await task, Priority.BULK)
+
+        asyncio.run(run())
+
+    def test_timeout_while_queued(self):
+        async def run():
+            queue = AdmissionQueue(1)
+            await queue.acquire()
+
+            start = time.monotonic()
+            with self.assertRaises(asyncio.TimeoutError):
+                await queue.acquire(Priority.DEFAULT, 0.1)
+            self.assertLess(time.monotonic() - start, 0.5)
+
+            # The expired waiter neither took a slot nor blocks later ones
+            self.assertEqual(queue.active, 1)
+            self.assertEqual(queue.queued, 0)
+            queue.release()
+            await asyncio.wait_for(queue.acquire(), 0.1)
+            self.assertEqual(queue.active, 1)
+
+        asyncio.run(run())
+
+    def test_timeout_over_before_queueing(self):
+        async def run():
+            queue = AdmissionQueue(1)
+            await queue.acquire()
+            with self.assertRaises(asyncio.TimeoutError):
+                await queue.acquire(Priority.DEFAULT, 0)
+            self.assertEqual(queue.queued, 0)
+
+        asyncio.run(run())
+
+    def test_timeout_with_capacity(self):
+        async def run():
+            queue = AdmissionQueue(1)
+            await queue.acquire(Priority.DEFAULT, 0)
+            self.assertEqual(queue.active, 1)
+
+        asyncio.run(run())
+
+
+class CommandDeadlineTest(unittest.TestCase):
+
+    def setUp(self):
+        fake_libindy.install()
+        LIBINDY.set_concurrency_limit('did', 1)
+
+    def tearDown(self):
+        LIBINDY.set_concurrency_limit('did', None)
+
+    def test_deadline_expires_while_queued(self):
+        from sbca_wrapper import DID
+
+        async def run():
+            # Take the only slot of the group, so the command has to queue
+            queue = LIBINDY.get_admission_queue('did')
+            await queue.acquire()
+            try:
+                start = time.monotonic()
+                with self.assertRaises(asyncio.TimeoutError):
+                    with deadline(0.1):
+                        await DID.abbreviate_verkey(
+                            'VsKV7grR1BUE29mG2Fm2kX',
+                            'GjZWsBLgZCR18aL468JAT7w9CZRiBnpxUPPgyQxh4voa'
+                        )
+                self.assertLess(time.monotonic() - start, 0.5)
+                self.assertEqual(queue.active, 1)
+                self.assertEqual(queue.queued, 0)
+            finally:
+                queue.release()
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from sbca_wrapper import JsonCodec, OrjsonCodec, StdlibJsonCodec
+
+
+class JsonCodecTest(unittest.TestCase):
+
+    def test_codec_has_to_implement_both_methods(self):
+        class EncodeOnlyCodec(JsonCodec):
+            def encode(self, value):
+                return b'{}'
+
+        with self.assertRaises(TypeError):
+            EncodeOnlyCodec()
+
+    def test_stdlib_codec(self):
+        codec = StdlibJsonCodec()
+        value = {'name': 'Alice', 'values': [1, 2 ** 70]}
+        self.assertEqual(codec.decode(codec.encode(value)), value)
+
+
+class OrjsonCodecTest(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            self.codec = OrjsonCodec()
+        except ImportError:
+            self.skipTest('orjson is not installed')
+
+    def test_round_trip(self):
+        value = {'name': 'Alice', 'values': [1, 2.5, None, True]}
+        self.assertEqual(self.codec.decode(self.codec.encode(value)), value)
+
+    def test_wide_integers_are_encoded(self):
+        value = {'value': 2 ** 70, 'values': [-2 ** 64]}
+        self.assertEqual(StdlibJsonCodec().decode(self.codec.encode(value)),
+                         value)
+
+    def test_unserializable_values_raise(self):
+        with self.assertRaises(TypeError):
+            self.codec.encode({'value': object()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import unittest
+
+from sbca_wrapper._completion import CompletionQueue
+
+
+class CompletionQueueTest(unittest.TestCase):
+
+    def test_completions_are_run_in_one_batch(self):
+        async def run():
+            loop = asyncio.get_running_loop()
+            completion_queue = CompletionQueue(loop)
+            wakeups = []
+            call_soon_threadsafe = loop.call_soon_threadsafe
+
+            def count_wakeup(*args):
+                wakeups.append(threading.current_thread())
+                return call_soon_threadsafe(*args)
+
+            loop.call_soon_threadsafe = count_wakeup
+            completed = []
+            done = loop.create_future()
+
+            def put_all():
+                for index in range(100):
+                    self.assertTrue(
+                        completion_queue.put(completed.append, index)
+                    )
+                completion_queue.put(done.set_result, None)
+
+            # The loop is blocked while the thread puts, so it is woken once
+            thread = threading.Thread(target=put_all)
+            thread.start()
+            thread.join()
+            await done
+
+            self.assertEqual(completed, list(range(100)))
+            self.assertEqual(len(wakeups), 1)
+
+        asyncio.run(run())
+
+    def test_failing_completion_does_not_drop_the_batch(self):
+        async def run():
+            loop = asyncio.get_running_loop()
+            errors = []
+            loop.set_exception_handler(
+                lambda _, context: errors.append(context['exception'])
+            )
+            completion_queue = CompletionQueue(loop)
+            completed = []
+            done = loop.create_future()
+
+            completion_queue.put(completed.append, 1)
+            completion_queue.put(lambda: 1 / 0)
+            completion_queue.put(completed.append, 2)
+            completion_queue.put(done.set_result, None)
+            await done
+
+            self.assertEqual(completed, [1, 2])
+            self.assertEqual(len(errors), 1)
+            self.assertIsInstance(errors[0], ZeroDivisionError)
+
+        asyncio.run(run())
+
+    def test_closed_loop_is_not_queued(self):
+        loop = asyncio.new_event_loop()
+        completion_queue = CompletionQueue(loop)
+        loop.close()
+        self.assertFalse(completion_queue.put(print))
+
+
+if __name__ == '__main__':
+    unittest.main()
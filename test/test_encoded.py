@@ -0,0 +1,104 @@
+import json
+import unittest
+
+from sbca_wrapper import EncodedJson, LedgerObjectCache
+from sbca_wrapper._command import _encode_str_or_collection
+
+
+class EncodedJsonTest(unittest.TestCase):
+
+    def test_value_is_encoded_once(self):
+        value = {'id': 'schema', 'attrNames': ['name', 'age']}
+        encoded_json = EncodedJson(value)
+        self.assertEqual(json.loads(encoded_json.encoded), value)
+        self.assertIs(_encode_str_or_collection(encoded_json),
+                      encoded_json.encoded)
+
+    def test_string_is_encoded_as_it_is(self):
+        encoded_json = EncodedJson('{"id": "schema"}')
+        self.assertEqual(encoded_json.encoded, b'{"id": "schema"}')
+
+    def test_known_encoding_is_kept(self):
+        encoded_json = EncodedJson({'id': 'schema'}, b'{"id":"schema"}')
+        self.assertEqual(encoded_json.encoded, b'{"id":"schema"}')
+
+    def test_mapping(self):
+        schema = {'id': 'schema', 'ver': '1.0'}
+        cred_def = EncodedJson({'id': 'cred_def'}, b'{"id": "cred_def"}')
+        mapping = EncodedJson.mapping({'schema': schema, 'cred_def': cred_def})
+
+        self.assertEqual(json.loads(mapping.encoded),
+                         {'schema': schema, 'cred_def': {'id': 'cred_def'}})
+        self.assertEqual(mapping.value,
+                         {'schema': schema, 'cred_def': {'id': 'cred_def'}})
+
+        # Encoded values are joined in as they are
+        self.assertIn(b'"cred_def":{"id": "cred_def"}', mapping.encoded)
+
+    def test_mapping_escapes_ids(self):
+        mapping = EncodedJson.mapping({'a"b': {'id': 'a"b'}})
+        self.assertEqual(json.loads(mapping.encoded), {'a"b': {'id': 'a"b'}})
+
+    def test_repr_does_not_show_the_value(self):
+        encoded_json = EncodedJson({'id': 'schema'})
+        self.assertEqual(repr(encoded_json),
+                         f'EncodedJson(<{len(encoded_json.encoded)} bytes>)')
+
+
+class LedgerObjectCacheTest(unittest.TestCase):
+
+    def test_objects_are_encoded_once(self):
+        cache = LedgerObjectCache()
+        cred_def = {'id': 'cred_def', 'value': {}}
+        first = cache.get(cred_def)
+        self.assertIs(cache.get(dict(cred_def)), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_encoded_objects_are_passed_through(self):
+        cache = LedgerObjectCache()
+        encoded_json = EncodedJson({'id': 'cred_def'})
+        self.assertIs(cache.get(encoded_json), encoded_json)
+        self.assertEqual(len(cache), 0)
+
+    def test_object_id(self):
+        cache = LedgerObjectCache()
+        with self.assertRaises(ValueError):
+            cache.get({'value': {}})
+        cache.get({'value': {}}, 'cred_def')
+        self.assertEqual(len(cache), 1)
+
+    def test_least_recently_used_objects_are_dropped(self):
+        cache = LedgerObjectCache(max_size=2)
+        first = cache.get({'id': 'first'})
+        cache.get({'id': 'second'})
+        self.assertIs(cache.get({'id': 'first'}), first)
+        cache.get({'id': 'third'})
+
+        # The second object was used least recently
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get({'id': 'first'}), first)
+        misses = cache.misses
+        cache.get({'id': 'second'})
+        self.assertEqual(cache.misses, misses + 1)
+
+    def test_mapping_uses_the_cache(self):
+        cache = LedgerObjectCache()
+        schema = cache.get({'id': 'schema'})
+        mapping = cache.mapping({'schema': {'id': 'schema'}})
+        self.assertEqual(mapping.encoded,
+                         b'{"schema":' + schema.encoded + b'}')
+        self.assertEqual(cache.hits, 1)
+
+    def test_clear(self):
+        cache = LedgerObjectCache()
+        cache.get({'id': 'schema'})
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_max_size_has_to_be_positive(self):
+        with self.assertRaises(ValueError):
+            LedgerObjectCache(max_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import mmap
+import os
+import tempfile
+import unittest
+from ctypes import (addressof, c_char, c_char_p, c_void_p, cast,
+                    create_string_buffer)
+
+from sbca_wrapper._command import _encode_bytes, _read_bytes, _read_memoryview
+
+
+def _bytes_address(data: bytes) -> int:
+    return cast(c_char_p(data), c_void_p).value
+
+
+class EncodeBytesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data = bytes(range(256)) * 16
+        file_descriptor, self.path = tempfile.mkstemp()
+        with os.fdopen(file_descriptor, 'wb') as data_file:
+            data_file.write(self.data)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _map(self, access: int) -> mmap.mmap:
+        with open(self.path, 'r+b') as data_file:
+            return mmap.mmap(data_file.fileno(), 0, access=access)
+
+    def test_bytes_are_passed_as_they_are(self):
+        encoded, length = _encode_bytes(self.data)
+        self.assertIs(encoded, self.data)
+        self.assertEqual(length, len(self.data))
+
+    def test_empty_buffer(self):
+        self.assertEqual(_encode_bytes(bytearray()), (b'', 0))
+
+    def test_bytearray_is_not_copied(self):
+        data = bytearray(self.data)
+        encoded, length = _encode_bytes(data)
+        self.assertEqual(length, len(data))
+        self.assertEqual(addressof(encoded),
+                         addressof((c_char * length).from_buffer(data)))
+
+    def test_writable_mmap_is_not_copied(self):
+        for access in (mmap.ACCESS_WRITE, mmap.ACCESS_COPY):
+            mapped = self._map(access)
+            encoded, length = _encode_bytes(mapped)
+            self.assertEqual(length, len(self.data))
+            mapped[0] = 255
+            self.assertEqual(encoded.raw[0], 255)
+            del encoded
+            mapped.close()
+
+    def test_read_only_mmap_is_not_copied(self):
+        mapped = self._map(mmap.ACCESS_READ)
+        encoded, length = _encode_bytes(mapped)
+        self.assertEqual(length, len(self.data))
+        self.assertEqual(encoded.raw, self.data)
+
+        # Changes of the file show through the shared mapping
+        with open(self.path, 'r+b') as data_file:
+            data_file.write(b'\xff')
+        self.assertEqual(encoded.raw[0], 255)
+
+        # The encoded array keeps the mapping from being closed
+        with self.assertRaises(BufferError):
+            mapped.close()
+        del encoded
+        mapped.close()
+
+    def test_bytes_slice_is_not_copied(self):
+        encoded, length = _encode_bytes(memoryview(self.data)[16:48])
+        self.assertEqual(length, 32)
+        self.assertEqual(addressof(encoded), _bytes_address(self.data) + 16)
+        self.assertEqual(encoded.raw, self.data[16:48])
+
+    def test_non_contiguous_buffer_is_copied(self):
+        encoded, length = _encode_bytes(memoryview(self.data)[::2])
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(length, len(self.data) // 2)
+        self.assertEqual(encoded, self.data[::2])
+
+
+class ReadBufferTest(unittest.TestCase):
+
+    def test_results_are_copied_out_of_the_buffer(self):
+        data = bytes(range(256))
+        for read_buffer in (_read_bytes, _read_memoryview):
+            buffer = create_string_buffer(data, len(data))
+            result = read_buffer(addressof(buffer), len(data))
+            self.assertEqual(bytes(result), data)
+
+            # Libindy frees the buffer after the callback
+            buffer[0] = b'\xff'
+            self.assertEqual(result[0], 0)
+
+    def test_memoryview_result(self):
+        buffer = create_string_buffer(b'message', 7)
+        result = _read_memoryview(addressof(buffer), 7)
+        self.assertIsInstance(result, memoryview)
+        self.assertTrue(result.readonly)
+        self.assertEqual(result[3:].tobytes(), b'sage')
+
+    def test_empty_result(self):
+        self.assertEqual(_read_bytes(None, 0), b'')
+        self.assertEqual(bytes(_read_memoryview(None, 0)), b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import asyncio
+import ctypes
+import threading
+import unittest
+from concurrent.futures import wait
+
+import fake_libindy
+from sbca_wrapper import LIBINDY, Wallet, sync
+from sbca_wrapper._libindy import Libindy
+
+
+class BadArgumentTest(unittest.TestCase):
+
+    def setUp(self):
+        fake_libindy.install()
+        LIBINDY.set_concurrency_limit('wallet', 1)
+
+    def tearDown(self):
+        LIBINDY.set_concurrency_limit('wallet', None)
+
+    def test_bad_argument_frees_the_command_slots(self):
+        async def run():
+            with self.assertRaises(ctypes.ArgumentError):
+                await Wallet.close_wallet('not a wallet handle')
+
+            self.assertEqual(LIBINDY.commands_in_flight, 0)
+            queue = LIBINDY.get_admission_queue('wallet')
+            self.assertEqual(queue.active, 0)
+
+            # The slot of the group is free for the next command
+            await asyncio.wait_for(Wallet.close_wallet(1), 1.0)
+            self.assertEqual(queue.active, 0)
+
+        asyncio.run(run())
+
+    def test_bad_argument_of_blocking_command(self):
+        with self.assertRaises(ctypes.ArgumentError):
+            sync.Wallet.close_wallet('not a wallet handle')
+        self.assertEqual(LIBINDY.commands_in_flight, 0)
+
+
+class ShutdownTest(unittest.TestCase):
+
+    def setUp(self):
+        self.fake_libindy = fake_libindy.install()
+
+    def tearDown(self):
+        Libindy._SHUTTING_DOWN = False
+        self.fake_libindy.gate.set()
+
+    def test_resources_opened_during_shutdown_are_closed(self):
+        async def run():
+            self.fake_libindy.gate.clear()
+            open_wallet = asyncio.ensure_future(
+                Wallet.open_wallet({'id': 'wallet'}, {'key': 'key'})
+            )
+            await asyncio.sleep(0)
+
+            self.assertFalse(await LIBINDY.shutdown(timeout=0.05))
+            closed_wallets = len(self.fake_libindy.closed_wallets)
+            self.fake_libindy.gate.set()
+            with self.assertRaises(RuntimeError):
+                await open_wallet
+
+            for _ in range(100):
+                if not LIBINDY.commands_in_flight:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(LIBINDY.commands_in_flight, 0)
+            self.assertEqual(len(self.fake_libindy.closed_wallets),
+                             closed_wallets + 1)
+            self.assertEqual(LIBINDY.open_resources, [])
+
+        asyncio.run(run())
+
+    def test_detached_closes_share_one_callback(self):
+        close_callback = Libindy._CLOSE_CALLBACK
+        self.assertIsNotNone(close_callback)
+
+        # Detached closes run on the Libindy threads, many at once
+        closed = []
+        threads = [
+            threading.Thread(target=lambda handle=handle: closed.append(
+                LIBINDY._close_detached('indy_close_wallet', handle)
+            ))
+            for handle in range(1000, 1008)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        done, _ = wait(closed, timeout=1.0)
+        self.assertTrue(all(future.result() for future in done))
+        self.assertEqual(len(done), len(threads))
+        self.assertIs(Libindy._CLOSE_CALLBACK, close_callback)
+
+    def test_commands_are_rejected_during_shutdown(self):
+        async def run():
+            await LIBINDY.shutdown(timeout=0.05)
+            with self.assertRaises(RuntimeError):
+                await Wallet.close_wallet(1)
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
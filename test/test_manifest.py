@@ -0,0 +1,59 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from sbca_wrapper import _manifest, _manifest_data
+
+
+class ManifestTest(unittest.TestCase):
+
+    def test_manifest_is_up_to_date(self):
+        # Run `python -m sbca_wrapper._manifest` to regenerate it
+        self.assertEqual(_manifest.generate(), _manifest_data.COMMANDS)
+
+    def test_stored_signature_is_loaded(self):
+        from sbca_wrapper._command import REGISTERED_COMMANDS
+
+        _manifest.generate()
+        libindy_command, command = REGISTERED_COMMANDS['DID.abbreviate_verkey']
+        self.assertIs(
+            _manifest.load(libindy_command.command_name, command),
+            _manifest_data.COMMANDS['DID.abbreviate_verkey']
+        )
+        self.assertIsNone(_manifest.load('indy_other_command', command))
+
+        def abbreviate_verkey(did: str, full_verkey: str) -> str:
+            pass
+
+        abbreviate_verkey.__qualname__ = command.__qualname__
+        self.assertIsNone(
+            _manifest.load(libindy_command.command_name, abbreviate_verkey)
+        )
+
+    def test_check_finds_changed_types(self):
+        commands = dict(_manifest.generate())
+        command_name, args, returns = commands['DID.abbreviate_verkey']
+        commands['DID.abbreviate_verkey'] = (
+            command_name, args[:1] + (('verkey', 'str', True),), returns
+        )
+        outdated_source = _manifest._format(commands)
+
+        file_descriptor, path = tempfile.mkstemp(suffix='.py')
+        with os.fdopen(file_descriptor, 'w') as manifest_file:
+            manifest_file.write(outdated_source)
+        manifest_path = _manifest._MANIFEST_PATH
+        _manifest._MANIFEST_PATH = path
+        try:
+            with contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(_manifest.main(['--check']), 1)
+            with open(path) as manifest_file:
+                self.assertEqual(manifest_file.read(), outdated_source)
+        finally:
+            _manifest._MANIFEST_PATH = manifest_path
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
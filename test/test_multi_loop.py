@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import unittest
+
+import fake_libindy
+from sbca_wrapper import DID, LIBINDY, sync
+
+LOOPS = 8
+COMMANDS = 250
+
+
+def _make_arguments(name: str) -> list:
+    # Every other verkey starts with the DID, so both kinds of results occur
+    arguments = []
+    for index in range(COMMANDS):
+        did = f'{name}-{index}'
+        verkey = f'{did}-verkey' if index % 2 else f'verkey-{did}'
+        arguments.append((did, verkey))
+    return arguments
+
+
+def _abbreviate_verkey(did: str, verkey: str) -> str:
+    return '~' + verkey[len(did):] if verkey.startswith(did) else verkey
+
+
+class MultiLoopTest(unittest.TestCase):
+    """Runs commands on many event loops and blocking threads at once.
+
+    Every call gets its own arguments, so lost or cross-delivered responses
+    show up as wrong results.
+    """
+
+    def setUp(self):
+        fake_libindy.install()
+
+    def test_responses_reach_their_callers(self):
+        errors = []
+
+        def run_loop(name: str):
+            arguments = _make_arguments(name)
+
+            async def main():
+                return await asyncio.gather(*(
+                    DID.abbreviate_verkey(did, verkey)
+                    for did, verkey in arguments
+                ))
+
+            results = asyncio.run(main())
+            errors.extend(
+                (argument, result) for argument, result
+                in zip(arguments, results)
+                if result != _abbreviate_verkey(*argument)
+            )
+
+        def run_sync(name: str):
+            for argument in _make_arguments(name):
+                result = sync.DID.abbreviate_verkey(*argument)
+                if result != _abbreviate_verkey(*argument):
+                    errors.append((argument, result))
+
+        threads = [
+            threading.Thread(target=target, args=(f'{target.__name__}-{i}',))
+            for i in range(LOOPS) for target in (run_loop, run_sync)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30.0)
+
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual(errors, [])
+        self.assertEqual(LIBINDY.commands_in_flight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import logging
+import unittest
+
+from sbca_wrapper._native_log import TRACE, NativeLogger
+
+
+class _Library:
+    """Records the calls of the native logger to Libindy."""
+
+    def __init__(self):
+        self.max_levels = []
+
+    def indy_set_logger(self, context, enabled, log, flush):
+        return 0
+
+    def indy_set_log_max_lvl(self, max_level):
+        self.max_levels.append(max_level.value)
+        return 0
+
+
+class NativeLoggerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger('test_native_log')
+        self.logger.setLevel(logging.WARNING)
+        self.library = _Library()
+        self.native_logger = NativeLogger(self.logger)
+        self.native_logger.install(self.library)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        self.logger.setLevel(logging.NOTSET)
+        self.logger.getChild('indy.commands').setLevel(logging.NOTSET)
+
+    def test_level_is_passed_on_at_install(self):
+        self.assertEqual(self.library.max_levels, [2])
+
+    def test_level_changes_are_passed_on(self):
+        child = self.logger.getChild('indy.commands')
+        child.setLevel(logging.DEBUG)
+        self.assertEqual(self.library.max_levels[-1], 4)
+
+        child.setLevel(TRACE)
+        self.assertEqual(self.library.max_levels[-1], 5)
+
+        child.setLevel(logging.NOTSET)
+        self.logger.setLevel(logging.ERROR)
+        self.assertEqual(self.library.max_levels[-1], 1)
+
+    def test_disabled_levels_are_passed_on(self):
+        self.logger.setLevel(logging.DEBUG)
+        logging.disable(logging.INFO)
+        self.assertEqual(self.library.max_levels[-1], 2)
+
+        logging.disable(logging.CRITICAL)
+        self.assertEqual(self.library.max_levels[-1], 0)
+
+    def test_enabled_callback(self):
+        self.logger.getChild('indy.commands').setLevel(logging.INFO)
+        enabled = self.native_logger._enabled
+        self.assertTrue(enabled(None, 3, b'indy::commands'))
+        self.assertFalse(enabled(None, 4, b'indy::commands'))
+        self.assertFalse(enabled(None, 3, b'indy::api'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+import sbca_wrapper
+from sbca_wrapper import _COMMAND_CLASSES
+
+
+class PackageTest(unittest.TestCase):
+
+    def test_star_import(self):
+        namespace = {}
+        exec('from sbca_wrapper import *', namespace)
+        for name in _COMMAND_CLASSES:
+            self.assertIs(namespace[name], getattr(sbca_wrapper, name))
+        self.assertIn('LIBINDY', namespace)
+        self.assertNotIn('importlib', namespace)
+
+    def test_star_import_of_blocking_commands(self):
+        from sbca_wrapper import sync
+
+        namespace = {}
+        exec('from sbca_wrapper.sync import *', namespace)
+        for name in _COMMAND_CLASSES:
+            self.assertIs(namespace[name], getattr(sync, name))
+
+    def test_all_names_exist(self):
+        for name in sbca_wrapper.__all__:
+            self.assertTrue(hasattr(sbca_wrapper, name), name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import threading
+import unittest
+
+from sbca_wrapper._libindy import _LOOP_BITS, _LOOP_MASK
+from sbca_wrapper._registry import FutureRegistry
+
+
+class FutureRegistryTest(unittest.TestCase):
+
+    def test_add_get_pop(self):
+        registry = FutureRegistry(4)
+        handle = registry.add('entry')
+        self.assertEqual(registry.get(handle), 'entry')
+        self.assertEqual(registry.in_flight, 1)
+        self.assertEqual(registry.pop(handle), 'entry')
+        self.assertEqual(registry.in_flight, 0)
+
+        with self.assertRaises(KeyError):
+            registry.get(handle)
+        with self.assertRaises(KeyError):
+            registry.pop(handle)
+
+    def test_handles_are_recycled(self):
+        registry = FutureRegistry(4)
+        handles = [registry.add(index) for index in range(4)]
+        self.assertEqual(sorted(handles), [0, 1, 2, 3])
+
+        registry.pop(handles[2])
+        self.assertEqual(registry.add('next'), handles[2])
+        self.assertEqual(registry.capacity, 4)
+
+    def test_registry_grows_when_full(self):
+        registry = FutureRegistry(2)
+        handles = [registry.add(index) for index in range(5)]
+        self.assertEqual(len(set(handles)), 5)
+        self.assertEqual(registry.capacity, 8)
+        self.assertEqual([registry.get(handle) for handle in handles],
+                         list(range(5)))
+
+    def test_replace(self):
+        registry = FutureRegistry()
+        handle = registry.add('entry')
+        self.assertFalse(registry.replace(handle, 'other', 'new'))
+        self.assertTrue(registry.replace(handle, 'entry', 'new'))
+        self.assertEqual(registry.pop(handle), 'new')
+        self.assertFalse(registry.replace(handle, 'new', 'newer'))
+
+    def test_concurrent_access(self):
+        registry = FutureRegistry(1)
+        seen = []
+
+        def use():
+            handles = [registry.add(object()) for _ in range(1000)]
+            seen.append(len(set(handles)))
+            for handle in handles:
+                registry.pop(handle)
+
+        threads = [threading.Thread(target=use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(seen, [1000] * 8)
+        self.assertEqual(registry.in_flight, 0)
+        self.assertEqual(registry.entries(), [])
+
+
+class CommandHandleTest(unittest.TestCase):
+
+    def test_slot_and_loop_index_are_packed(self):
+        for slot in (0, 1, 12345, (1 << 20) - 1):
+            for loop_index in (0, 1, _LOOP_MASK):
+                command_handle = slot << _LOOP_BITS | loop_index
+                self.assertEqual(command_handle >> _LOOP_BITS, slot)
+                self.assertEqual(command_handle & _LOOP_MASK, loop_index)
+
+                # Libindy passes the handle as a signed 32-bit integer
+                self.assertLess(command_handle, 1 << 31)
+
+
+if __name__ == '__main__':
+    unittest.main()
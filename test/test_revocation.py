@@ -0,0 +1,151 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+import fake_libindy
+from sbca_wrapper import RevocationStateCache
+
+REVOC_REG_DEF = {'id': 'revoc_reg', 'value': {}}
+
+
+class _Ledger:
+    """Answers revocation registry delta requests for a registry that
+    changes at the given timestamps."""
+
+    def __init__(self, *changes: int):
+        self.changes = changes
+        self.requests = []
+
+    async def fetch_delta(self, from_timestamp, to_timestamp):
+        self.requests.append((from_timestamp, to_timestamp))
+        timestamp = max(change for change in self.changes
+                        if change <= to_timestamp)
+        return {'from': from_timestamp, 'to': timestamp}, timestamp
+
+
+class RevocationStateCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        fake_libindy.install()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'states.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_states_are_created_once_and_moved_forward(self):
+        cache = RevocationStateCache()
+        ledger = _Ledger(100, 200)
+
+        async def run():
+            state = await cache.get_state(1, REVOC_REG_DEF, '7', 150,
+                                          ledger.fetch_delta)
+            self.assertEqual(state['timestamp'], 100)
+            self.assertEqual(cache.get('revoc_reg', '7'), (100, state))
+
+            # The registry did not change between 100 and 150
+            self.assertEqual(await cache.get_state(
+                1, REVOC_REG_DEF, '7', 150, ledger.fetch_delta
+            ), state)
+
+            # Only the delta since the cached state is fetched
+            state = await cache.get_state(1, json.dumps(REVOC_REG_DEF), '7',
+                                          250, ledger.fetch_delta)
+            self.assertEqual(state['updated_from'], 100)
+            self.assertEqual(state['delta'], {'from': 100, 'to': 200})
+
+            # A state for the cached timestamp needs no delta at all
+            requests = len(ledger.requests)
+            await cache.get_state(1, REVOC_REG_DEF, '7', 200,
+                                  ledger.fetch_delta)
+            self.assertEqual(len(ledger.requests), requests)
+
+        asyncio.run(run())
+        self.assertEqual((cache.created, cache.updated, cache.hits),
+                         (1, 1, 2))
+
+    def test_older_states_are_not_cached(self):
+        cache = RevocationStateCache()
+        ledger = _Ledger(100, 200)
+
+        async def run():
+            await cache.get_state(1, REVOC_REG_DEF, '7', 250,
+                                  ledger.fetch_delta)
+            state = await cache.get_state(1, REVOC_REG_DEF, '7', 150,
+                                          ledger.fetch_delta)
+            self.assertEqual(state['timestamp'], 100)
+            self.assertEqual(cache.get('revoc_reg', '7')[0], 200)
+
+        asyncio.run(run())
+        self.assertEqual(cache.created, 2)
+
+    def test_invalidate(self):
+        cache = RevocationStateCache()
+        ledger = _Ledger(100)
+
+        async def run():
+            for cred_revoc_id in ('1', '2', '3'):
+                await cache.get_state(1, REVOC_REG_DEF, cred_revoc_id, 100,
+                                      ledger.fetch_delta)
+
+        asyncio.run(run())
+        cache.invalidate('revoc_reg', '1')
+        self.assertIsNone(cache.get('revoc_reg', '1'))
+        self.assertEqual(len(cache), 2)
+        cache.invalidate('revoc_reg')
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_calls_share_a_state(self):
+        cache = RevocationStateCache()
+        ledger = _Ledger(100)
+
+        async def run():
+            states = await asyncio.gather(*(
+                cache.get_state(1, REVOC_REG_DEF, '7', 100,
+                                ledger.fetch_delta)
+                for _ in range(10)
+            ))
+            self.assertEqual(len({json.dumps(state) for state in states}), 1)
+
+        asyncio.run(run())
+        self.assertEqual((cache.created, cache.hits), (1, 9))
+
+        # The locks of the credentials are gone once nobody waits for them
+        self.assertEqual(cache._locks, {})
+
+    def test_states_are_persisted_in_batches(self):
+        cache = RevocationStateCache(self.path)
+        ledger = _Ledger(100)
+        saves = []
+
+        def save():
+            saves.append(len(cache))
+            RevocationStateCache.save(cache)
+
+        cache.save = save
+
+        async def run():
+            await asyncio.gather(*(
+                cache.get_state(1, REVOC_REG_DEF, str(cred_revoc_id), 100,
+                                ledger.fetch_delta)
+                for cred_revoc_id in range(50)
+            ))
+
+        asyncio.run(run())
+        self.assertLess(len(saves), 50)
+        self.assertEqual(saves[-1], 50)
+
+        loaded_cache = RevocationStateCache(self.path)
+        self.assertEqual(len(loaded_cache), 50)
+        self.assertEqual(loaded_cache.get('revoc_reg', '7'),
+                         cache.get('revoc_reg', '7'))
+
+    def test_save_without_file(self):
+        with self.assertRaises(ValueError):
+            RevocationStateCache().save()
+
+
+if __name__ == '__main__':
+    unittest.main()